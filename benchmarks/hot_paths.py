@@ -0,0 +1,211 @@
+"Benchmarks of the hot paths of pymoq. Every benchmark prepares its state and returns the operation to time."
+from typing import Callable, Protocol
+
+from pymoq.all import Mock, AnyInt
+from pymoq.mocking.functions import FunctionMock
+from pymoq.mocking.templates import freeze
+from pymoq.signature_validators import signature_validator_from_arguments
+
+BENCHMARKS: dict[str, Callable[[], Callable[[], object]]] = {}
+
+def benchmark(func: Callable[[], Callable[[], object]]) -> Callable[[], Callable[[], object]]:
+    "Registers a benchmark under the name of the function"
+    BENCHMARKS[func.__name__] = func
+    return func
+
+class IWeb(Protocol):
+    def get(self, url: str, page: int, cache: bool=True) -> str: ...
+    def post(self, url: str, body: str) -> None: ...
+
+def large_protocol(n_methods: int=100) -> type:
+    "Builds a protocol with `n_methods` methods of three arguments each"
+    namespace = {}
+    methods = '\n'.join(f"    def method_{i}(self, a: int, b: str, c: float=1.0) -> int: ..." for i in range(n_methods))
+    exec(f"from typing import Protocol\nclass ILarge(Protocol):\n{methods}", namespace)
+    return namespace['ILarge']
+
+ILarge = large_protocol()
+LARGE_NAMES = [f'method_{i}' for i in range(100)]
+
+def get(url: str, page: int, cache: bool=True) -> str: ...
+
+# Mock construction
+
+@benchmark
+def mock_construction_small():
+    def op():
+        mock = Mock(IWeb)
+        mock.get, mock.post
+    return op
+
+@benchmark
+def mock_construction_large():
+    def op():
+        mock = Mock(ILarge)
+        for name in LARGE_NAMES:
+            getattr(mock, name)
+    return op
+
+@benchmark
+def mock_method_access():
+    mock = Mock(IWeb)
+    mock.get
+    def op():
+        for _ in range(100):
+            mock.get
+    return op
+
+# Setups
+
+@benchmark
+def signature_validator_from_arguments_types():
+    names = ('url', 'page', 'cache')
+    return lambda: signature_validator_from_arguments(names, str, int, bool)
+
+@benchmark
+def signature_validator_from_arguments_constants():
+    names = ('url', 'page', 'cache')
+    return lambda: signature_validator_from_arguments(names, 'https://example.com', 1, True)
+
+@benchmark
+def function_mock_setup():
+    mock = FunctionMock(get)
+    def op():
+        if len(mock._setups) > 10_000:
+            mock.__init__(get)
+        mock.setup(str, int, bool).returns('response')
+    return op
+
+@benchmark
+def template_spawn_1000_setups():
+    mock = Mock(IWeb)
+    for i in range(1000):
+        mock.get.setup(f'https://example.com/{i}', i, True).returns(i)
+    template = freeze(mock)
+    def op():
+        spawned = template.spawn()
+        spawned.get('https://example.com/1', 1)
+    return op
+
+@benchmark
+def setup_many_10k_rows():
+    table = {'url': [f'https://example.com/{i}' for i in range(10_000)], 'page': list(range(10_000)), 'response': list(range(10_000))}
+    def op():
+        mock = FunctionMock(get)
+        mock.setup_many(table, returns='response')
+        mock('https://example.com/1', 1)
+    return op
+
+# Calls
+
+def mock_with_setups(n_setups: int, constant: bool) -> FunctionMock:
+    "A mock with `n_setups` setups that compare against constants or check predicates. Only the first setup matches the benchmarked call."
+    mock = FunctionMock(get)
+    mock.setup('https://example.com', 1, True).returns('first')
+    for i in range(1, n_setups):
+        if constant:
+            mock.setup(f'https://example.com/{i}', i, True).returns(i)
+        else:
+            mock.setup(lambda url, i=i: url == f'https://example.com/{i}', int, bool).returns(i)
+    return mock
+
+def call_benchmark(n_setups: int, constant: bool):
+    def prepare():
+        mock = mock_with_setups(n_setups, constant)
+        return lambda: mock('https://example.com', 1)
+    prepare.__name__ = f"call_{n_setups}_{'constant' if constant else 'predicate'}_setups"
+    return benchmark(prepare)
+
+for n_setups in (1, 100, 10_000):
+    for constant in (True, False):
+        call_benchmark(n_setups, constant)
+
+CALL_STYLES = {
+    'positional': lambda mock: mock('https://example.com', 1, True),
+    'keywords': lambda mock: mock(url='https://example.com', page=1, cache=True),
+    'mixed': lambda mock: mock('https://example.com', page=1),
+}
+
+def call_style_benchmark(style: str):
+    "The same call, passed in different ways, against 100 predicate setups"
+    def prepare():
+        mock, call = mock_with_setups(100, False), CALL_STYLES[style]
+        return lambda: call(mock)
+    prepare.__name__ = f"call_100_predicate_setups_{style}"
+    return benchmark(prepare)
+
+for style in CALL_STYLES:
+    call_style_benchmark(style)
+
+# Verification
+
+@benchmark
+def verify_100k_calls():
+    mock = Mock(IWeb)
+    for i in range(100_000):
+        mock.get('https://example.com', i)
+    return lambda: mock.get.verify(str, AnyInt('page', 2).less_than(1000), bool).times(1000)
+
+@benchmark
+def verify_failure_message_100k_calls():
+    mock = Mock(IWeb)
+    for i in range(100_000):
+        mock.get('https://example.com', i)
+    def op():
+        try:
+            mock.get.verify(str, AnyInt('page', 2).less_than(1000), bool).times(1)
+        except AssertionError as e:
+            return str(e)
+    return op
+
+@benchmark
+def verify_columns_1m_calls():
+    mock = Mock(IWeb, record='columns')
+    for i in range(1_000_000):
+        mock.get('https://example.com', i)
+    return lambda: mock.get.verify(str, AnyInt('page', 2).less_than(1000), bool).times(1000)
+
+@benchmark
+def query_group_by_1m_calls():
+    mock = Mock(IWeb, record='columns')
+    for i in range(1_000_000):
+        mock.get(f'https://example.com/{i % 100}', i)
+    return lambda: mock.get.query(page=AnyInt('page', 2).less_than(500_000)).group_by('url')
+
+# AnyInt
+
+@benchmark
+def any_int_chain():
+    validator = AnyInt('page', 2).greather_than(0).greather_than_or_equal(1).less_than(100).less_than_or_equal(99)
+    values = list(range(-50, 150))
+    def op():
+        for value in values:
+            validator.is_valid(value)
+    return op
+
+# Bulk calls
+
+@benchmark
+def call_many_10k_rows_100_setups():
+    mock = FunctionMock(get)
+    for i in range(100):
+        mock.setup(f'https://example.com/{i}', int, bool).returns(i)
+    mock.setup('https://example.com/special', AnyInt('page', 1).greather_than(100), True).returns('special')
+    urls = [f'https://example.com/{i % 120}' for i in range(10_000)]
+    pages = list(range(10_000))
+    def op():
+        mock._call_log = type(mock._call_log)() # keep the history from growing
+        mock.call_many(urls, pages)
+    return op
+
+# Cached return values
+
+@benchmark
+def call_cached_returns():
+    mock = FunctionMock(get)
+    mock.setup(str, int, bool).returns(lambda url, page, cache: {'url': url, 'rows': list(range(100))}, cache=128)
+    def op():
+        mock._call_log = type(mock._call_log)()
+        for page in range(100):
+            mock('https://example.com', page % 10)
+    return op
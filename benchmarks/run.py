@@ -0,0 +1,92 @@
+"""Runs the pymoq benchmarks, writes the results as JSON and compares them against a baseline.
+
+    python benchmarks/run.py                          # run all, compare against benchmarks/baseline.json
+    python benchmarks/run.py call_ verify             # only benchmarks whose name contains one of the filters
+    python benchmarks/run.py --save-baseline          # add the results to the baseline
+    python benchmarks/run.py --check --tolerance 0.3  # exit with 1 if a benchmark got >30% slower
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+
+from hot_paths import BENCHMARKS
+
+HERE = Path(__file__).parent
+BASELINE = HERE/'baseline.json'
+
+def time_operation(op, min_time: float=0.2, repeat: int=5) -> float:
+    "Returns the best time per call of `op` in seconds. The number of calls per run is calibrated to take at least `min_time`."
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number): op()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time: break
+        number *= 2 if elapsed == 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number): op()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+def run(names: list[str], min_time: float, repeat: int) -> dict:
+    results = {}
+    for name in names:
+        seconds = time_operation(BENCHMARKS[name](), min_time, repeat)
+        results[name] = {'seconds_per_op': seconds, 'ops_per_second': 1 / seconds}
+        print(f"{name:<45} {seconds*1e6:>12.2f} µs/op", flush=True)
+    return {'python': platform.python_version(), 'machine': platform.machine(), 'results': results}
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    "Prints the relative timings against the baseline. Returns the names of benchmarks that are slower than allowed by `tolerance`."
+    regressions = []
+    print(f"\n{'benchmark':<45} {'baseline µs':>12} {'current µs':>12} {'ratio':>7}")
+    for name, result in results['results'].items():
+        if name not in baseline['results']: continue
+        before, now = baseline['results'][name]['seconds_per_op'], result['seconds_per_op']
+        ratio = now / before
+        flag = ''
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        print(f"{name:<45} {before*1e6:>12.2f} {now*1e6:>12.2f} {ratio:>7.2f}{flag}")
+    return regressions
+
+def main(argv: list[str]|None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('filters', nargs='*', help='only run benchmarks whose name contains one of these')
+    parser.add_argument('--output', type=Path, default=HERE/'results.json', help='where to write the results')
+    parser.add_argument('--baseline', type=Path, default=BASELINE, help='results to compare against')
+    parser.add_argument('--save-baseline', action='store_true', help='add the results to the baseline file, replacing earlier results of the same benchmarks')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed slowdown relative to the baseline')
+    parser.add_argument('--check', action='store_true', help='exit with 1 on regressions')
+    parser.add_argument('--min-time', type=float, default=0.2, help='minimum duration of a timed run in seconds')
+    parser.add_argument('--repeat', type=int, default=5, help='number of timed runs, the best one counts')
+    args = parser.parse_args(argv)
+
+    names = [name for name in BENCHMARKS if not args.filters or any(f in name for f in args.filters)]
+    results = run(names, args.min_time, args.repeat)
+
+    args.output.write_text(json.dumps(results, indent=2))
+    if args.save_baseline:
+        if args.baseline.exists(): # keeps the baseline of benchmarks that didn't run
+            results = {**results, 'results': {**json.loads(args.baseline.read_text())['results'], **results['results']}}
+        args.baseline.write_text(json.dumps(results, indent=2))
+        print(f"\nSaved baseline to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"\nNo baseline at {args.baseline}, run with --save-baseline to create one")
+        return 0
+    regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+    return 1 if args.check and regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""Measures the import time of pymoq with `python -X importtime` and checks it against a budget.
+
+Imports run with bytecode caching, after a first import that fills the cache, as in real test runs. The
+default budget is `BASELINE_MS` plus 20% for noise. `BASELINE_MS` is the import time of pymoq before it
+dropped fastcore: best of 10 with bytecode caching on the reference machine.
+
+    python benchmarks/startup.py                  # best of 10 imports, exit with 1 if it is over the budget
+    python benchmarks/startup.py --budget-ms 50   # with a tighter budget
+    python benchmarks/startup.py --top 15         # also show the 15 slowest modules of the best run
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+MODULE = 'pymoq.all'
+# modules that must not be imported by `import pymoq.all`: notebook tooling and optional dependencies
+FORBIDDEN = ('fastcore', 'nbdev', 'IPython', 'numpy', 'pandas')
+# standard library modules that only recording, replaying, sharing calls or CSV tables need
+LAZY = ('array', 'bisect', 'csv', 'hashlib', 'mmap', 'multiprocessing', 'pickle', 'shutil', 'struct', 'tempfile')
+BASELINE_MS = 40 # see above, measure it again when running on another machine
+
+def import_times(module: str) -> tuple[dict[str, int], list[str]]:
+    "Imports `module` in a fresh interpreter. Returns the cumulative import time in µs per imported module and the names of all loaded modules."
+    code = f"import sys, {module}; print('\\n'.join(sys.modules))"
+    env = {name: value for name, value in os.environ.items() if name != 'PYTHONDONTWRITEBYTECODE'}
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True, check=True, env=env)
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line: continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times, process.stdout.split()
+
+def main(argv: list[str]|None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--budget-ms', type=float, default=BASELINE_MS * 1.2, help=f'allowed cumulative import time of {MODULE}')
+    parser.add_argument('--repeat', type=int, default=10, help='number of imports, the fastest one counts')
+    parser.add_argument('--top', type=int, default=0, help='number of slowest modules to show')
+    args = parser.parse_args(argv)
+
+    import_times(MODULE) # fills the bytecode cache
+    runs = [import_times(MODULE) for _ in range(args.repeat)]
+    times, modules = min(runs, key=lambda run: run[0][MODULE])
+    best = times[MODULE] / 1000
+
+    for name, cumulative in sorted(times.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"{name:<45} {cumulative/1000:>9.2f} ms")
+    print(f"import {MODULE:<38} {best:>9.2f} ms (budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+    forbidden = sorted(name for name in modules if name.split('.')[0] in FORBIDDEN + LAZY)
+    if forbidden:
+        print(f"\nimported forbidden modules: {', '.join(forbidden)}")
+        failed = True
+    if best > args.budget_ms:
+        print(f"\nimport of {MODULE} is over the budget")
+        failed = True
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,40 @@
+"Stress benchmark: call throughput of a mock shared between threads, with and without `concurrent=True`"
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Protocol
+
+from pymoq.all import Mock
+
+CALLS = 200_000
+
+class IWeb(Protocol):
+    def get(self, url: str, timeout: int) -> str: ...
+
+def make_mock(concurrent: bool) -> Mock:
+    mock = Mock(IWeb, concurrent=concurrent)
+    mock.get.setup(str, int).returns('generic')
+    mock.get.setup('https://example.com', 5).returns('example')
+    return mock
+
+def run(threads: int, concurrent: bool) -> float:
+    "Returns the calls per second of `threads` workers sharing one mock"
+    mock = make_mock(concurrent)
+    per_thread = CALLS // threads
+
+    def work(thread: int):
+        get = mock.get
+        for i in range(per_thread):
+            get('https://example.com', i % 10)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        list(executor.map(work, range(threads)))
+    elapsed = time.perf_counter() - start
+
+    mock.get.verify(str, int).times(per_thread * threads)
+    return per_thread * threads / elapsed
+
+if __name__ == '__main__':
+    print(f"{'threads':>7} {'default calls/s':>16} {'concurrent calls/s':>19}")
+    for threads in (1, 2, 4, 8):
+        print(f"{threads:>7} {run(threads, False):>16,.0f} {run(threads, True):>19,.0f}")
@@ -6,28 +6,48 @@ d = { 'settings': { 'branch': 'main',
                 'git_url': 'https://github.com/omlnaut/pymoq',
                 'lib_path': 'pymoq'},
   'syms': { 'pymoq.all': {},
-            'pymoq.argument_validators': { 'pymoq.argument_validators.AnyInt': ( 'implementation/validators.html#anyint',
+            'pymoq.argument_validators': { 'pymoq.argument_validators.AnyArg': ( 'implementation/validators.html#anyarg',
                                                                                  'pymoq/argument_validators.py'),
-                                           'pymoq.argument_validators.AnyInt.__init__': ( 'implementation/validators.html#anyint.__init__',
+                                           'pymoq.argument_validators.AnyFloat': ( 'implementation/validators.html#anyfloat',
+                                                                                   'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.AnyFloat.accepts_type': ( 'implementation/validators.html#anyfloat.accepts_type',
+                                                                                                'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.AnyFloat.is_valid': ( 'implementation/validators.html#anyfloat.is_valid',
+                                                                                            'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.AnyInt': ( 'implementation/validators.html#anyint',
+                                                                                 'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.AnyInt._bound': ( 'implementation/validators.html#anyint._bound',
+                                                                                        'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.AnyStr': ( 'implementation/validators.html#anystr',
+                                                                                 'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.AnyStr.__getstate__': ( 'implementation/validators.html#anystr.__getstate__',
+                                                                                              'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.AnyStr.__init__': ( 'implementation/validators.html#anystr.__init__',
                                                                                           'pymoq/argument_validators.py'),
-                                           'pymoq.argument_validators.AnyInt.__repr__': ( 'implementation/validators.html#anyint.__repr__',
+                                           'pymoq.argument_validators.AnyStr.__repr__': ( 'implementation/validators.html#anystr.__repr__',
                                                                                           'pymoq/argument_validators.py'),
-                                           'pymoq.argument_validators.AnyInt.__str__': ( 'implementation/validators.html#anyint.__str__',
+                                           'pymoq.argument_validators.AnyStr.__setstate__': ( 'implementation/validators.html#anystr.__setstate__',
+                                                                                              'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.AnyStr.__str__': ( 'implementation/validators.html#anystr.__str__',
                                                                                          'pymoq/argument_validators.py'),
-                                           'pymoq.argument_validators.AnyInt.greather_than': ( 'implementation/validators.html#anyint.greather_than',
-                                                                                               'pymoq/argument_validators.py'),
-                                           'pymoq.argument_validators.AnyInt.greather_than_or_equal': ( 'implementation/validators.html#anyint.greather_than_or_equal',
-                                                                                                        'pymoq/argument_validators.py'),
-                                           'pymoq.argument_validators.AnyInt.is_valid': ( 'implementation/validators.html#anyint.is_valid',
-                                                                                          'pymoq/argument_validators.py'),
-                                           'pymoq.argument_validators.AnyInt.less_than': ( 'implementation/validators.html#anyint.less_than',
+                                           'pymoq.argument_validators.AnyStr._restrict': ( 'implementation/validators.html#anystr._restrict',
                                                                                            'pymoq/argument_validators.py'),
-                                           'pymoq.argument_validators.AnyInt.less_than_or_equal': ( 'implementation/validators.html#anyint.less_than_or_equal',
-                                                                                                    'pymoq/argument_validators.py'),
-                                           'pymoq.argument_validators.AnyInt.name': ( 'implementation/validators.html#anyint.name',
+                                           'pymoq.argument_validators.AnyStr.is_valid': ( 'implementation/validators.html#anystr.is_valid',
+                                                                                          'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.AnyStr.length': ( 'implementation/validators.html#anystr.length',
+                                                                                        'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.AnyStr.max_length': ( 'implementation/validators.html#anystr.max_length',
+                                                                                            'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.AnyStr.min_length': ( 'implementation/validators.html#anystr.min_length',
+                                                                                            'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.AnyStr.name': ( 'implementation/validators.html#anystr.name',
                                                                                       'pymoq/argument_validators.py'),
-                                           'pymoq.argument_validators.AnyInt.position': ( 'implementation/validators.html#anyint.position',
+                                           'pymoq.argument_validators.AnyStr.position': ( 'implementation/validators.html#anystr.position',
                                                                                           'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.AnyStr.prefix': ( 'implementation/validators.html#anystr.prefix',
+                                                                                        'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.AnyStr.starts_with': ( 'implementation/validators.html#anystr.starts_with',
+                                                                                             'pymoq/argument_validators.py'),
                                            'pymoq.argument_validators.ArgumentFunctionValidator': ( 'implementation/validators.html#argumentfunctionvalidator',
                                                                                                     'pymoq/argument_validators.py'),
                                            'pymoq.argument_validators.ArgumentFunctionValidator.__init__': ( 'implementation/validators.html#argumentfunctionvalidator.__init__',
@@ -42,6 +62,14 @@ d = { 'settings': { 'branch': 'main',
                                                                                                          'pymoq/argument_validators.py'),
                                            'pymoq.argument_validators.ArgumentFunctionValidator.position': ( 'implementation/validators.html#argumentfunctionvalidator.position',
                                                                                                              'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.ArgumentTypeValidator': ( 'implementation/validators.html#argumenttypevalidator',
+                                                                                                'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.ArgumentTypeValidator.__init__': ( 'implementation/validators.html#argumenttypevalidator.__init__',
+                                                                                                         'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.ArgumentTypeValidator.__reduce__': ( 'implementation/validators.html#argumenttypevalidator.__reduce__',
+                                                                                                           'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.ArgumentTypeValidator.type': ( 'implementation/validators.html#argumenttypevalidator.type',
+                                                                                                     'pymoq/argument_validators.py'),
                                            'pymoq.argument_validators.ArgumentValidator': ( 'implementation/validators.html#argumentvalidator',
                                                                                             'pymoq/argument_validators.py'),
                                            'pymoq.argument_validators.ArgumentValidator.is_valid': ( 'implementation/validators.html#argumentvalidator.is_valid',
@@ -50,30 +78,187 @@ d = { 'settings': { 'branch': 'main',
                                                                                                  'pymoq/argument_validators.py'),
                                            'pymoq.argument_validators.ArgumentValidator.position': ( 'implementation/validators.html#argumentvalidator.position',
                                                                                                      'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.ArgumentValueValidator': ( 'implementation/validators.html#argumentvaluevalidator',
+                                                                                                 'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.ArgumentValueValidator.__init__': ( 'implementation/validators.html#argumentvaluevalidator.__init__',
+                                                                                                          'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.ArgumentValueValidator.__reduce__': ( 'implementation/validators.html#argumentvaluevalidator.__reduce__',
+                                                                                                            'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.ArgumentValueValidator.value': ( 'implementation/validators.html#argumentvaluevalidator.value',
+                                                                                                       'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.Interval': ( 'implementation/validators.html#interval',
+                                                                                   'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.Interval.__contains__': ( 'implementation/validators.html#interval.__contains__',
+                                                                                                'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.Interval.__str__': ( 'implementation/validators.html#interval.__str__',
+                                                                                           'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.Interval.compile': ( 'implementation/validators.html#interval.compile',
+                                                                                           'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.Interval.empty': ( 'implementation/validators.html#interval.empty',
+                                                                                         'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.Interval.with_lower': ( 'implementation/validators.html#interval.with_lower',
+                                                                                              'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.Interval.with_upper': ( 'implementation/validators.html#interval.with_upper',
+                                                                                              'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.RangeValidator': ( 'implementation/validators.html#rangevalidator',
+                                                                                         'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.RangeValidator.__getstate__': ( 'implementation/validators.html#rangevalidator.__getstate__',
+                                                                                                      'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.RangeValidator.__init__': ( 'implementation/validators.html#rangevalidator.__init__',
+                                                                                                  'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.RangeValidator.__repr__': ( 'implementation/validators.html#rangevalidator.__repr__',
+                                                                                                  'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.RangeValidator.__setstate__': ( 'implementation/validators.html#rangevalidator.__setstate__',
+                                                                                                      'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.RangeValidator.__str__': ( 'implementation/validators.html#rangevalidator.__str__',
+                                                                                                 'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.RangeValidator._bound': ( 'implementation/validators.html#rangevalidator._bound',
+                                                                                                'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.RangeValidator._restrict': ( 'implementation/validators.html#rangevalidator._restrict',
+                                                                                                   'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.RangeValidator.accepts_type': ( 'implementation/validators.html#rangevalidator.accepts_type',
+                                                                                                      'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.RangeValidator.greather_than': ( 'implementation/validators.html#rangevalidator.greather_than',
+                                                                                                       'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.RangeValidator.greather_than_or_equal': ( 'implementation/validators.html#rangevalidator.greather_than_or_equal',
+                                                                                                                'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.RangeValidator.interval': ( 'implementation/validators.html#rangevalidator.interval',
+                                                                                                  'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.RangeValidator.is_valid': ( 'implementation/validators.html#rangevalidator.is_valid',
+                                                                                                  'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.RangeValidator.less_than': ( 'implementation/validators.html#rangevalidator.less_than',
+                                                                                                   'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.RangeValidator.less_than_or_equal': ( 'implementation/validators.html#rangevalidator.less_than_or_equal',
+                                                                                                            'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.RangeValidator.name': ( 'implementation/validators.html#rangevalidator.name',
+                                                                                              'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators.RangeValidator.position': ( 'implementation/validators.html#rangevalidator.position',
+                                                                                                  'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators._any_value': ( 'implementation/validators.html#_any_value',
+                                                                                     'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators._intern_key': ( 'implementation/validators.html#_intern_key',
+                                                                                      'pymoq/argument_validators.py'),
+                                           'pymoq.argument_validators._validator_from_argument': ( 'implementation/validators.html#_validator_from_argument',
+                                                                                                   'pymoq/argument_validators.py'),
                                            'pymoq.argument_validators.argument_validator_from_argument': ( 'implementation/validators.html#argument_validator_from_argument',
                                                                                                            'pymoq/argument_validators.py')},
             'pymoq.core': { 'pymoq.core.AnyCallable': ('implementation/core.html#anycallable', 'pymoq/core.py'),
-                            'pymoq.core.AnyCallable.__call__': ('implementation/core.html#anycallable.__call__', 'pymoq/core.py')},
-            'pymoq.mocking.functions': { 'pymoq.mocking.functions.FunctionMock': ( 'implementation/mocking.functions.html#functionmock',
+                            'pymoq.core.AnyCallable.__call__': ('implementation/core.html#anycallable.__call__', 'pymoq/core.py'),
+                            'pymoq.core.patch_to': ('implementation/core.html#patch_to', 'pymoq/core.py')},
+            'pymoq.mocking.bulk': { 'pymoq.mocking.bulk.ColumnarCall': ( 'implementation/bulk_calls.html#columnarcall',
+                                                                         'pymoq/mocking/bulk.py'),
+                                    'pymoq.mocking.bulk.ColumnarCall.__init__': ( 'implementation/bulk_calls.html#columnarcall.__init__',
+                                                                                  'pymoq/mocking/bulk.py'),
+                                    'pymoq.mocking.bulk.ColumnarCall.__len__': ( 'implementation/bulk_calls.html#columnarcall.__len__',
+                                                                                 'pymoq/mocking/bulk.py'),
+                                    'pymoq.mocking.bulk.ColumnarCall.array': ( 'implementation/bulk_calls.html#columnarcall.array',
+                                                                               'pymoq/mocking/bulk.py'),
+                                    'pymoq.mocking.bulk.ColumnarCall.call': ( 'implementation/bulk_calls.html#columnarcall.call',
+                                                                              'pymoq/mocking/bulk.py'),
+                                    'pymoq.mocking.bulk.ColumnarCall.kwargs': ( 'implementation/bulk_calls.html#columnarcall.kwargs',
+                                                                                'pymoq/mocking/bulk.py'),
+                                    'pymoq.mocking.bulk.ColumnarCall.matching_rows': ( 'implementation/bulk_calls.html#columnarcall.matching_rows',
+                                                                                       'pymoq/mocking/bulk.py'),
+                                    'pymoq.mocking.bulk.as_array': ('implementation/bulk_calls.html#as_array', 'pymoq/mocking/bulk.py'),
+                                    'pymoq.mocking.bulk.interval_mask': ( 'implementation/bulk_calls.html#interval_mask',
+                                                                          'pymoq/mocking/bulk.py'),
+                                    'pymoq.mocking.bulk.is_any_value': ( 'implementation/bulk_calls.html#is_any_value',
+                                                                         'pymoq/mocking/bulk.py'),
+                                    'pymoq.mocking.bulk.matching_rows': ( 'implementation/bulk_calls.html#matching_rows',
+                                                                          'pymoq/mocking/bulk.py'),
+                                    'pymoq.mocking.bulk.numpy_or_none': ( 'implementation/bulk_calls.html#numpy_or_none',
+                                                                          'pymoq/mocking/bulk.py'),
+                                    'pymoq.mocking.bulk.to_list': ('implementation/bulk_calls.html#to_list', 'pymoq/mocking/bulk.py'),
+                                    'pymoq.mocking.bulk.vectorized_mask': ( 'implementation/bulk_calls.html#vectorized_mask',
+                                                                            'pymoq/mocking/bulk.py')},
+            'pymoq.mocking.functions': { 'pymoq.mocking.functions.CallShape': ( 'implementation/mocking.functions.html#callshape',
+                                                                                'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionMock': ( 'implementation/mocking.functions.html#functionmock',
                                                                                    'pymoq/mocking/functions.py'),
                                          'pymoq.mocking.functions.FunctionMock.__call__': ( 'implementation/mocking.functions.html#functionmock.__call__',
                                                                                             'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionMock.__getstate__': ( 'implementation/mocking.functions.html#functionmock.__getstate__',
+                                                                                                'pymoq/mocking/functions.py'),
                                          'pymoq.mocking.functions.FunctionMock.__init__': ( 'implementation/mocking.functions.html#functionmock.__init__',
                                                                                             'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionMock.__setstate__': ( 'implementation/mocking.functions.html#functionmock.__setstate__',
+                                                                                                'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionMock._add_setup': ( 'implementation/mocking.functions.html#functionmock._add_setup',
+                                                                                              'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionMock._bind': ( 'implementation/mocking.functions.html#functionmock._bind',
+                                                                                         'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionMock._call_shape': ( 'implementation/mocking.functions.html#functionmock._call_shape',
+                                                                                               'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionMock._calls': ( 'implementation/mocking.functions.html#functionmock._calls',
+                                                                                          'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionMock._canonical_call': ( 'implementation/mocking.functions.html#functionmock._canonical_call',
+                                                                                                   'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionMock._defaults_for_shape': ( 'implementation/mocking.functions.html#functionmock._defaults_for_shape',
+                                                                                                       'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionMock._dispatch': ( 'implementation/mocking.functions.html#functionmock._dispatch',
+                                                                                             'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionMock._find_setup': ( 'implementation/mocking.functions.html#functionmock._find_setup',
+                                                                                               'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionMock._find_setup_by_arguments': ( 'implementation/mocking.functions.html#functionmock._find_setup_by_arguments',
+                                                                                                            'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionMock._find_setups': ( 'implementation/bulk_calls.html#functionmock._find_setups',
+                                                                                                'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionMock._index_key': ( 'implementation/mocking.functions.html#functionmock._index_key',
+                                                                                              'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionMock._instrumented_call': ( 'implementation/instrumentation.html#functionmock._instrumented_call',
+                                                                                                      'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionMock._query_validators': ( 'implementation/call_queries.html#functionmock._query_validators',
+                                                                                                     'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionMock._respond': ( 'implementation/mocking.functions.html#functionmock._respond',
+                                                                                            'pymoq/mocking/functions.py'),
                                          'pymoq.mocking.functions.FunctionMock.arguments_valid': ( 'implementation/mocking.functions.html#functionmock.arguments_valid',
                                                                                                    'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionMock.call_many': ( 'implementation/bulk_calls.html#functionmock.call_many',
+                                                                                             'pymoq/mocking/functions.py'),
                                          'pymoq.mocking.functions.FunctionMock.fill_up_arg_list': ( 'implementation/mocking.functions.html#functionmock.fill_up_arg_list',
                                                                                                     'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionMock.query': ( 'implementation/call_queries.html#functionmock.query',
+                                                                                         'pymoq/mocking/functions.py'),
                                          'pymoq.mocking.functions.FunctionMock.setup': ( 'implementation/mocking.functions.html#functionmock.setup',
                                                                                          'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionMock.setup_many': ( 'implementation/table_setups.html#functionmock.setup_many',
+                                                                                              'pymoq/mocking/functions.py'),
                                          'pymoq.mocking.functions.FunctionMock.verify': ( 'implementation/verfiy.html#functionmock.verify',
                                                                                           'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionMockTemplate': ( 'implementation/templates.html#functionmocktemplate',
+                                                                                           'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionMockTemplate.__init__': ( 'implementation/templates.html#functionmocktemplate.__init__',
+                                                                                                    'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionMockTemplate.__repr__': ( 'implementation/templates.html#functionmocktemplate.__repr__',
+                                                                                                    'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionMockTemplate.spawn': ( 'implementation/templates.html#functionmocktemplate.spawn',
+                                                                                                 'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionSpec': ( 'implementation/mocking.functions.html#functionspec',
+                                                                                   'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.FunctionSpec.from_function': ( 'implementation/mocking.functions.html#functionspec.from_function',
+                                                                                                 'pymoq/mocking/functions.py'),
                                          'pymoq.mocking.functions.Setup': ( 'implementation/mocking.functions.html#setup',
                                                                             'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.Setup.__copy__': ( 'implementation/mocking.functions.html#setup.__copy__',
+                                                                                     'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.Setup.__getstate__': ( 'implementation/mocking.functions.html#setup.__getstate__',
+                                                                                         'pymoq/mocking/functions.py'),
                                          'pymoq.mocking.functions.Setup.__init__': ( 'implementation/mocking.functions.html#setup.__init__',
                                                                                      'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.Setup.__setstate__': ( 'implementation/mocking.functions.html#setup.__setstate__',
+                                                                                         'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.Setup._matching_rows': ( 'implementation/bulk_calls.html#setup._matching_rows',
+                                                                                           'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.Setup.cache_info': ( 'implementation/mocking.functions.html#setup.cache_info',
+                                                                                       'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.Setup.delays': ( 'implementation/mocking.functions.html#setup.delays',
+                                                                                   'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.Setup.get_awaitable_return_value': ( 'implementation/mocking.functions.html#setup.get_awaitable_return_value',
+                                                                                                       'pymoq/mocking/functions.py'),
                                          'pymoq.mocking.functions.Setup.get_return_value': ( 'implementation/mocking.functions.html#setup.get_return_value',
                                                                                              'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.Setup.hits': ( 'implementation/mocking.functions.html#setup.hits',
+                                                                                 'pymoq/mocking/functions.py'),
                                          'pymoq.mocking.functions.Setup.is_valid': ( 'implementation/mocking.functions.html#setup.is_valid',
                                                                                      'pymoq/mocking/functions.py'),
                                          'pymoq.mocking.functions.Setup.returns': ( 'implementation/mocking.functions.html#setup.returns',
@@ -82,51 +267,538 @@ d = { 'settings': { 'branch': 'main',
                                                                                              'pymoq/mocking/functions.py'),
                                          'pymoq.mocking.functions.Setup.throws': ( 'implementation/mocking.functions.html#setup.throws',
                                                                                    'pymoq/mocking/functions.py'),
-                                         'pymoq.mocking.functions.VerifiedCalls': ( 'implementation/verfiy.html#verifiedcalls',
-                                                                                    'pymoq/mocking/functions.py'),
-                                         'pymoq.mocking.functions.VerifiedCalls._build_error_msg': ( 'implementation/verfiy.html#verifiedcalls._build_error_msg',
-                                                                                                     'pymoq/mocking/functions.py'),
-                                         'pymoq.mocking.functions.VerifiedCalls.less_than': ( 'implementation/verfiy.html#verifiedcalls.less_than',
-                                                                                              'pymoq/mocking/functions.py'),
-                                         'pymoq.mocking.functions.VerifiedCalls.less_than_or_equal_to': ( 'implementation/verfiy.html#verifiedcalls.less_than_or_equal_to',
-                                                                                                          'pymoq/mocking/functions.py'),
-                                         'pymoq.mocking.functions.VerifiedCalls.more_than': ( 'implementation/verfiy.html#verifiedcalls.more_than',
+                                         'pymoq.mocking.functions.TableSetup': ( 'implementation/table_setups.html#tablesetup',
+                                                                                 'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.TableSetup.__getstate__': ( 'implementation/table_setups.html#tablesetup.__getstate__',
                                                                                               'pymoq/mocking/functions.py'),
-                                         'pymoq.mocking.functions.VerifiedCalls.more_than_or_equal_to': ( 'implementation/verfiy.html#verifiedcalls.more_than_or_equal_to',
-                                                                                                          'pymoq/mocking/functions.py'),
-                                         'pymoq.mocking.functions.VerifiedCalls.never': ( 'implementation/verfiy.html#verifiedcalls.never',
+                                         'pymoq.mocking.functions.TableSetup.__init__': ( 'implementation/table_setups.html#tablesetup.__init__',
+                                                                                          'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.TableSetup.__len__': ( 'implementation/table_setups.html#tablesetup.__len__',
+                                                                                         'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.TableSetup.__repr__': ( 'implementation/table_setups.html#tablesetup.__repr__',
                                                                                           'pymoq/mocking/functions.py'),
-                                         'pymoq.mocking.functions.VerifiedCalls.times': ( 'implementation/verfiy.html#verifiedcalls.times',
+                                         'pymoq.mocking.functions.TableSetup.__setstate__': ( 'implementation/table_setups.html#tablesetup.__setstate__',
+                                                                                              'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.TableSetup._canonical_matcher': ( 'implementation/table_setups.html#tablesetup._canonical_matcher',
+                                                                                                    'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.TableSetup._matcher': ( 'implementation/table_setups.html#tablesetup._matcher',
                                                                                           'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.TableSetup._matching_rows': ( 'implementation/table_setups.html#tablesetup._matching_rows',
+                                                                                                'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.TableSetup._return_value_generator': ( 'implementation/table_setups.html#tablesetup._return_value_generator',
+                                                                                                         'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.VerifiedCalls': ( 'implementation/verfiy.html#verifiedcalls',
+                                                                                    'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.VerifiedCalls._counted_calls': ( 'implementation/verfiy.html#verifiedcalls._counted_calls',
+                                                                                                   'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.VerifiedCalls._counted_matches': ( 'implementation/verfiy.html#verifiedcalls._counted_matches',
+                                                                                                     'pymoq/mocking/functions.py'),
                                          'pymoq.mocking.functions.VerifiedCalls.verified': ( 'implementation/verfiy.html#verifiedcalls.verified',
                                                                                              'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.Verifier': ( 'implementation/verfiy.html#verifier',
+                                                                               'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.Verifier.__init__': ( 'implementation/verfiy.html#verifier.__init__',
+                                                                                        'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.Verifier.__repr__': ( 'implementation/verfiy.html#verifier.__repr__',
+                                                                                        'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.Verifier._counted_calls': ( 'implementation/verfiy.html#verifier._counted_calls',
+                                                                                              'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.Verifier._counted_matches': ( 'implementation/verfiy.html#verifier._counted_matches',
+                                                                                                'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.Verifier._log': ( 'implementation/verfiy.html#verifier._log',
+                                                                                    'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.Verifier._matches': ( 'implementation/verfiy.html#verifier._matches',
+                                                                                        'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.Verifier._update': ( 'implementation/verfiy.html#verifier._update',
+                                                                                       'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.Verifier.all_calls': ( 'implementation/verfiy.html#verifier.all_calls',
+                                                                                         'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.Verifier.missing': ( 'implementation/verfiy.html#verifier.missing',
+                                                                                       'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.Verifier.pending': ( 'implementation/verfiy.html#verifier.pending',
+                                                                                       'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.Verifier.verified': ( 'implementation/verfiy.html#verifier.verified',
+                                                                                        'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.Verifier.verified_calls': ( 'implementation/verfiy.html#verifier.verified_calls',
+                                                                                              'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._CallCountAssertions': ( 'implementation/verfiy.html#_callcountassertions',
+                                                                                           'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._CallCountAssertions._assert_verified': ( 'implementation/verfiy.html#_callcountassertions._assert_verified',
+                                                                                                            'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._CallCountAssertions._build_error_msg': ( 'implementation/verfiy.html#_callcountassertions._build_error_msg',
+                                                                                                            'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._CallCountAssertions.less_than': ( 'implementation/verfiy.html#_callcountassertions.less_than',
+                                                                                                     'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._CallCountAssertions.less_than_or_equal_to': ( 'implementation/verfiy.html#_callcountassertions.less_than_or_equal_to',
+                                                                                                                 'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._CallCountAssertions.more_than': ( 'implementation/verfiy.html#_callcountassertions.more_than',
+                                                                                                     'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._CallCountAssertions.more_than_or_equal_to': ( 'implementation/verfiy.html#_callcountassertions.more_than_or_equal_to',
+                                                                                                                 'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._CallCountAssertions.never': ( 'implementation/verfiy.html#_callcountassertions.never',
+                                                                                                 'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._CallCountAssertions.times': ( 'implementation/verfiy.html#_callcountassertions.times',
+                                                                                                 'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._ConstantReturnValue': ( 'implementation/mocking.functions.html#_constantreturnvalue',
+                                                                                           'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._ConstantReturnValue.__call__': ( 'implementation/mocking.functions.html#_constantreturnvalue.__call__',
+                                                                                                    'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._ConstantReturnValue.__init__': ( 'implementation/mocking.functions.html#_constantreturnvalue.__init__',
+                                                                                                    'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._ExceptionReturnValue': ( 'implementation/mocking.functions.html#_exceptionreturnvalue',
+                                                                                            'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._ExceptionReturnValue.__call__': ( 'implementation/mocking.functions.html#_exceptionreturnvalue.__call__',
+                                                                                                     'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._ExceptionReturnValue.__init__': ( 'implementation/mocking.functions.html#_exceptionreturnvalue.__init__',
+                                                                                                     'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._Repr': ( 'implementation/verfiy.html#_repr',
+                                                                            'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._Repr.__repr__': ( 'implementation/verfiy.html#_repr.__repr__',
+                                                                                     'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._SequenceReturnValues': ( 'implementation/mocking.functions.html#_sequencereturnvalues',
+                                                                                            'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._SequenceReturnValues.__call__': ( 'implementation/mocking.functions.html#_sequencereturnvalues.__call__',
+                                                                                                     'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._SequenceReturnValues.__getstate__': ( 'implementation/mocking.functions.html#_sequencereturnvalues.__getstate__',
+                                                                                                         'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._SequenceReturnValues.__init__': ( 'implementation/mocking.functions.html#_sequencereturnvalues.__init__',
+                                                                                                     'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._SequenceReturnValues.__setstate__': ( 'implementation/mocking.functions.html#_sequencereturnvalues.__setstate__',
+                                                                                                         'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._SequenceReturnValues.fresh': ( 'implementation/mocking.functions.html#_sequencereturnvalues.fresh',
+                                                                                                  'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._cycled': ( 'implementation/mocking.functions.html#_cycled',
+                                                                              'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._format_call': ( 'implementation/verfiy.html#_format_call',
+                                                                                   'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._format_histogram': ( 'implementation/verfiy.html#_format_histogram',
+                                                                                        'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._fresh_setup': ( 'implementation/templates.html#_fresh_setup',
+                                                                                   'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._is_indexable': ( 'implementation/mocking.functions.html#_is_indexable',
+                                                                                    'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._no_return_value': ( 'implementation/mocking.functions.html#_no_return_value',
+                                                                                       'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._parse_bool': ( 'implementation/table_setups.html#_parse_bool',
+                                                                                  'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._read_csv': ( 'implementation/table_setups.html#_read_csv',
+                                                                                'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._render_calls': ( 'implementation/verfiy.html#_render_calls',
+                                                                                    'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._table_rows': ( 'implementation/table_setups.html#_table_rows',
+                                                                                  'pymoq/mocking/functions.py'),
                                          'pymoq.mocking.functions._throw': ( 'implementation/mocking.functions.html#_throw',
                                                                              'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions._value_key': ( 'implementation/verfiy.html#_value_key',
+                                                                                 'pymoq/mocking/functions.py'),
                                          'pymoq.mocking.functions.add_self_parameter': ( 'implementation/mocking.functions.html#add_self_parameter',
                                                                                          'pymoq/mocking/functions.py'),
+                                         'pymoq.mocking.functions.function_spec': ( 'implementation/mocking.functions.html#function_spec',
+                                                                                    'pymoq/mocking/functions.py'),
                                          'pymoq.mocking.functions.is_class_method': ( 'implementation/mocking.functions.html#is_class_method',
                                                                                       'pymoq/mocking/functions.py'),
                                          'pymoq.mocking.functions.remove_self_parameter': ( 'implementation/mocking.functions.html#remove_self_parameter',
                                                                                             'pymoq/mocking/functions.py')},
+            'pymoq.mocking.instrumentation': { 'pymoq.mocking.instrumentation.FunctionStats': ( 'implementation/instrumentation.html#functionstats',
+                                                                                                'pymoq/mocking/instrumentation.py'),
+                                               'pymoq.mocking.instrumentation.FunctionStats.__del__': ( 'implementation/instrumentation.html#functionstats.__del__',
+                                                                                                        'pymoq/mocking/instrumentation.py'),
+                                               'pymoq.mocking.instrumentation.FunctionStats.__getstate__': ( 'implementation/instrumentation.html#functionstats.__getstate__',
+                                                                                                             'pymoq/mocking/instrumentation.py'),
+                                               'pymoq.mocking.instrumentation.FunctionStats.__post_init__': ( 'implementation/instrumentation.html#functionstats.__post_init__',
+                                                                                                              'pymoq/mocking/instrumentation.py'),
+                                               'pymoq.mocking.instrumentation.FunctionStats.__setstate__': ( 'implementation/instrumentation.html#functionstats.__setstate__',
+                                                                                                             'pymoq/mocking/instrumentation.py'),
+                                               'pymoq.mocking.instrumentation.FunctionStats.record': ( 'implementation/instrumentation.html#functionstats.record',
+                                                                                                       'pymoq/mocking/instrumentation.py'),
+                                               'pymoq.mocking.instrumentation.FunctionStats.totals': ( 'implementation/instrumentation.html#functionstats.totals',
+                                                                                                       'pymoq/mocking/instrumentation.py'),
+                                               'pymoq.mocking.instrumentation._add_totals': ( 'implementation/instrumentation.html#_add_totals',
+                                                                                              'pymoq/mocking/instrumentation.py'),
+                                               'pymoq.mocking.instrumentation._fold_collected_stats': ( 'implementation/instrumentation.html#_fold_collected_stats',
+                                                                                                        'pymoq/mocking/instrumentation.py'),
+                                               'pymoq.mocking.instrumentation._function_mock_stats': ( 'implementation/instrumentation.html#_function_mock_stats',
+                                                                                                       'pymoq/mocking/instrumentation.py'),
+                                               'pymoq.mocking.instrumentation.instrumentation_enabled': ( 'implementation/instrumentation.html#instrumentation_enabled',
+                                                                                                          'pymoq/mocking/instrumentation.py'),
+                                               'pymoq.mocking.instrumentation.print_summary': ( 'implementation/instrumentation.html#print_summary',
+                                                                                                'pymoq/mocking/instrumentation.py'),
+                                               'pymoq.mocking.instrumentation.stats': ( 'implementation/instrumentation.html#stats',
+                                                                                        'pymoq/mocking/instrumentation.py'),
+                                               'pymoq.mocking.instrumentation.summary': ( 'implementation/instrumentation.html#summary',
+                                                                                          'pymoq/mocking/instrumentation.py')},
             'pymoq.mocking.objects': { 'pymoq.mocking.objects.Mock': ( 'implementation/mocking_objects.html#mock',
                                                                        'pymoq/mocking/objects.py'),
                                        'pymoq.mocking.objects.Mock.__getattr__': ( 'implementation/mocking_objects.html#mock.__getattr__',
                                                                                    'pymoq/mocking/objects.py'),
+                                       'pymoq.mocking.objects.Mock.__getstate__': ( 'implementation/mocking_objects.html#mock.__getstate__',
+                                                                                    'pymoq/mocking/objects.py'),
                                        'pymoq.mocking.objects.Mock.__init__': ( 'implementation/mocking_objects.html#mock.__init__',
                                                                                 'pymoq/mocking/objects.py'),
+                                       'pymoq.mocking.objects.Mock.__new__': ( 'implementation/mocking_objects.html#mock.__new__',
+                                                                               'pymoq/mocking/objects.py'),
+                                       'pymoq.mocking.objects.Mock.__reduce__': ( 'implementation/mocking_objects.html#mock.__reduce__',
+                                                                                  'pymoq/mocking/objects.py'),
                                        'pymoq.mocking.objects.Mock.__repr__': ( 'implementation/mocking_objects.html#mock.__repr__',
                                                                                 'pymoq/mocking/objects.py'),
                                        'pymoq.mocking.objects.Mock.__str__': ( 'implementation/mocking_objects.html#mock.__str__',
                                                                                'pymoq/mocking/objects.py'),
-                                       'pymoq.mocking.objects.Mock._init_function_mocks': ( 'implementation/mocking_objects.html#mock._init_function_mocks',
-                                                                                            'pymoq/mocking/objects.py'),
+                                       'pymoq.mocking.objects.MockTemplate': ( 'implementation/templates.html#mocktemplate',
+                                                                               'pymoq/mocking/objects.py'),
+                                       'pymoq.mocking.objects.MockTemplate.__init__': ( 'implementation/templates.html#mocktemplate.__init__',
+                                                                                        'pymoq/mocking/objects.py'),
+                                       'pymoq.mocking.objects.MockTemplate.__repr__': ( 'implementation/templates.html#mocktemplate.__repr__',
+                                                                                        'pymoq/mocking/objects.py'),
+                                       'pymoq.mocking.objects.MockTemplate.spawn': ( 'implementation/templates.html#mocktemplate.spawn',
+                                                                                     'pymoq/mocking/objects.py'),
+                                       'pymoq.mocking.objects._MethodMock': ( 'implementation/mocking_objects.html#_methodmock',
+                                                                              'pymoq/mocking/objects.py'),
+                                       'pymoq.mocking.objects._MethodMock.__get__': ( 'implementation/mocking_objects.html#_methodmock.__get__',
+                                                                                      'pymoq/mocking/objects.py'),
+                                       'pymoq.mocking.objects._MethodMock.__init__': ( 'implementation/mocking_objects.html#_methodmock.__init__',
+                                                                                       'pymoq/mocking/objects.py'),
+                                       'pymoq.mocking.objects._cached_public_names': ( 'implementation/mocking_objects.html#_cached_public_names',
+                                                                                       'pymoq/mocking/objects.py'),
                                        'pymoq.mocking.objects._is_public_name': ( 'implementation/mocking_objects.html#_is_public_name',
                                                                                   'pymoq/mocking/objects.py'),
+                                       'pymoq.mocking.objects._mock_class': ( 'implementation/mocking_objects.html#_mock_class',
+                                                                              'pymoq/mocking/objects.py'),
+                                       'pymoq.mocking.objects._new_mock': ( 'implementation/mocking_objects.html#_new_mock',
+                                                                            'pymoq/mocking/objects.py'),
+                                       'pymoq.mocking.objects._protocol_attributes': ( 'implementation/mocking_objects.html#_protocol_attributes',
+                                                                                       'pymoq/mocking/objects.py'),
                                        'pymoq.mocking.objects.get_public_attributes': ( 'implementation/mocking_objects.html#get_public_attributes',
                                                                                         'pymoq/mocking/objects.py'),
                                        'pymoq.mocking.objects.get_public_names': ( 'implementation/mocking_objects.html#get_public_names',
                                                                                    'pymoq/mocking/objects.py')},
-            'pymoq.return_value_generators': { 'pymoq.return_value_generators.ReturnValueGenerator': ( 'implementation/return_value_generators.html#returnvaluegenerator',
+            'pymoq.mocking.queries': { 'pymoq.mocking.queries.CallQuery': ( 'implementation/call_queries.html#callquery',
+                                                                            'pymoq/mocking/queries.py'),
+                                       'pymoq.mocking.queries.CallQuery.__init__': ( 'implementation/call_queries.html#callquery.__init__',
+                                                                                     'pymoq/mocking/queries.py'),
+                                       'pymoq.mocking.queries.CallQuery.__repr__': ( 'implementation/call_queries.html#callquery.__repr__',
+                                                                                     'pymoq/mocking/queries.py'),
+                                       'pymoq.mocking.queries.CallQuery.count': ( 'implementation/call_queries.html#callquery.count',
+                                                                                  'pymoq/mocking/queries.py'),
+                                       'pymoq.mocking.queries.CallQuery.distinct': ( 'implementation/call_queries.html#callquery.distinct',
+                                                                                     'pymoq/mocking/queries.py'),
+                                       'pymoq.mocking.queries.CallQuery.first': ( 'implementation/call_queries.html#callquery.first',
+                                                                                  'pymoq/mocking/queries.py'),
+                                       'pymoq.mocking.queries.CallQuery.group_by': ( 'implementation/call_queries.html#callquery.group_by',
+                                                                                     'pymoq/mocking/queries.py'),
+                                       'pymoq.mocking.queries.CallQuery.last': ( 'implementation/call_queries.html#callquery.last',
+                                                                                 'pymoq/mocking/queries.py'),
+                                       'pymoq.mocking.queries.CallQuery.rows': ( 'implementation/call_queries.html#callquery.rows',
+                                                                                 'pymoq/mocking/queries.py'),
+                                       'pymoq.mocking.queries.CallQuery.where': ( 'implementation/call_queries.html#callquery.where',
+                                                                                  'pymoq/mocking/queries.py'),
+                                       'pymoq.mocking.queries._concatenate': ( 'implementation/call_queries.html#_concatenate',
+                                                                               'pymoq/mocking/queries.py')},
+            'pymoq.mocking.recording': { 'pymoq.mocking.recording.CallHistoryError': ( 'implementation/call_recording.html#callhistoryerror',
+                                                                                       'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CallLog': ( 'implementation/call_recording.html#calllog',
+                                                                              'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CallLog.__init__': ( 'implementation/call_recording.html#calllog.__init__',
+                                                                                       'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CallLog.__iter__': ( 'implementation/call_recording.html#calllog.__iter__',
+                                                                                       'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CallLog._names': ( 'implementation/call_recording.html#calllog._names',
+                                                                                     'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CallLog.append': ( 'implementation/call_recording.html#calllog.append',
+                                                                                     'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CallLog.append_record': ( 'implementation/call_recording.html#calllog.append_record',
+                                                                                            'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CallLog.counted': ( 'implementation/call_recording.html#calllog.counted',
+                                                                                      'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CallLog.extend': ( 'implementation/call_recording.html#calllog.extend',
+                                                                                     'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CallLog.missing': ( 'implementation/call_recording.html#calllog.missing',
+                                                                                      'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CallLog.since': ( 'implementation/call_recording.html#calllog.since',
+                                                                                    'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CallLog.total': ( 'implementation/call_recording.html#calllog.total',
+                                                                                    'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CallRecord': ( 'implementation/call_recording.html#callrecord',
+                                                                                 'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CallRecord.__eq__': ( 'implementation/call_recording.html#callrecord.__eq__',
+                                                                                        'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CallRecord.__init__': ( 'implementation/call_recording.html#callrecord.__init__',
+                                                                                          'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CallRecord.__iter__': ( 'implementation/call_recording.html#callrecord.__iter__',
+                                                                                          'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CallRecord.__repr__': ( 'implementation/call_recording.html#callrecord.__repr__',
+                                                                                          'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CallRecord.kwargs': ( 'implementation/call_recording.html#callrecord.kwargs',
+                                                                                        'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ColumnarCallLog': ( 'implementation/call_queries.html#columnarcalllog',
+                                                                                      'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ColumnarCallLog.__init__': ( 'implementation/call_queries.html#columnarcalllog.__init__',
+                                                                                               'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ColumnarCallLog.__iter__': ( 'implementation/call_queries.html#columnarcalllog.__iter__',
+                                                                                               'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ColumnarCallLog._flush': ( 'implementation/call_queries.html#columnarcalllog._flush',
+                                                                                             'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ColumnarCallLog._records': ( 'implementation/call_queries.html#columnarcalllog._records',
+                                                                                               'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ColumnarCallLog.append': ( 'implementation/call_queries.html#columnarcalllog.append',
+                                                                                             'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ColumnarCallLog.append_record': ( 'implementation/call_queries.html#columnarcalllog.append_record',
+                                                                                                    'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ColumnarCallLog.array': ( 'implementation/call_queries.html#columnarcalllog.array',
+                                                                                            'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ColumnarCallLog.column': ( 'implementation/call_queries.html#columnarcalllog.column',
+                                                                                             'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ColumnarCallLog.counted': ( 'implementation/call_queries.html#columnarcalllog.counted',
+                                                                                              'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ColumnarCallLog.extend': ( 'implementation/call_queries.html#columnarcalllog.extend',
+                                                                                             'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ColumnarCallLog.matching_rows': ( 'implementation/call_queries.html#columnarcalllog.matching_rows',
+                                                                                                    'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ColumnarCallLog.missing': ( 'implementation/call_queries.html#columnarcalllog.missing',
+                                                                                              'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ColumnarCallLog.since': ( 'implementation/call_queries.html#columnarcalllog.since',
+                                                                                            'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ColumnarCallLog.total': ( 'implementation/call_queries.html#columnarcalllog.total',
+                                                                                            'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ConcurrentCallLog': ( 'implementation/call_recording.html#concurrentcalllog',
+                                                                                        'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ConcurrentCallLog.__getstate__': ( 'implementation/call_recording.html#concurrentcalllog.__getstate__',
+                                                                                                     'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ConcurrentCallLog.__init__': ( 'implementation/call_recording.html#concurrentcalllog.__init__',
+                                                                                                 'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ConcurrentCallLog.__iter__': ( 'implementation/call_recording.html#concurrentcalllog.__iter__',
+                                                                                                 'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ConcurrentCallLog.__setstate__': ( 'implementation/call_recording.html#concurrentcalllog.__setstate__',
+                                                                                                     'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ConcurrentCallLog._all_buffers': ( 'implementation/call_recording.html#concurrentcalllog._all_buffers',
+                                                                                                     'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ConcurrentCallLog._buffer': ( 'implementation/call_recording.html#concurrentcalllog._buffer',
+                                                                                                'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ConcurrentCallLog._read': ( 'implementation/call_recording.html#concurrentcalllog._read',
+                                                                                              'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ConcurrentCallLog.append': ( 'implementation/call_recording.html#concurrentcalllog.append',
+                                                                                               'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ConcurrentCallLog.append_record': ( 'implementation/call_recording.html#concurrentcalllog.append_record',
+                                                                                                      'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ConcurrentCallLog.counted': ( 'implementation/call_recording.html#concurrentcalllog.counted',
+                                                                                                'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ConcurrentCallLog.extend': ( 'implementation/call_recording.html#concurrentcalllog.extend',
+                                                                                               'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ConcurrentCallLog.missing': ( 'implementation/call_recording.html#concurrentcalllog.missing',
+                                                                                                'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ConcurrentCallLog.since': ( 'implementation/call_recording.html#concurrentcalllog.since',
+                                                                                              'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.ConcurrentCallLog.total': ( 'implementation/call_recording.html#concurrentcalllog.total',
+                                                                                              'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CountingCallLog': ( 'implementation/call_recording.html#countingcalllog',
+                                                                                      'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CountingCallLog.__init__': ( 'implementation/call_recording.html#countingcalllog.__init__',
+                                                                                               'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CountingCallLog.__iter__': ( 'implementation/call_recording.html#countingcalllog.__iter__',
+                                                                                               'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CountingCallLog._count': ( 'implementation/call_recording.html#countingcalllog._count',
+                                                                                             'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CountingCallLog.append_record': ( 'implementation/call_recording.html#countingcalllog.append_record',
+                                                                                                    'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CountingCallLog.counted': ( 'implementation/call_recording.html#countingcalllog.counted',
+                                                                                              'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CountingCallLog.extend': ( 'implementation/call_recording.html#countingcalllog.extend',
+                                                                                             'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CountingCallLog.missing': ( 'implementation/call_recording.html#countingcalllog.missing',
+                                                                                              'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CountingCallLog.since': ( 'implementation/call_recording.html#countingcalllog.since',
+                                                                                            'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.CountingCallLog.total': ( 'implementation/call_recording.html#countingcalllog.total',
+                                                                                            'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.NoCallLog': ( 'implementation/call_recording.html#nocalllog',
+                                                                                'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.NoCallLog.append': ( 'implementation/call_recording.html#nocalllog.append',
+                                                                                       'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.NoCallLog.append_record': ( 'implementation/call_recording.html#nocalllog.append_record',
+                                                                                              'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.NoCallLog.extend': ( 'implementation/call_recording.html#nocalllog.extend',
+                                                                                       'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.RingCallLog': ( 'implementation/call_recording.html#ringcalllog',
+                                                                                  'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.RingCallLog.__init__': ( 'implementation/call_recording.html#ringcalllog.__init__',
+                                                                                           'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.RingCallLog.append_record': ( 'implementation/call_recording.html#ringcalllog.append_record',
+                                                                                                'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.RingCallLog.extend': ( 'implementation/call_recording.html#ringcalllog.extend',
+                                                                                         'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.RingCallLog.missing': ( 'implementation/call_recording.html#ringcalllog.missing',
+                                                                                          'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.RingCallLog.since': ( 'implementation/call_recording.html#ringcalllog.since',
+                                                                                        'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.RingCallLog.total': ( 'implementation/call_recording.html#ringcalllog.total',
+                                                                                        'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SharedCallLog': ( 'implementation/call_recording.html#sharedcalllog',
+                                                                                    'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SharedCallLog.__init__': ( 'implementation/call_recording.html#sharedcalllog.__init__',
+                                                                                             'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SharedCallLog.__iter__': ( 'implementation/call_recording.html#sharedcalllog.__iter__',
+                                                                                             'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SharedCallLog.__reduce__': ( 'implementation/call_recording.html#sharedcalllog.__reduce__',
+                                                                                               'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SharedCallLog._after_fork': ( 'implementation/call_recording.html#sharedcalllog._after_fork',
+                                                                                                'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SharedCallLog.append': ( 'implementation/call_recording.html#sharedcalllog.append',
+                                                                                           'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SharedCallLog.append_record': ( 'implementation/call_recording.html#sharedcalllog.append_record',
+                                                                                                  'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SharedCallLog.collect': ( 'implementation/call_recording.html#sharedcalllog.collect',
+                                                                                            'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SharedCallLog.counted': ( 'implementation/call_recording.html#sharedcalllog.counted',
+                                                                                            'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SharedCallLog.extend': ( 'implementation/call_recording.html#sharedcalllog.extend',
+                                                                                           'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SharedCallLog.missing': ( 'implementation/call_recording.html#sharedcalllog.missing',
+                                                                                            'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SharedCallLog.pending': ( 'implementation/call_recording.html#sharedcalllog.pending',
+                                                                                            'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SharedCallLog.since': ( 'implementation/call_recording.html#sharedcalllog.since',
+                                                                                          'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SharedCallLog.total': ( 'implementation/call_recording.html#sharedcalllog.total',
+                                                                                          'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SpoolCallLog': ( 'implementation/call_recording.html#spoolcalllog',
+                                                                                   'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SpoolCallLog.__init__': ( 'implementation/call_recording.html#spoolcalllog.__init__',
+                                                                                            'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SpoolCallLog.__iter__': ( 'implementation/call_recording.html#spoolcalllog.__iter__',
+                                                                                            'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SpoolCallLog.__reduce__': ( 'implementation/call_recording.html#spoolcalllog.__reduce__',
+                                                                                              'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SpoolCallLog.append': ( 'implementation/call_recording.html#spoolcalllog.append',
+                                                                                          'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SpoolCallLog.append_record': ( 'implementation/call_recording.html#spoolcalllog.append_record',
+                                                                                                 'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SpoolCallLog.counted': ( 'implementation/call_recording.html#spoolcalllog.counted',
+                                                                                           'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SpoolCallLog.extend': ( 'implementation/call_recording.html#spoolcalllog.extend',
+                                                                                          'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SpoolCallLog.flush': ( 'implementation/call_recording.html#spoolcalllog.flush',
+                                                                                         'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SpoolCallLog.missing': ( 'implementation/call_recording.html#spoolcalllog.missing',
+                                                                                           'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SpoolCallLog.since': ( 'implementation/call_recording.html#spoolcalllog.since',
+                                                                                         'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.SpoolCallLog.total': ( 'implementation/call_recording.html#spoolcalllog.total',
+                                                                                         'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.UnpicklableArgument': ( 'implementation/call_recording.html#unpicklableargument',
+                                                                                          'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.UnpicklableArgument.__init__': ( 'implementation/call_recording.html#unpicklableargument.__init__',
+                                                                                                   'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.UnpicklableArgument.__repr__': ( 'implementation/call_recording.html#unpicklableargument.__repr__',
+                                                                                                   'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording._Spool': ( 'implementation/call_recording.html#_spool',
+                                                                             'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording._Spool.__init__': ( 'implementation/call_recording.html#_spool.__init__',
+                                                                                      'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording._Spool.mark': ( 'implementation/call_recording.html#_spool.mark',
+                                                                                  'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording._Spool.write': ( 'implementation/call_recording.html#_spool.write',
+                                                                                   'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording._picklable': ( 'implementation/call_recording.html#_picklable',
+                                                                                 'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording._process_exists': ( 'implementation/call_recording.html#_process_exists',
+                                                                                      'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording._run_and_flush': ( 'implementation/call_recording.html#_run_and_flush',
+                                                                                     'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording._write_spool': ( 'implementation/call_recording.html#_write_spool',
+                                                                                   'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.call_log': ( 'implementation/call_recording.html#call_log',
+                                                                               'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.flush_calls': ( 'implementation/call_recording.html#flush_calls',
+                                                                                  'pymoq/mocking/recording.py'),
+                                         'pymoq.mocking.recording.sends_calls': ( 'implementation/call_recording.html#sends_calls',
+                                                                                  'pymoq/mocking/recording.py')},
+            'pymoq.mocking.replay': { 'pymoq.mocking.replay.Recorder': ( 'implementation/record_replay.html#recorder',
+                                                                         'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay.Recorder.__enter__': ( 'implementation/record_replay.html#recorder.__enter__',
+                                                                                   'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay.Recorder.__exit__': ( 'implementation/record_replay.html#recorder.__exit__',
+                                                                                  'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay.Recorder.__getattr__': ( 'implementation/record_replay.html#recorder.__getattr__',
+                                                                                     'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay.Recorder.__init__': ( 'implementation/record_replay.html#recorder.__init__',
+                                                                                  'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay.Recorder._recording_method': ( 'implementation/record_replay.html#recorder._recording_method',
+                                                                                           'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay.Recorder._write': ( 'implementation/record_replay.html#recorder._write',
+                                                                                'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay.Recorder.close': ( 'implementation/record_replay.html#recorder.close',
+                                                                               'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay.Recorder.flush': ( 'implementation/record_replay.html#recorder.flush',
+                                                                               'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay.Recording': ( 'implementation/record_replay.html#recording',
+                                                                          'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay.Recording.__init__': ( 'implementation/record_replay.html#recording.__init__',
+                                                                                   'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay.Recording.__len__': ( 'implementation/record_replay.html#recording.__len__',
+                                                                                  'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay.Recording._index_path': ( 'implementation/record_replay.html#recording._index_path',
+                                                                                      'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay.Recording._load_index': ( 'implementation/record_replay.html#recording._load_index',
+                                                                                      'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay.Recording._open': ( 'implementation/record_replay.html#recording._open',
+                                                                                'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay.Recording._records': ( 'implementation/record_replay.html#recording._records',
+                                                                                   'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay.Recording.replay': ( 'implementation/record_replay.html#recording.replay',
+                                                                                 'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay.ReplayError': ( 'implementation/record_replay.html#replayerror',
+                                                                            'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay._Replayed': ( 'implementation/record_replay.html#_replayed',
+                                                                          'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay._Replayed.__call__': ( 'implementation/record_replay.html#_replayed.__call__',
+                                                                                   'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay._Replayed.__init__': ( 'implementation/record_replay.html#_replayed.__init__',
+                                                                                   'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay._Set': ('implementation/record_replay.html#_set', 'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay._add_replay_setup': ( 'implementation/record_replay.html#_add_replay_setup',
+                                                                                  'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay._canonical': ( 'implementation/record_replay.html#_canonical',
+                                                                           'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay._dumps': ( 'implementation/record_replay.html#_dumps',
+                                                                       'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay._header': ( 'implementation/record_replay.html#_header',
+                                                                        'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay._key_hash_function': ( 'implementation/record_replay.html#_key_hash_function',
+                                                                                   'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay._normalized_arguments': ( 'implementation/record_replay.html#_normalized_arguments',
+                                                                                      'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay._record_key': ( 'implementation/record_replay.html#_record_key',
+                                                                            'pymoq/mocking/replay.py'),
+                                      'pymoq.mocking.replay.replay': ( 'implementation/record_replay.html#replay',
+                                                                       'pymoq/mocking/replay.py')},
+            'pymoq.mocking.templates': { 'pymoq.mocking.templates.freeze': ( 'implementation/templates.html#freeze',
+                                                                             'pymoq/mocking/templates.py'),
+                                         'pymoq.mocking.templates.reset': ( 'implementation/templates.html#reset',
+                                                                            'pymoq/mocking/templates.py')},
+            'pymoq.return_value_generators': { 'pymoq.return_value_generators.CacheInfo': ( 'implementation/return_value_generators.html#cacheinfo',
+                                                                                            'pymoq/return_value_generators.py'),
+                                               'pymoq.return_value_generators.CachedReturnValues': ( 'implementation/return_value_generators.html#cachedreturnvalues',
+                                                                                                     'pymoq/return_value_generators.py'),
+                                               'pymoq.return_value_generators.CachedReturnValues.__call__': ( 'implementation/return_value_generators.html#cachedreturnvalues.__call__',
+                                                                                                              'pymoq/return_value_generators.py'),
+                                               'pymoq.return_value_generators.CachedReturnValues.__getstate__': ( 'implementation/return_value_generators.html#cachedreturnvalues.__getstate__',
+                                                                                                                  'pymoq/return_value_generators.py'),
+                                               'pymoq.return_value_generators.CachedReturnValues.__init__': ( 'implementation/return_value_generators.html#cachedreturnvalues.__init__',
+                                                                                                              'pymoq/return_value_generators.py'),
+                                               'pymoq.return_value_generators.CachedReturnValues.__setstate__': ( 'implementation/return_value_generators.html#cachedreturnvalues.__setstate__',
+                                                                                                                  'pymoq/return_value_generators.py'),
+                                               'pymoq.return_value_generators.CachedReturnValues._key': ( 'implementation/return_value_generators.html#cachedreturnvalues._key',
+                                                                                                          'pymoq/return_value_generators.py'),
+                                               'pymoq.return_value_generators.CachedReturnValues.cache_clear': ( 'implementation/return_value_generators.html#cachedreturnvalues.cache_clear',
+                                                                                                                 'pymoq/return_value_generators.py'),
+                                               'pymoq.return_value_generators.CachedReturnValues.cache_info': ( 'implementation/return_value_generators.html#cachedreturnvalues.cache_info',
+                                                                                                                'pymoq/return_value_generators.py'),
+                                               'pymoq.return_value_generators.CopiedReturnValues': ( 'implementation/return_value_generators.html#copiedreturnvalues',
+                                                                                                     'pymoq/return_value_generators.py'),
+                                               'pymoq.return_value_generators.CopiedReturnValues.__call__': ( 'implementation/return_value_generators.html#copiedreturnvalues.__call__',
+                                                                                                              'pymoq/return_value_generators.py'),
+                                               'pymoq.return_value_generators.CopiedReturnValues.__init__': ( 'implementation/return_value_generators.html#copiedreturnvalues.__init__',
+                                                                                                              'pymoq/return_value_generators.py'),
+                                               'pymoq.return_value_generators.ReturnValueGenerator': ( 'implementation/return_value_generators.html#returnvaluegenerator',
                                                                                                        'pymoq/return_value_generators.py'),
                                                'pymoq.return_value_generators.ReturnValueGenerator.__call__': ( 'implementation/return_value_generators.html#returnvaluegenerator.__call__',
                                                                                                                 'pymoq/return_value_generators.py')},
@@ -138,7 +810,15 @@ d = { 'settings': { 'branch': 'main',
                                                                                                         'pymoq/signature_validators.py'),
                                             'pymoq.signature_validators.SignatureValidator.__str__': ( 'implementation/signature_validators.html#signaturevalidator.__str__',
                                                                                                        'pymoq/signature_validators.py'),
+                                            'pymoq.signature_validators.SignatureValidator.by_parameter': ( 'implementation/signature_validators.html#signaturevalidator.by_parameter',
+                                                                                                            'pymoq/signature_validators.py'),
+                                            'pymoq.signature_validators.SignatureValidator.compile': ( 'implementation/signature_validators.html#signaturevalidator.compile',
+                                                                                                       'pymoq/signature_validators.py'),
+                                            'pymoq.signature_validators.SignatureValidator.compile_canonical': ( 'implementation/signature_validators.html#signaturevalidator.compile_canonical',
+                                                                                                                 'pymoq/signature_validators.py'),
                                             'pymoq.signature_validators.SignatureValidator.is_valid': ( 'implementation/signature_validators.html#signaturevalidator.is_valid',
                                                                                                         'pymoq/signature_validators.py'),
+                                            'pymoq.signature_validators._validation_function': ( 'implementation/signature_validators.html#_validation_function',
+                                                                                                 'pymoq/signature_validators.py'),
                                             'pymoq.signature_validators.signature_validator_from_arguments': ( 'implementation/signature_validators.html#signature_validator_from_arguments',
                                                                                                                'pymoq/signature_validators.py')}}}
@@ -1,4 +1,8 @@
 import pymoq.mocking.objects
 
 Mock = pymoq.mocking.objects.Mock
-from pymoq.argument_validators import AnyInt, AnyCallable, AnyArg
+from pymoq.argument_validators import AnyInt, AnyFloat, AnyStr, AnyCallable, AnyArg
+from pymoq.mocking.instrumentation import stats
+from pymoq.mocking.replay import Recorder, replay
+from pymoq.mocking.recording import flush_calls, sends_calls
+from pymoq.mocking.templates import freeze, reset
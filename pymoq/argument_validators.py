@@ -1,11 +1,16 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/implementation/01_validators.ipynb.
 
 # %% auto 0
-__all__ = ['AnyArg', 'ArgumentValidator', 'ArgumentFunctionValidator', 'argument_validator_from_argument', 'AnyInt']
+__all__ = ['ArgumentValidator', 'ArgumentFunctionValidator', 'ArgumentValueValidator', 'ArgumentTypeValidator',
+           'argument_validator_from_argument', 'AnyArg', 'Interval', 'RangeValidator', 'AnyInt', 'AnyFloat', 'AnyStr']
 
 # %% ../nbs/implementation/01_validators.ipynb 2
+import math
+import weakref
+from dataclasses import dataclass, replace
 from typing import Protocol, Any, runtime_checkable
 from collections.abc import Callable
+from types import FunctionType
 from .core import AnyCallable
 
 # %% ../nbs/implementation/01_validators.ipynb 8
@@ -49,17 +54,56 @@ class ArgumentFunctionValidator:
             return f'ArgumentFunctionValidator(name:{self.name}, position={self.position})'
         return f'ArgumentFunctionValidator(argument_name:{self.name}, position={self.position}): {self._display}'
     def __repr__(self): return str(self)
+
+# %% ../nbs/implementation/01_validators.ipynb 18
+class ArgumentValueValidator(ArgumentFunctionValidator):
+    "Validate an argument by comparing it against a constant value"
+    def __init__(self, value: Any, name: str, position: int):
+        super().__init__(lambda v: v==value, name=name, position=position, display=f'== {value}')
+        self._value = value
+        
+    @property
+    def value(self) -> Any:
+        "The value that valid arguments have to be equal to"
+        return self._value
     
-assert isinstance(ArgumentFunctionValidator, ArgumentValidator), "ArgumentFunctionValidator does not implement the ArgumentValidator-Protocol"
+    def __reduce__(self):
+        return type(self), (self._value, self._name, self._position)
 
-# %% ../nbs/implementation/01_validators.ipynb 16
-def argument_validator_from_argument(argument: Any, name:str, position: int, verbose:bool=False) -> ArgumentValidator:
-    if verbose: print(f"Constructing ArgumentValidatorFrom {argument}")
+# %% ../nbs/implementation/01_validators.ipynb 20
+class ArgumentTypeValidator(ArgumentFunctionValidator):
+    "Validate an argument by checking its type"
+    def __init__(self, type_: type, name: str, position: int):
+        super().__init__(lambda v: isinstance(v, type_), name=name, position=position, display=f'any_{type_.__name__}')
+        self._type = type_
+        
+    @property
+    def type(self) -> type:
+        "The type that valid arguments have to be an instance of"
+        return self._type
+    
+    def __reduce__(self):
+        return type(self), (self._type, self._name, self._position)
+
+# %% ../nbs/implementation/01_validators.ipynb 21
+_INTERNED_VALUE_TYPES = {type(None), bool, int, float, complex, str, bytes}
+_interned: weakref.WeakValueDictionary = weakref.WeakValueDictionary() # see `_intern_key`
+
+def _intern_key(argument: Any, name: str, position: int) -> tuple|None:
+    "Key of the shared validator for `argument`: constants of primitive types, types and plain functions that are no `ArgumentValidator` themselves. `None` for all other arguments."
+    kind = type(argument)
+    if kind in _INTERNED_VALUE_TYPES: return (ArgumentValueValidator, kind, argument, name, position)
+    if hasattr(argument, 'is_valid'): return None
+    if isinstance(argument, type): return (ArgumentTypeValidator, argument, name, position)
+    if kind is FunctionType: return (ArgumentFunctionValidator, argument, name, position)
+    return None
+
+def _validator_from_argument(argument: Any, name: str, position: int) -> ArgumentValidator:
     match argument:
         case ArgumentValidator():
             return argument
         case type():
-            return ArgumentFunctionValidator(lambda v: isinstance(v, argument), name=name, position=position, display=f'any_{argument.__name__}')
+            return ArgumentTypeValidator(argument, name=name, position=position)
         case Callable():
             if hasattr(argument, 'display'):
                 display = argument.display
@@ -68,22 +112,91 @@ def argument_validator_from_argument(argument: Any, name:str, position: int, ver
             
             return ArgumentFunctionValidator(argument, name=name, position=position, display=display)
     
-    return ArgumentFunctionValidator(lambda v: v==argument, name=name, position=position, display=f'== {argument}')
+    return ArgumentValueValidator(argument, name=name, position=position)
+
+def argument_validator_from_argument(argument: Any, name:str, position: int, verbose:bool=False) -> ArgumentValidator:
+    if verbose: print(f"Constructing ArgumentValidatorFrom {argument}")
+    key = _intern_key(argument, name, position)
+    if key is None:
+        return _validator_from_argument(argument, name, position)
+    
+    validator = _interned.get(key)
+    if validator is None: # the validator type is known from the key, no need to match the argument
+        if key[0] is ArgumentFunctionValidator:
+            validator = ArgumentFunctionValidator(argument, name=name, position=position, display=getattr(argument, 'display', 'callable()'))
+        else:
+            validator = key[0](argument, name=name, position=position)
+        _interned[key] = validator
+    return validator
 
-# %% ../nbs/implementation/01_validators.ipynb 33
-AnyArg = lambda: lambda v: True
+# %% ../nbs/implementation/01_validators.ipynb 44
+def _any_value(value: Any) -> bool: return True
+
+def AnyArg() -> AnyCallable[bool]:
+    "Validator function that accepts every argument"
+    return _any_value
 AnyArg.display = 'any()'
 
-# %% ../nbs/implementation/01_validators.ipynb 34
-class AnyInt:
-    "Special validator that provides methods for integers"
-    def __init__(self,name: str, position: int, display:str|None = None):
+# %% ../nbs/implementation/01_validators.ipynb 47
+@dataclass(frozen=True)
+class Interval:
+    "Range of values between an optional lower and an optional upper bound"
+    lower: Any = None
+    upper: Any = None
+    lower_inclusive: bool = True
+    upper_inclusive: bool = True
+    
+    def with_lower(self, bound: Any, inclusive: bool) -> "Interval":
+        "Returns the interval restricted by an additional lower bound"
+        if self.lower is not None and (bound < self.lower or (bound == self.lower and (inclusive or not self.lower_inclusive))):
+            return self
+        return replace(self, lower=bound, lower_inclusive=inclusive)
+    
+    def with_upper(self, bound: Any, inclusive: bool) -> "Interval":
+        "Returns the interval restricted by an additional upper bound"
+        if self.upper is not None and (bound > self.upper or (bound == self.upper and (inclusive or not self.upper_inclusive))):
+            return self
+        return replace(self, upper=bound, upper_inclusive=inclusive)
+    
+    @property
+    def empty(self) -> bool:
+        "True if no value lies within the interval"
+        if self.lower is None or self.upper is None: return False
+        return self.lower > self.upper or (self.lower == self.upper and not (self.lower_inclusive and self.upper_inclusive))
+    
+    def compile(self) -> Callable[[Any], bool]:
+        "Returns a function that checks whether a value lies within the interval"
+        lower, upper = self.lower, self.upper
+        if lower is None and upper is None: return _any_value
+        if upper is None: return (lambda v: lower <= v) if self.lower_inclusive else (lambda v: lower < v)
+        if lower is None: return (lambda v: v <= upper) if self.upper_inclusive else (lambda v: v < upper)
+        match self.lower_inclusive, self.upper_inclusive:
+            case True, True: return lambda v: lower <= v <= upper
+            case True, False: return lambda v: lower <= v < upper
+            case False, True: return lambda v: lower < v <= upper
+            case False, False: return lambda v: lower < v < upper
+    
+    def __contains__(self, value: Any) -> bool:
+        return self.compile()(value)
+    
+    def __str__(self):
+        lower = '-inf' if self.lower is None else self.lower
+        upper = 'inf' if self.upper is None else self.upper
+        return f"{'[' if self.lower_inclusive else '('}{lower}, {upper}{']' if self.upper_inclusive else ')'}"
+
+# %% ../nbs/implementation/01_validators.ipynb 50
+class RangeValidator:
+    "Special validator that checks the type of an argument and fuses range constraints into an `Interval`"
+    type: type = object
+    
+    def __init__(self, name: str, position: int, display:str|None = None):
         self._name = name
         self._position = position
         self._display = display
         
-        self._validators: list[ArgumentValidator] = [argument_validator_from_argument(int, name=name, position=position)]
-        self._validator_names: list[str] = ['AnyInt()']
+        self._interval = Interval()
+        self._check = self._interval.compile()
+        self._validator_names: list[str] = [f'{type(self).__name__}()']
     
     @property
     def name(self) -> str:
@@ -93,36 +206,136 @@ class AnyInt:
     def position(self) -> int:
         return self._position
     
-    def greather_than(self, lower: int) -> "AnyInt":
-        greather_func = lambda value: lower<value
-        self._validator_names.append(f"greather_than({lower})")
-        
-        self._validators.append(argument_validator_from_argument(greather_func, name=self._name, position=self._position))
-        return self
+    @property
+    def interval(self) -> Interval:
+        "The range of valid arguments"
+        return self._interval
     
-    def greather_than_or_equal(self, lower: int) -> "AnyInt":
-        greather_func = lambda value: lower<=value
-        self._validator_names.append(f"greather_than_or_equal({lower})")
-        
-        self._validators.append(argument_validator_from_argument(greather_func, name=self._name, position=self._position))
+    def _bound(self, bound: Any, inclusive: bool, lower: bool) -> tuple[Any, bool]:
+        "Normalizes a bound, e.g. to make exclusive integer bounds inclusive"
+        return bound, inclusive
+    
+    def _restrict(self, interval: Interval, description: str) -> "RangeValidator":
+        if interval.empty:
+            raise ValueError(f"Contradicting constraints: {self}.{description} is never valid")
+        self._interval = interval
+        self._check = interval.compile()
+        self._validator_names.append(description)
         return self
     
-    def less_than(self, upper: int) -> "AnyInt":
-        less_func = lambda value: value<upper
-        self._validator_names.append(f"less_than({upper})")
+    def greather_than(self, lower: Any) -> "RangeValidator":
+        return self._restrict(self._interval.with_lower(*self._bound(lower, False, lower=True)), f"greather_than({lower})")
+    
+    def greather_than_or_equal(self, lower: Any) -> "RangeValidator":
+        return self._restrict(self._interval.with_lower(*self._bound(lower, True, lower=True)), f"greather_than_or_equal({lower})")
+    
+    def less_than(self, upper: Any) -> "RangeValidator":
+        return self._restrict(self._interval.with_upper(*self._bound(upper, False, lower=False)), f"less_than({upper})")
+    
+    def less_than_or_equal(self, upper: Any) -> "RangeValidator":
+        return self._restrict(self._interval.with_upper(*self._bound(upper, True, lower=False)), f"less_than_or_equal({upper})")
         
-        self._validators.append(argument_validator_from_argument(less_func, name=self._name, position=self._position))
-        return self
+    def accepts_type(self, value_type: type) -> bool:
+        "Whether arguments of type `value_type` are checked against the interval, all others are invalid"
+        return issubclass(value_type, self.type)
     
-    def less_than_or_equal(self, upper: int) -> "AnyInt":
-        less_func = lambda value: value<=upper
-        self._validator_names.append(f"less_than_or_equal({upper})")
+    def is_valid(self, argument: Any) -> bool:
+        return isinstance(argument, self.type) and self._check(argument)
+    
+    def __getstate__(self) -> dict[str, Any]:
+        return {name: value for name, value in self.__dict__.items() if name != '_check'}
+    
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._check = self._interval.compile()
+    
+    def __str__(self):
+        return '.'.join(self._validator_names)
+    
+    def __repr__(self): return str(self)
+
+# %% ../nbs/implementation/01_validators.ipynb 51
+class AnyInt(RangeValidator):
+    "Special validator that provides methods for integers"
+    type = int
+    
+    def _bound(self, bound: Any, inclusive: bool, lower: bool) -> tuple[int, bool]:
+        "Integer bounds are always inclusive, so that contradictions like `greather_than(1).less_than(2)` are detected"
+        if lower:
+            return (math.ceil(bound) if inclusive else math.floor(bound) + 1), True
+        return (math.floor(bound) if inclusive else math.ceil(bound) - 1), True
+
+# %% ../nbs/implementation/01_validators.ipynb 62
+class AnyFloat(RangeValidator):
+    "Special validator that provides methods for floats. Accepts ints as well, but not bools."
+    type = float
+    
+    def accepts_type(self, value_type: type) -> bool:
+        return value_type is not bool and issubclass(value_type, (int, float))
+    
+    def is_valid(self, argument: Any) -> bool:
+        return isinstance(argument, (int, float)) and type(argument) is not bool and self._check(argument)
+
+# %% ../nbs/implementation/01_validators.ipynb 65
+class AnyStr:
+    "Special validator that provides methods for strings"
+    def __init__(self, name: str, position: int, display:str|None = None):
+        self._name = name
+        self._position = position
+        self._display = display
         
-        self._validators.append(argument_validator_from_argument(less_func, name=self._name, position=self._position))
+        self._length = Interval(0)
+        self._prefix = ''
+        self._check_length = self._length.compile()
+        self._validator_names: list[str] = ['AnyStr()']
+        
+    @property
+    def name(self) -> str:
+        return self._name
+    
+    @property
+    def position(self) -> int:
+        return self._position
+    
+    @property
+    def length(self) -> Interval:
+        "The range of valid string lengths"
+        return self._length
+    
+    @property
+    def prefix(self) -> str:
+        "The prefix that valid strings start with"
+        return self._prefix
+    
+    def _restrict(self, length: Interval, prefix: str|None, description: str) -> "AnyStr":
+        if prefix is None or length.empty or (length.upper is not None and len(prefix) > length.upper):
+            raise ValueError(f"Contradicting constraints: {self}.{description} is never valid")
+        self._length, self._prefix = length, prefix
+        self._check_length = length.compile()
+        self._validator_names.append(description)
         return self
+    
+    def min_length(self, length: int) -> "AnyStr":
+        return self._restrict(self._length.with_lower(length, inclusive=True), self._prefix, f"min_length({length})")
+    
+    def max_length(self, length: int) -> "AnyStr":
+        return self._restrict(self._length.with_upper(length, inclusive=True), self._prefix, f"max_length({length})")
+    
+    def starts_with(self, prefix: str) -> "AnyStr":
+        if prefix.startswith(self._prefix): combined = prefix
+        elif self._prefix.startswith(prefix): combined = self._prefix
+        else: combined = None
+        return self._restrict(self._length, combined, f"starts_with({prefix!r})")
         
     def is_valid(self, argument: Any) -> bool:
-        return all(validator.is_valid(argument) for validator in self._validators)
+        return isinstance(argument, str) and self._check_length(len(argument)) and argument.startswith(self._prefix)
+    
+    def __getstate__(self) -> dict[str, Any]:
+        return {name: value for name, value in self.__dict__.items() if name != '_check_length'}
+    
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._check_length = self._length.compile()
     
     def __str__(self):
         return '.'.join(self._validator_names)
@@ -1,14 +1,23 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/implementation/00_core.ipynb.
 
 # %% auto 0
-__all__ = ['T', 'AnyCallable']
+__all__ = ['T', 'AnyCallable', 'patch_to']
 
 # %% ../nbs/implementation/00_core.ipynb 1
-from typing import Protocol, Generic, TypeVar
+from typing import Callable, Protocol, Generic, TypeVar
 
-# %% ../nbs/implementation/00_core.ipynb 4
+# %% ../nbs/implementation/00_core.ipynb 5
 T = TypeVar('T')
 class AnyCallable(Generic[T], Protocol):
     "Generic interface for an object with a call operator that takes any number of arguments (both positional and named) and returns the type T"
     def __call__(self, *args, **kwargs) -> T:
         ...
+
+# %% ../nbs/implementation/00_core.ipynb 8
+def patch_to(cls: type) -> Callable[[Callable], Callable]:
+    "Decorator that adds the decorated function to `cls` as method"
+    def _inner(f: Callable) -> Callable:
+        f.__qualname__ = f"{cls.__name__}.{f.__name__}"
+        setattr(cls, f.__name__, f)
+        return f
+    return _inner
@@ -0,0 +1,131 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/implementation/09_bulk_calls.ipynb.
+
+# %% auto 0
+__all__ = ['numpy_or_none', 'to_list', 'as_array', 'interval_mask', 'is_any_value', 'vectorized_mask', 'matching_rows',
+           'ColumnarCall']
+
+# %% ../../nbs/implementation/09_bulk_calls.ipynb 2
+from typing import Any, Callable, Sequence
+
+from ..argument_validators import ArgumentValidator, ArgumentFunctionValidator, ArgumentValueValidator, ArgumentTypeValidator, RangeValidator, AnyStr, Interval, _any_value
+from ..signature_validators import _validation_function
+
+# %% ../../nbs/implementation/09_bulk_calls.ipynb 7
+def numpy_or_none() -> Any:
+    "Returns the `numpy` module, or `None` if it isn't installed"
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+def to_list(column: Sequence) -> list:
+    "Converts a column (list, numpy array, pandas series, ...) into a list of python values"
+    tolist = getattr(column, 'tolist', None)
+    return tolist() if tolist is not None else list(column)
+
+# %% ../../nbs/implementation/09_bulk_calls.ipynb 10
+_KIND_TYPES = {'b': bool, 'i': int, 'u': int, 'f': float, 'U': str} # numpy dtype kind -> python type of the values
+
+def as_array(values: list, np: Any) -> Any:
+    "Converts python values of a single primitive type into a numpy array, returns `None` for all other columns"
+    types = set(map(type, values))
+    if len(types) != 1 or next(iter(types)) not in (bool, int, float, str):
+        return None
+    try:
+        array = np.asarray(values)
+    except OverflowError:
+        return None
+    return array if array.dtype.kind in _KIND_TYPES else None
+
+# %% ../../nbs/implementation/09_bulk_calls.ipynb 14
+def interval_mask(interval: Interval, values: Any, np: Any) -> Any:
+    "Checks for all elements of the array `values` whether they lie within `interval`"
+    mask = np.ones(len(values), dtype=bool)
+    if interval.lower is not None:
+        mask &= (values >= interval.lower) if interval.lower_inclusive else (values > interval.lower)
+    if interval.upper is not None:
+        mask &= (values <= interval.upper) if interval.upper_inclusive else (values < interval.upper)
+    return mask
+
+def is_any_value(validator: ArgumentValidator) -> bool:
+    "Returns true if `validator` accepts every value (see `AnyArg`)"
+    return isinstance(validator, ArgumentFunctionValidator) and validator._func is _any_value
+
+def vectorized_mask(validator: ArgumentValidator, values: Any, np: Any) -> Any:
+    "Validates all elements of the array `values` at once. Returns `None` if `validator` has to be evaluated per value."
+    value_type = _KIND_TYPES[values.dtype.kind]
+    match validator:
+        case ArgumentValueValidator():
+            value = validator.value
+            if type(value) not in (bool, int, float, str):
+                return None
+            if (value_type is str) != (type(value) is str):
+                return np.zeros(len(values), dtype=bool)
+            return values == value
+        case ArgumentTypeValidator():
+            try:
+                return np.full(len(values), issubclass(value_type, validator.type))
+            except TypeError: # e.g. protocols with data members
+                return None
+        case RangeValidator():
+            if not validator.accepts_type(value_type):
+                return np.zeros(len(values), dtype=bool)
+            return interval_mask(validator.interval, values, np)
+        case AnyStr():
+            if value_type is not str:
+                return np.zeros(len(values), dtype=bool)
+            return interval_mask(validator.length, np.char.str_len(values), np) & np.char.startswith(values, validator.prefix)
+        case _ if is_any_value(validator):
+            return np.ones(len(values), dtype=bool)
+    return None
+
+# %% ../../nbs/implementation/09_bulk_calls.ipynb 18
+def matching_rows(validators: list[tuple[str, ArgumentValidator]], rows: Any, array: Callable[[str], Any], column: Callable[[str], list], np: Any) -> Any:
+    "Returns the subset of `rows` (an array of row indices) whose values are valid for all `validators`, given as `(parameter name, validator)` pairs. `array(name)` returns all values of a parameter as numpy array (`None` if they can't be vectorized), `column(name)` as list."
+    per_row = []
+    for name, validator in validators:
+        if is_any_value(validator): continue
+        values = array(name)
+        mask = None if values is None else vectorized_mask(validator, values[rows], np)
+        if mask is None:
+            per_row.append((name, validator))
+        else:
+            rows = rows[mask]
+        if not len(rows): return rows
+            
+    for name, validator in per_row:
+        is_valid, values = _validation_function(validator), column(name)
+        rows = rows[np.fromiter((is_valid(values[row]) for row in rows.tolist()), dtype=bool, count=len(rows))]
+        if not len(rows): break
+    return rows
+
+# %% ../../nbs/implementation/09_bulk_calls.ipynb 20
+class ColumnarCall:
+    "A batch of calls of the same shape, as rows and as columns per parameter"
+    def __init__(self, np: Any, args: list[tuple[Any]], names: tuple[str], values: list[tuple[Any]], columns: dict[str, list]):
+        self.np = np
+        self.args = args # positional arguments per call
+        self.names = names # names of all parameters after the positional arguments, in signature order
+        self.values = values # values of these parameters per call
+        self.columns = columns # values per parameter name
+        self._arrays = {}
+        
+    def __len__(self) -> int: return len(self.args)
+        
+    def kwargs(self, row: int) -> dict[str, Any]:
+        return dict(zip(self.names, self.values[row]))
+    
+    def call(self, row: int) -> tuple[Any]:
+        "The canonical argument list of a call"
+        return self.args[row] + self.values[row]
+        
+    def array(self, name: str) -> Any:
+        "The values of parameter `name` as numpy array, `None` if they can't be vectorized"
+        if name not in self._arrays:
+            self._arrays[name] = as_array(self.columns[name], self.np)
+        return self._arrays[name]
+    
+    def matching_rows(self, validators: list[ArgumentValidator], rows: Any) -> Any:
+        "Returns the subset of `rows` (an array of row indices) whose values are valid for all `validators` (one per parameter)"
+        return matching_rows([(validator.name, validator) for validator in validators], rows, self.array, self.columns.__getitem__, self.np)
@@ -1,18 +1,24 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/implementation/04_mocking.functions.ipynb.
 
 # %% auto 0
-__all__ = ['is_class_method', 'add_self_parameter', 'remove_self_parameter', 'FunctionMock', 'Setup', 'VerifiedCalls']
+__all__ = ['is_class_method', 'add_self_parameter', 'remove_self_parameter', 'CallShape', 'FunctionSpec', 'function_spec', 'FunctionMock', 'Setup', 'MAX_CALLS_IN_MESSAGE', 'MAX_VALUES_IN_MESSAGE', 'VerifiedCalls', 'Verifier', 'FunctionMockTemplate', 'TableSetup']
 
 # %% ../../nbs/implementation/04_mocking.functions.ipynb 2
 import inspect
-from typing import Any, Iterable
+import itertools
+from functools import partial
+from operator import itemgetter
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Iterable, NamedTuple
+from weakref import WeakKeyDictionary
 
-from ..core import AnyCallable
-from ..argument_validators import ArgumentFunctionValidator, AnyArg
+from ..core import AnyCallable, patch_to
+from ..argument_validators import ArgumentFunctionValidator, ArgumentValueValidator, AnyArg
 from ..signature_validators import SignatureValidator, signature_validator_from_arguments
-from ..return_value_generators import ReturnValueGenerator
-
-from fastcore.basics import patch_to
+from ..return_value_generators import ReturnValueGenerator, CachedReturnValues, CopiedReturnValues
+from .recording import CallLog, CallHistoryError, call_log
+from .instrumentation import FunctionStats, instrumentation_enabled
 
 # %% ../../nbs/implementation/04_mocking.functions.ipynb 18
 def is_class_method(func: AnyCallable) -> bool:
@@ -29,117 +35,493 @@ def remove_self_parameter(args: tuple[Any]) -> tuple[Any]:
     "Removes the first parameter of the argument list."
     return args[1:]
 
-# %% ../../nbs/implementation/04_mocking.functions.ipynb 23
+# %% ../../nbs/implementation/04_mocking.functions.ipynb 24
+class CallShape(NamedTuple):
+    "How to complete argument lists of one call shape: number of positional arguments and names of the keyword arguments"
+    defaults: tuple[tuple[str, Any]] # (name, default) of the parameters that are missing in the argument list
+    names: tuple[str] # names of all parameters after the positional arguments
+    missing: tuple[Any] # the default values of `defaults`
+    order: AnyCallable|None # reorders the keyword argument values followed by `missing` like `names`, `None` if they are in order
+
+@dataclass(frozen=True, eq=False)
+class FunctionSpec:
+    "Signature information of a mocked function. Shared by all mocks of the same function."
+    signature: inspect.Signature
+    argument_names: tuple[str]
+    parameters: tuple[tuple[str, Any]] # (name, default)
+    kinds: tuple[inspect._ParameterKind]
+    is_class_method: bool
+    is_coroutine: bool
+    has_var_arguments: bool # True if the function takes `*args` or `**kwargs`
+    
+    shapes: dict = field(default_factory=dict) # call shapes that bind against the signature, see `FunctionMock._call_shape`
+    
+    @classmethod
+    def from_function(cls, func: AnyCallable) -> "FunctionSpec":
+        signature = inspect.signature(func)
+        parameters = signature.parameters.values()
+        
+        return cls(signature=signature,
+                   argument_names=tuple(param.name for param in parameters),
+                   parameters=tuple((param.name, param.default) for param in parameters),
+                   kinds=tuple(param.kind for param in parameters),
+                   is_class_method='self' in signature.parameters,
+                   is_coroutine=inspect.iscoroutinefunction(func),
+                   has_var_arguments=any(param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD) for param in parameters))
+
+# %% ../../nbs/implementation/04_mocking.functions.ipynb 26
+_function_specs = WeakKeyDictionary()
+
+def function_spec(func: AnyCallable) -> FunctionSpec:
+    "Returns the (cached) `FunctionSpec` of `func`"
+    try:
+        return _function_specs[func]
+    except KeyError:
+        spec = _function_specs[func] = FunctionSpec.from_function(func)
+        return spec
+    except TypeError: # not weakly referencable
+        return FunctionSpec.from_function(func)
+
+# %% ../../nbs/implementation/04_mocking.functions.ipynb 30
+_NO_SETUPS = ((), {}, (), {}) # setups, dispatch index, fallback setups, fallback signatures (validators -> position)
+
 class FunctionMock:
     "Mocks a function object based on its signature"
-    def __init__(self, func: AnyCallable):
+    def __init__(self, func: AnyCallable, record: str|int='full', concurrent: bool=False, instrument: bool|None=None, shared: bool=False):
         self._func = func
-        self._signature = inspect.signature(self._func)
-        self._argument_names = list(self._signature.parameters.keys())
-        self._setups = []
-        self._calls = []
+        self._spec = spec = function_spec(func)
+        self._signature = spec.signature
+        self._argument_names = spec.argument_names
+        self._parameters = spec.parameters
+        if record == 'full' and not (concurrent or shared):
+            self._new_call_log = CallLog
+        else:
+            self._new_call_log = partial(call_log, record, concurrent=concurrent, shared=shared,
+                                         argument_names=None if spec.has_var_arguments else spec.argument_names)
+        self._call_log = self._new_call_log()
+        
+        self._is_class_method = spec.is_class_method
+        self._is_coroutine = spec.is_coroutine # calls return awaitables, see `Setup.get_awaitable_return_value`
         
-        self._is_class_method = is_class_method(self._func)
+        # dispatch index, see `FunctionMock._find_setup`. Mocks start out sharing empty ones, copied by the first setup.
+        self._setups, self._setup_index, self._fallback_setups, self._fallback_signatures = _NO_SETUPS
+        self._setups_shared = True # copy-on-write, see `FunctionMockTemplate`
+        self._setup_lock = threading.Lock()
+        self._indexable = self._canonical = not spec.has_var_arguments
         
+        self._shapes = spec.shapes # see `FunctionMock._call_shape`
+        
+        # usage statistics, see `pymoq.mocking.instrumentation`
+        self._stats = FunctionStats(func.__qualname__) if instrumentation_enabled(instrument) else None
+        
+    @property
+    def _calls(self) -> list[tuple[tuple[Any], dict[str, Any]]]:
+        "All recorded calls as `(args, kwargs)`"
+        return list(self._call_log)
+    
+    def __getstate__(self) -> dict[str, Any]:
+        "The signature information and the call shapes are shared with other mocks of the same function, so they are looked up again after unpickling"
+        unpicklable = ('_spec', '_signature', '_shapes', '_setup_lock')
+        return {name: value for name, value in self.__dict__.items() if name not in unpicklable}
+    
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._spec = function_spec(self._func)
+        self._signature = self._spec.signature
+        self._shapes = self._spec.shapes
+        self._setup_lock = threading.Lock()
+    
     def arguments_valid(self, *args, **kwargs) -> None:
         "Given an arbitrary argument list (both positional and keyword arguments), returns True if the mocked function could be called with those arguments"
         self._signature.bind(*args, **kwargs)
         return True
 
-# %% ../../nbs/implementation/04_mocking.functions.ipynb 39
+# %% ../../nbs/implementation/04_mocking.functions.ipynb 46
 def _throw(exception: Exception) -> None:
     raise exception
 
+class _ExceptionReturnValue:
+    "`ReturnValueGenerator` that raises the same exception for every call"
+    def __init__(self, exception: Exception):
+        self.exception = exception
+        
+    def __call__(self, *args, **kwargs) -> Any:
+        _throw(self.exception)
+
+class _ConstantReturnValue:
+    "`ReturnValueGenerator` that returns the same value for every call"
+    def __init__(self, value: Any):
+        self.value = value
+        
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.value
+
+def _cycled(sequence: Iterable) -> Iterable:
+    "Repeats `sequence` endlessly. Collections are iterated again, only one-shot iterators are buffered."
+    if iter(sequence) is sequence:
+        yield from itertools.cycle(sequence)
+        return
+    
+    while True:
+        empty = True
+        for value in sequence:
+            empty = False
+            yield value
+        if empty: return
+
+class _SequenceReturnValues:
+    "Thread-safe `ReturnValueGenerator` that lazily consumes an iterable, one value per call"
+    def __init__(self, sequence: Iterable, cycle: bool, repeat_last: bool):
+        self._sequence, self._cycle = sequence, cycle
+        self._values = _cycled(sequence) if cycle else iter(sequence)
+        self._repeat_last = repeat_last
+        self._last = None # (value,) once a value was returned
+        self._lock = threading.Lock()
+        
+    def __getstate__(self) -> dict[str, Any]:
+        return {name: value for name, value in self.__dict__.items() if name != '_lock'}
+    
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        
+    def fresh(self) -> "_SequenceReturnValues":
+        "A generator that starts over at the first value. One-shot iterators are shared, they can't start over."
+        return _SequenceReturnValues(self._sequence, self._cycle, self._repeat_last)
+        
+    def __call__(self, *args, **kwargs) -> Any:
+        with self._lock:
+            try:
+                self._last = (next(self._values),)
+            except StopIteration:
+                if not (self._repeat_last and self._last):
+                    raise IndexError("No values left in the return sequence") from None
+            return self._last[0]
+
 class Setup:
     "This class bundles a signature validator with a call-result-action"
-    def __init__(self, signature_validator: SignatureValidator):
+    def __init__(self, signature_validator: SignatureValidator, argument_names: tuple[str]|None = None):
         self._signature_validator = signature_validator
+        self._argument_names = argument_names
+        self._matcher = signature_validator.compile()
+        self._canonical_matcher = None if argument_names is None else signature_validator.compile_canonical(argument_names)
+        self._delay = 0
+        self._hits = 0 # only counted by instrumented mocks
+        
+    def __getstate__(self) -> dict[str, Any]:
+        return {name: value for name, value in self.__dict__.items() if name not in ('_matcher', '_canonical_matcher')}
+    
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(state['_signature_validator'], state['_argument_names'])
+        self.__dict__.update(state)
+        
+    def __copy__(self) -> "Setup":
+        "Shares the validators, the compiled matchers and the return value generator with this setup"
+        setup = type(self).__new__(type(self))
+        setup.__dict__.update(self.__dict__)
+        return setup
         
     def is_valid(self, *args, **kwargs) -> bool:
         "Uses the underlying `SignatureValidator` to determine if the argument list is valid"
-        return self._signature_validator.is_valid(*args, **kwargs)
+        return self._matcher(*args, **kwargs)
         
-    def returns(self, return_value_generator: Any) -> None:
-        "Set the `ReturnValueGenerator` to be called when this setup is successfully called"
+    def returns(self, return_value_generator: Any, cache: bool|int = False, copy: bool = False) -> None:
+        "Set the `ReturnValueGenerator` to be called when this setup is successfully called. Results can be cached (up to `cache` results, or all for `True`) and/or returned as deep copies."
         match return_value_generator:
             case ReturnValueGenerator():
-                self._return_value_generator = return_value_generator
+                generator = return_value_generator
+                if cache:
+                    generator = CachedReturnValues(generator, maxsize=None if cache is True else cache, copy=copy, argument_names=self._argument_names)
+                elif copy:
+                    generator = CopiedReturnValues(generator)
             case _:
-                self._return_value_generator = lambda *args, **kwargs: return_value_generator
+                generator = _ConstantReturnValue(return_value_generator)
+                if copy:
+                    generator = CopiedReturnValues(generator)
+        self._return_value_generator = generator
         
-    def returns_sequence(self, sequence: Iterable) -> None:
-        "Sets the `ReturnValueGenerator` that returns the elements in `sequence` in order. Throws an exception if no items are left."
-        self._return_value_generator = lambda *args, **kwargs: sequence.pop(0)
+    def cache_info(self) -> "CacheInfo|None":
+        "Statistics of the result cache (see `Setup.returns`), `None` if results aren't cached"
+        generator = getattr(self, '_return_value_generator', None)
+        return generator.cache_info() if isinstance(generator, CachedReturnValues) else None
+        
+    def returns_sequence(self, sequence: Iterable, cycle: bool=False, repeat_last: bool=False) -> None:
+        "Sets the `ReturnValueGenerator` that returns the elements in `sequence` in order. Throws an `IndexError` if no items are left, unless the sequence is cycled or its last item repeated."
+        if cycle and repeat_last:
+            raise ValueError("Only one of cycle and repeat_last can be used")
+        self._return_value_generator = _SequenceReturnValues(sequence, cycle, repeat_last)
         
     def throws(self, exception: Exception) -> None:
         "Sets a `ReturnValueGenerator` that throws the specified exception when called"
-        self._return_value_generator = lambda *args, **kwargs: _throw(exception)
+        self._return_value_generator = _ExceptionReturnValue(exception)
+        
+    @property
+    def hits(self) -> int:
+        "Number of calls that were answered by this setup. Only counted by instrumented mocks."
+        return self._hits
+        
+    def delays(self, seconds: float) -> "Setup":
+        "Delays the return value by `seconds` without blocking the event loop. Only used when mocking async functions."
+        self._delay = seconds
+        return self
         
     def get_return_value(self, *args, **kwargs):
         "Calls the underlying `ReturnValueGenerator` the get the return value for the exact argument list"
         return self._return_value_generator(*args, **kwargs)
+    
+    async def get_awaitable_return_value(self, *args, **kwargs):
+        "Like `get_return_value`, but waits for the delay first. Awaitable return values are awaited."
+        if self._delay:
+            import asyncio
+            await asyncio.sleep(self._delay)
+        value = self.get_return_value(*args, **kwargs)
+        if inspect.isawaitable(value):
+            value = await value
+        return value
+
+# %% ../../nbs/implementation/04_mocking.functions.ipynb 56
+_INDEXABLE_TYPES = {type(None), bool, int, float, complex, str, bytes}
+
+def _is_indexable(value: Any) -> bool:
+    "Returns true if `value` can be used in the dispatch index of a `FunctionMock`"
+    return type(value) in _INDEXABLE_TYPES and value == value # excludes nan
+
+# %% ../../nbs/implementation/04_mocking.functions.ipynb 59
+@patch_to(FunctionMock)
+def _index_key(self, signature_validator: SignatureValidator) -> tuple|None:
+    "Returns the dispatch key of a setup that only compares against plain values. Returns `None` for all other setups."
+    if not self._indexable: return None
+    validators = signature_validator.by_parameter(self._argument_names)
+    if validators is None: return None
+    
+    key = []
+    for validator in validators[1 if self._is_class_method else 0:]:
+        if not isinstance(validator, ArgumentValueValidator) or not _is_indexable(validator.value): return None
+        key.append(validator.value)
+        
+    return tuple(key)
+
+# %% ../../nbs/implementation/04_mocking.functions.ipynb 60
+@patch_to(FunctionMock)
+def _add_setup(self, setup: Setup, key: tuple|None) -> None:
+    "Registers `setup` with the highest priority, in the dispatch index under `key` or as fallback setup if `key` is `None`. Setups that are shadowed by `setup` are dropped from the index and the fallbacks."
+    with self._setup_lock: # calls only read, so only registering has to be synchronized
+        if self._setups_shared:
+            self._setups, self._setup_index, self._fallback_setups = list(self._setups), dict(self._setup_index), list(self._fallback_setups)
+            self._fallback_signatures = dict(self._fallback_signatures)
+            self._setups_shared = False
+        self._setups.append(setup)
+        if key is None:
+            position, shadowed = len(self._setups)-1, None
+            signature_validator = getattr(setup, '_signature_validator', None)
+            if signature_validator is not None: # the last setup with the same (interned) validators can't match anymore
+                signature = tuple(signature_validator.argument_validators)
+                shadowed = self._fallback_signatures.get(signature)
+                self._fallback_signatures[signature] = position
+            if shadowed is None:
+                self._fallback_setups.append(position)
+            else: # replaced in one step, calls might iterate the fallbacks meanwhile
+                self._fallback_setups = [fallback for fallback in self._fallback_setups if fallback != shadowed] + [position]
+        else:
+            self._setup_index[key] = len(self._setups)-1
+        if self._stats is not None:
+            self._stats.setups += 1
 
-# %% ../../nbs/implementation/04_mocking.functions.ipynb 41
 @patch_to(FunctionMock)
 def setup(self, *args, **kwargs):
     if self._is_class_method:
         args = (AnyArg(),) + args
     sig = signature_validator_from_arguments(self._argument_names, *args, **kwargs)
-    self._setups.append(Setup(sig))
-    
-    return self._setups[-1]
+    setup = Setup(sig, self._argument_names)
+    self._add_setup(setup, self._index_key(sig))
+    return setup
+
+# %% ../../nbs/implementation/04_mocking.functions.ipynb 78
+@patch_to(FunctionMock)
+def _defaults_for_shape(self, n_positional: int, names: frozenset[str]) -> tuple[tuple[str, Any]]:
+    "Returns the `(name, default)` pairs that are missing in an argument list with `n_positional` positional arguments and the keyword arguments `names`"
+    return tuple((name, default) for name, default in self._parameters[n_positional:] if name not in names)
 
-# %% ../../nbs/implementation/04_mocking.functions.ipynb 59
 @patch_to(FunctionMock)
 def fill_up_arg_list(self, args: list[Any], kwargs: dict[str, Any], verbose: bool=False) -> dict[str, Any]:
     if verbose: print("fill_up_arg_list")
-    parameters = list(self._signature.parameters.items())
-    names = list(map(lambda p: p[0], parameters))
-    n_positional = len(args)
+    shape = self._shapes.get((len(args), *kwargs) if kwargs else len(args))
+    defaults = self._defaults_for_shape(len(args), kwargs) if shape is None else shape.defaults
     
-    if verbose: print(f'parameters: {parameters}')
-    if verbose: print(f'names: {names}')
-    if verbose: print(f'n_positional: {n_positional}')
+    if verbose: print(f'parameters: {self._parameters}')
+    if verbose: print(f'n_positional: {len(args)}')
+    if verbose: print(f'defaults: {defaults}')
     
-    for name,param in parameters[n_positional:]:
-        if name in kwargs: continue
-        kwargs[name] = param.default
-        
+    kwargs.update(defaults)
     return kwargs
 
-# %% ../../nbs/implementation/04_mocking.functions.ipynb 68
+# %% ../../nbs/implementation/04_mocking.functions.ipynb 89
 @patch_to(FunctionMock)
-def __call__(self, *args, **kwargs):
+def _call_shape(self, args: tuple[Any], kwargs: dict[str, Any]) -> CallShape:
+    "Checks that the argument list binds against the signature. Returns how to complete argument lists of its shape, cached per shape."
+    shape = (len(args), *kwargs) if kwargs else len(args)
+    if shape not in self._shapes:
+        self.arguments_valid(*args, **kwargs)
+        names = self._argument_names[len(args):]
+        defaults = self._defaults_for_shape(len(args), kwargs)
+        given = tuple(kwargs) + tuple(name for name, _ in defaults)
+        order = None if given == names or not self._canonical else itemgetter(*map(given.index, names))
+        self._shapes[shape] = CallShape(defaults, names, tuple(default for _, default in defaults), order)
+    return self._shapes[shape]
+
+@patch_to(FunctionMock)
+def _bind(self, args: tuple[Any], kwargs: dict[str, Any]) -> dict[str, Any]:
+    "Checks that the argument list binds against the signature and fills up `kwargs` with the default values"
+    shape = self._shapes.get((len(args), *kwargs) if kwargs else len(args)) or self._call_shape(args, kwargs)
+    kwargs.update(shape.defaults)
+    return kwargs
+
+# %% ../../nbs/implementation/04_mocking.functions.ipynb 92
+@patch_to(FunctionMock)
+def _canonical_call(self, args: tuple[Any], kwargs: dict[str, Any]) -> tuple[tuple[str], tuple[Any]]:
+    "Returns the names and values of all parameters after the positional arguments. Together with `args`, the values form the canonical argument list."
+    _, names, missing, order = self._shapes.get((len(args), *kwargs) if kwargs else len(args)) or self._call_shape(args, kwargs)
+    values = tuple(kwargs.values()) + missing if kwargs else missing
+    return names, values if order is None else order(values)
+
+# %% ../../nbs/implementation/04_mocking.functions.ipynb 96
+@patch_to(FunctionMock)
+def _find_setup(self, call: tuple[Any]) -> Setup|None:
+    "Returns the last added setup that matches the canonical argument list `call`, or `None`"
+    if self._setup_index:
+        key = call[1:] if self._is_class_method else call
+        if all(map(_is_indexable, key)):
+            hit = self._setup_index.get(key, -1)
+            for position in reversed(self._fallback_setups):
+                if position < hit: break
+                setup = self._setups[position]
+                if setup._canonical_matcher(call): return setup
+            return self._setups[hit] if hit >= 0 else None
+    elif len(self._fallback_setups) < len(self._setups): # skips the shadowed setups
+        for position in reversed(self._fallback_setups):
+            setup = self._setups[position]
+            if setup._canonical_matcher(call): return setup
+        return None
+        
+    for setup in reversed(self._setups):
+        if setup._canonical_matcher(call): return setup
+    return None
+
+@patch_to(FunctionMock)
+def _find_setup_by_arguments(self, args: tuple[Any], kwargs: dict[str, Any]) -> Setup|None:
+    "Like `_find_setup` for mocks without canonical form, with the (filled up) argument list"
+    setups = self._setups if len(self._fallback_setups) == len(self._setups) else [self._setups[position] for position in self._fallback_setups]
+    for setup in reversed(setups):
+        if setup._matcher(*args, **kwargs): return setup
+    return None
+
+# %% ../../nbs/implementation/04_mocking.functions.ipynb 97
+async def _no_return_value(): return None
+
+@patch_to(FunctionMock)
+def _respond(self, setup: Setup|None, args: tuple[Any], names: tuple[str], values: tuple[Any]) -> Any:
+    "Returns the result of the call of `setup` with the given arguments, or `None` if no setup matched"
+    if self._is_coroutine:
+        return _no_return_value() if setup is None else setup.get_awaitable_return_value(*args, **dict(zip(names, values)))
+    if setup is None: return None
+    
+    generator = setup._return_value_generator
+    if type(generator) is _ConstantReturnValue: return generator.value
+    return generator(*args, **dict(zip(names, values)))
+
+@patch_to(FunctionMock)
+def _dispatch(self, args: tuple[Any], kwargs: dict[str, Any]) -> tuple[Setup|None, tuple[Any], tuple[str], tuple[Any]]:
+    "Records the call and finds the setup that answers it. Returns the setup and the call as positional arguments, keyword argument names and values."
     if self._is_class_method:
         args = add_self_parameter(args)
-    
-    self.arguments_valid(*args, **kwargs)
         
-    kwargs = self.fill_up_arg_list(args, kwargs)
-    self._calls.append((args, kwargs))
+    if not self._canonical:
+        kwargs = self._bind(args, kwargs)
+        self._call_log.append(args, kwargs)
+        return self._find_setup_by_arguments(args, kwargs), args, tuple(kwargs), tuple(kwargs.values())
     
-    for setup in reversed(self._setups):
-        if setup.is_valid(*args, **kwargs):
-            return_value = setup.get_return_value(*args, **kwargs)
-            return return_value
+    names, values = self._canonical_call(args, kwargs)
+    self._call_log.append_record(args, names, values)
+    return self._find_setup(args + values), args, names, values
+
+@patch_to(FunctionMock)
+def __call__(self, *args, **kwargs):
+    if self._stats is not None:
+        return self._instrumented_call(args, kwargs)
+    return self._respond(*self._dispatch(args, kwargs))
 
 # %% ../../nbs/implementation/06_Verfiy.ipynb 2
+from collections import Counter, defaultdict, deque
+import math
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator
+from ..core import AnyCallable
+from ..argument_validators import ArgumentValidator
+from .recording import CallLog, CallRecord, ColumnarCallLog
 
-# %% ../../nbs/implementation/06_Verfiy.ipynb 18
-@dataclass
-class VerifiedCalls:
-    verified_calls: list[tuple[list[Any], dict[str, Any]]]
-    all_calls: list[tuple[list[Any], dict[str, Any]]]
+# %% ../../nbs/implementation/06_Verfiy.ipynb 19
+MAX_CALLS_IN_MESSAGE = 10
+MAX_VALUES_IN_MESSAGE = 3
+
+def _format_call(record: CallRecord, count: int) -> str:
+    return str(record) if count == 1 else f"{record} x {count}"
+
+class _Repr(str):
+    "Stands in for an unhashable value in a histogram"
+    def __repr__(self): return str(self)
+
+def _value_key(value: Any) -> Any:
+    "Histogram key of an argument value: equal values of the same type are counted together"
+    try:
+        hash(value)
+    except TypeError:
+        return type(value), _Repr(repr(value))
+    return type(value), value
+
+def _format_histogram(name: str, histogram: Counter) -> str:
+    common = histogram.most_common(MAX_VALUES_IN_MESSAGE)
+    values = ', '.join(f"{value!r} ({count})" for (_, value), count in common)
+    others = len(histogram) - len(common)
+    return f"Values of {name}: {values}" + (f", ... {others} more" if others else "")
+
+def _render_calls(title: str, counted: Iterable[tuple[CallRecord, int]], argument_names: tuple[str]|None = None) -> str:
+    "Renders calls given as `(record, count)` pairs. If there are too many, only the first and last ones are listed, followed by the most common values per argument."
+    first, last = [], deque(maxlen=MAX_CALLS_IN_MESSAGE // 2)
+    histograms = defaultdict(Counter)
+    total, entries = 0, 0
     
-    @property
-    def verified(self): return len(self.verified_calls)
+    for record, count in counted:
+        total += count
+        entries += 1
+        if len(first) < MAX_CALLS_IN_MESSAGE: first.append((record, count))
+        last.append((record, count))
+        
+        args, kwargs = record
+        for position, value in enumerate(args):
+            name = argument_names[position] if argument_names and position < len(argument_names) else f"#{position}"
+            if name != 'self': histograms[name][_value_key(value)] += count
+        for name, value in kwargs.items():
+            histograms[name][_value_key(value)] += count
+            
+    if entries <= MAX_CALLS_IN_MESSAGE:
+        lines = [_format_call(*entry) for entry in first]
+    else:
+        lines = [_format_call(*entry) for entry in first[:MAX_CALLS_IN_MESSAGE - len(last)]]
+        lines.append(f"... {entries - MAX_CALLS_IN_MESSAGE} more ...")
+        lines += [_format_call(*entry) for entry in last]
+        lines += [_format_histogram(name, histogram) for name, histogram in histograms.items()]
+    
+    return f"{title} ({total}):\n\t" + "\n\t".join(lines)
 
+# %% ../../nbs/implementation/06_Verfiy.ipynb 21
+class _CallCountAssertions:
+    "Assertions on the number of verified calls. Subclasses provide `verified`, `missing`, `pending` and the calls for error messages."
+    _argument_names = None # parameter names for error messages
+    
     def times(self, amount: int):
         """Asserts that the number of verified calls is  exactly `amount`"""
-        msg = self._build_error_msg(f"Expected {amount} calls, got {self.verified}.")
-        assert self.verified==amount, msg
+        self._assert_verified(lambda n: n == amount, lambda n: f"Expected {amount} calls, got {n}.",
+                              undecided=lambda n, missing: n <= amount <= n + missing)
         
     def never(self):
         """Asserts that no verified call was made"""
@@ -147,44 +529,434 @@ class VerifiedCalls:
         
     def more_than(self, lower_bound: int):
         """Asserts that more than `lower_bound` verified calls were made"""
-        msg = self._build_error_msg(f"Expected more than {lower_bound} calls, got {self.verified}.")
-        assert lower_bound < self.verified, msg
+        self._assert_verified(lambda n: lower_bound < n, lambda n: f"Expected more than {lower_bound} calls, got {n}.")
         
     def less_than(self, upper_bound: int):
         """Asserts that less than `upper_bound` verified calls were made"""
-        msg = self._build_error_msg(f"Expected less than {upper_bound} calls, got {self.verified}.")
-        assert self.verified < upper_bound, msg
+        self._assert_verified(lambda n: n < upper_bound, lambda n: f"Expected less than {upper_bound} calls, got {n}.")
         
     def more_than_or_equal_to(self, lower_bound: int):
         """Asserts that more than or equal to `lower_bound` verified calls were made"""
-        msg = self._build_error_msg(f"Expected at least {lower_bound} calls, got {self.verified}.")
-        assert lower_bound <= self.verified, msg
+        self._assert_verified(lambda n: lower_bound <= n, lambda n: f"Expected at least {lower_bound} calls, got {n}.")
         
     def less_than_or_equal_to(self, upper_bound: int):
         """Asserts that less than or equal to `upper_bound` verified calls were made"""
-        msg = self._build_error_msg(f"Expected at maximum {upper_bound} calls, got {self.verified}.")
-        assert self.verified <= upper_bound, msg
+        self._assert_verified(lambda n: n <= upper_bound, lambda n: f"Expected at maximum {upper_bound} calls, got {n}.")
+        
+    def _assert_verified(self, expectation: Callable[[int], bool], describe: Callable[[int], str], undecided: Callable[[int, int], bool]|None=None):
+        "Asserts that `expectation` holds for the number of verified calls. Raises a `CallHistoryError` if that depends on calls that were not recorded or not sent back by other processes yet. The error message is only built on failure."
+        pending, verified, missing = self.pending, self.verified, self.missing # pending first, so that no calls are sent back unnoticed in between
+        if missing or pending:
+            if undecided is None: # monotonic expectation, checking the bounds suffices
+                undecided = lambda n, missing: expectation(n) != expectation(n + missing)
+            if pending and undecided(verified, math.inf): # any number of calls might be pending
+                raise CallHistoryError(self._build_error_msg(f"{describe(verified)} The outcome depends on calls of {pending} other processes that were not sent back yet, see `flush_calls`."))
+            if undecided(verified, missing):
+                raise CallHistoryError(self._build_error_msg(f"{describe(verified)} The outcome depends on {missing} calls whose arguments were not recorded."))
+            
+        assert expectation(verified), self._build_error_msg(describe(verified))
         
     def _build_error_msg(self, general_msg: str) -> str:
-        calls_str = "Matched Calls:\n\t" + "\n\t".join(map(str, self.verified_calls))
-        total_calls_str = "All Calls:\n\t" + "\n\t".join(map(str, self.all_calls))
+        return "\n".join((general_msg,
+                          _render_calls("Matched Calls", self._counted_matches(), self._argument_names),
+                          _render_calls("All Calls", self._counted_calls(), self._argument_names)))
+
+@dataclass
+class VerifiedCalls(_CallCountAssertions):
+    verified_calls: list[tuple[list[Any], dict[str, Any]]]
+    all_calls: list[tuple[list[Any], dict[str, Any]]]
+    missing: int = 0 # number of calls that were not recorded
+    pending: int = 0 # number of other processes whose calls were not sent back yet, see `SharedCallLog`
+    
+    @property
+    def verified(self): return len(self.verified_calls)
+    
+    def _counted_matches(self) -> Iterable[tuple[CallRecord, int]]:
+        return ((call, 1) for call in self.verified_calls)
+    
+    def _counted_calls(self) -> Iterable[tuple[CallRecord, int]]:
+        return ((call, 1) for call in self.all_calls)
+
+# %% ../../nbs/implementation/06_Verfiy.ipynb 23
+class Verifier(_CallCountAssertions):
+    "Live verification of the calls to a function mock. Every check only validates the calls that were made since the previous check."
+    def __init__(self, function_mock: FunctionMock, matcher: AnyCallable[bool], validators: list[tuple[str, ArgumentValidator]]|None = None):
+        self._function_mock = function_mock
+        self._matcher = matcher
+        self._validators = validators # (parameter name, validator) pairs, for vectorized validation of columnar call logs
+        self._argument_names = function_mock._argument_names
+        
+        self._position = 0 # position in the call log up to which calls were validated
+        self._skipped = 0 # calls that were dropped from the call log before being validated
+        self._verified = 0 # matching calls up to `_position`, the calls themselves are not kept
+        self._cached_matches = {} # id(record) -> bool, for non-sequential call logs
+        self._call_log = function_mock._call_log # the call log that the state above refers to
+        
+    def __repr__(self):
+        return f"Verifier({self._function_mock._func.__qualname__}, verified={self.verified})"
+        
+    def _log(self) -> CallLog:
+        "The call log of the mock. Starts over if the mock was reset in the meantime."
+        call_log = self._function_mock._call_log
+        if call_log is not self._call_log:
+            self._call_log = call_log
+            self._position = self._skipped = self._verified = 0
+            self._cached_matches = {}
+        return call_log
+    
+    def _update(self) -> None:
+        "Validates the calls that were made since the last update"
+        call_log = self._log()
+        if not call_log.sequential: return
+        if self._validators is not None and isinstance(call_log, ColumnarCallLog):
+            total = call_log.total
+            self._verified += len(call_log.matching_rows(self._validators, self._position, total))
+            self._position = total
+            return
         
-        msg = "\n".join((general_msg, calls_str, total_calls_str))
-        return msg
+        self._position, skipped, records = call_log.since(self._position)
+        self._skipped += skipped
+        matcher = self._matcher
+        self._verified += sum(1 for record in records if matcher(*record.args, **record.kwargs))
+        
+    def _matches(self, record: CallRecord) -> bool:
+        "Cached validation of a record that represents a distinct argument list"
+        if id(record) not in self._cached_matches:
+            self._cached_matches[id(record)] = self._matcher(*record.args, **record.kwargs)
+        return self._cached_matches[id(record)]
+    
+    def _counted_matches(self) -> Iterator[tuple[CallRecord, int]]:
+        "Streams the matching calls that are kept by the call log"
+        call_log = self._log()
+        if call_log.sequential:
+            return ((record, count) for record, count in call_log.counted() if self._matcher(*record.args, **record.kwargs))
+        return ((record, count) for record, count in call_log.counted() if self._matches(record))
+    
+    def _counted_calls(self) -> Iterator[tuple[CallRecord, int]]:
+        return self._log().counted()
+    
+    @property
+    def verified(self) -> int:
+        call_log = self._log()
+        if call_log.sequential:
+            self._update()
+            return self._verified
+        return sum(count for record, count in call_log.counted() if self._matches(record))
+        
+    @property
+    def verified_calls(self) -> list[CallRecord]:
+        "The matching calls that are still kept by the call log"
+        return [record for record, count in self._counted_matches() for _ in range(count)]
+    
+    @property
+    def all_calls(self) -> list[CallRecord]:
+        "A copy of all calls that are kept by the call log, built on every access"
+        return self._function_mock._calls
+    
+    @property
+    def pending(self) -> int:
+        return getattr(self._log(), 'pending', 0)
+    
+    @property
+    def missing(self) -> int:
+        call_log = self._log()
+        if call_log.sequential:
+            self._update()
+            return self._skipped
+        return call_log.missing
 
-# %% ../../nbs/implementation/06_Verfiy.ipynb 19
+# %% ../../nbs/implementation/06_Verfiy.ipynb 24
 @patch_to(FunctionMock)
-def verify(self, *args, **kwargs) -> VerifiedCalls:
+def verify(self, *args, **kwargs) -> Verifier:
+    if not self._call_log.recorded:
+        raise CallHistoryError(f"Calls to {self._func.__qualname__} are not recorded (record='off'), so they can't be verified.")
+    
     kwargs = self.fill_up_arg_list(add_self_parameter(args), kwargs)
     args = (AnyArg(),) + args
-    sign_val = signature_validator_from_arguments(self._argument_names, *args, **kwargs)
+    signature_validator = signature_validator_from_arguments(self._argument_names, *args, **kwargs)
+    validators = signature_validator.by_parameter(self._argument_names)
     
-    calls = []
+    return Verifier(self, signature_validator.compile(), None if validators is None else list(zip(self._argument_names, validators)))
+
+# %% ../../nbs/implementation/08_instrumentation.ipynb 12
+from time import perf_counter
+
+# %% ../../nbs/implementation/08_instrumentation.ipynb 13
+@patch_to(FunctionMock)
+def _instrumented_call(self, args: tuple[Any], kwargs: dict[str, Any]) -> Any:
+    start = perf_counter()
+    setup, args, names, values = self._dispatch(args, kwargs)
+    matched = perf_counter()
+    
+    if setup is None:
+        self._stats.record(None, matched - start, 0.0)
+        return self._respond(None, args, names, values)
     
-    for call_args, call_kwargs in self._calls:
-        call_kwargs = self.fill_up_arg_list(call_args, call_kwargs)
+    try:
+        return self._respond(setup, args, names, values)
+    finally:
+        self._stats.record(setup, matched - start, perf_counter() - matched)
+
+# %% ../../nbs/implementation/09_bulk_calls.ipynb 24
+from itertools import repeat
+from typing import Sequence
+from .bulk import ColumnarCall, numpy_or_none, to_list
+
+# %% ../../nbs/implementation/09_bulk_calls.ipynb 26
+@patch_to(Setup)
+def _matching_rows(self, call: ColumnarCall, rows: Any, argument_names: tuple[str]) -> Any:
+    "Returns the subset of `rows` whose calls in `call` match this setup, `None` if its validators can't be split per parameter"
+    validators = self._signature_validator.by_parameter(argument_names)
+    return None if validators is None else call.matching_rows(validators, rows)
 
+@patch_to(FunctionMock)
+def _find_setups(self, call: ColumnarCall) -> list[Setup|None]:
+    "Returns the matching setup (or `None`) for every call in `call`"
+    np, n_rows = call.np, len(call)
+    setups = [None] * n_rows
+    pending = np.arange(n_rows)
+    hits = None
+    
+    if self._setup_index:
+        keys = zip(*(call.columns[name] for name in self._argument_names[int(self._is_class_method):]))
+        hits, indexable = [], []
+        for key in keys:
+            indexable.append(all(map(_is_indexable, key)))
+            hits.append(self._setup_index.get(key, -1) if indexable[-1] else -1)
+        hits, indexable = np.asarray(hits, dtype=np.int64), np.asarray(indexable, dtype=bool)
+        
+        for row in pending[~indexable].tolist():
+            setups[row] = self._find_setup(call.call(row))
+        pending = pending[indexable]
+        
+    resolved = np.zeros(n_rows, dtype=bool)
+    for position in reversed(self._fallback_setups):
+        if not len(pending): break
+        setup = self._setups[position]
+        candidates = pending if hits is None else pending[hits[pending] < position]
+        
+        matched = setup._matching_rows(call, candidates, self._argument_names)
+        if matched is None: continue
         
-        if sign_val.is_valid(*call_args, **call_kwargs):
-            calls.append((call_args, call_kwargs))
-    return VerifiedCalls(calls, self._calls)
\ No newline at end of file
+        for row in matched.tolist():
+            setups[row] = setup
+        resolved[matched] = True
+        pending = pending[~resolved[pending]]
+        
+    if hits is not None:
+        for row in pending[hits[pending] >= 0].tolist():
+            setups[row] = self._setups[hits[row]]
+    return setups
+
+# %% ../../nbs/implementation/09_bulk_calls.ipynb 28
+@patch_to(FunctionMock)
+def call_many(self, *columns: Sequence, **named_columns: Sequence) -> list[Any]:
+    "Calls the mock once per row of the given argument columns (lists, numpy arrays, ...) and returns the list of return values"
+    positional = [to_list(column) for column in columns]
+    named = {name: to_list(column) for name, column in named_columns.items()}
+    lengths = {len(column) for column in positional + list(named.values())}
+    if len(lengths) != 1:
+        raise ValueError("call_many needs at least one column and all columns need to have the same length")
+    n_rows = lengths.pop()
+    
+    np = numpy_or_none()
+    if np is None or not self._indexable or self._is_coroutine or self._stats is not None:
+        rows = zip(*positional) if positional else repeat((), n_rows)
+        named_rows = zip(*named.values()) if named else repeat((), n_rows)
+        return [self(*args, **dict(zip(named, values))) for args, values in zip(rows, named_rows)]
+    if n_rows == 0: return []
+    
+    if self._is_class_method:
+        positional.insert(0, [None] * n_rows)
+    args = list(zip(*positional)) if positional else [()] * n_rows
+    
+    names, first = self._canonical_call(args[0], {name: column[0] for name, column in named.items()}) # also checks the call shape
+    columns = dict(zip(self._argument_names, positional))
+    columns.update((name, named[name] if name in named else [value] * n_rows) for name, value in zip(names, first))
+    values = list(zip(*(columns[name] for name in names))) if names else [()] * n_rows
+    
+    self._call_log.extend(args, names, values)
+    call = ColumnarCall(np, args, names, values, columns)
+    
+    results = [None] * n_rows
+    for row, setup in enumerate(self._find_setups(call)):
+        if setup is None: continue
+        generator = setup._return_value_generator
+        if type(generator) is _ConstantReturnValue:
+            results[row] = generator.value
+        else:
+            results[row] = setup.get_return_value(*args[row], **call.kwargs(row))
+    return results
+
+# %% ../../nbs/implementation/11_templates.ipynb 2
+import copy
+
+# %% ../../nbs/implementation/11_templates.ipynb 8
+def _fresh_setup(setup: Setup) -> Setup:
+    "A copy of `setup` without hits, whose return sequence starts over"
+    setup = copy.copy(setup)
+    setup._hits = 0
+    generator = getattr(setup, '_return_value_generator', None)
+    if isinstance(generator, _SequenceReturnValues):
+        setup._return_value_generator = generator.fresh()
+    return setup
+
+class FunctionMockTemplate:
+    "Immutable snapshot of the setups of a `FunctionMock`, see `freeze`"
+    _per_mock = ('_call_log', '_setup_lock', '_stats')
+    
+    def __init__(self, mock: FunctionMock):
+        with mock._setup_lock:
+            self._state = {name: value for name, value in mock.__dict__.items() if name not in self._per_mock}
+            self._state.update(_setups=list(map(_fresh_setup, mock._setups)), _setup_index=dict(mock._setup_index),
+                               _fallback_setups=list(mock._fallback_setups), _fallback_signatures=dict(mock._fallback_signatures),
+                               _setups_shared=True)
+        self._instrumented = mock._stats is not None
+        self._stateful = [position for position, setup in enumerate(self._state['_setups'])
+                          if isinstance(getattr(setup, '_return_value_generator', None), _SequenceReturnValues)]
+        
+    def __repr__(self):
+        return f"FunctionMockTemplate({self._state['_func'].__qualname__}, setups={len(self._state['_setups'])})"
+        
+    def spawn(self) -> FunctionMock:
+        "Creates a mock with the setups of the template and an empty call log"
+        mock = FunctionMock.__new__(FunctionMock)
+        mock.__dict__.update(self._state)
+        mock._call_log = mock._new_call_log()
+        mock._setup_lock = threading.Lock()
+        mock._stats = FunctionStats(mock._func.__qualname__, setups=len(mock._setups)) if self._instrumented else None
+        
+        positions = range(len(mock._setups)) if self._instrumented else self._stateful # setups with state per mock
+        if positions:
+            mock._setups = list(mock._setups)
+            for position in positions:
+                mock._setups[position] = _fresh_setup(mock._setups[position])
+        return mock
+
+# %% ../../nbs/implementation/12_call_queries.ipynb 19
+from ..argument_validators import argument_validator_from_argument
+from .recording import ColumnarCallLog, SharedCallLog
+from .queries import CallQuery
+
+@patch_to(FunctionMock)
+def _query_validators(self, args: tuple[Any], kwargs: dict[str, Any]) -> list[tuple[str, ArgumentValidator]]:
+    "The `(parameter name, validator)` pairs for the given values or validators of a query"
+    names = self._argument_names[1:] if self._is_class_method else self._argument_names
+    if len(args) > len(names) or any(name not in names for name in kwargs):
+        raise TypeError(f"Arguments don't match the parameters of {self._func.__qualname__}: {names}")
+    
+    arguments = list(zip(names, args)) + list(kwargs.items())
+    return [(name, argument_validator_from_argument(argument, name, self._argument_names.index(name))) for name, argument in arguments]
+
+@patch_to(FunctionMock)
+def query(self, *args, **kwargs) -> CallQuery:
+    "Selects the recorded calls whose arguments match the given values or validators. Parameters that are not given match any value. Needs `record='columns'`."
+    call_log = self._call_log
+    if isinstance(call_log, SharedCallLog):
+        call_log.collect()
+        call_log = call_log._log
+    if not isinstance(call_log, ColumnarCallLog):
+        raise CallHistoryError(f"Calls to {self._func.__qualname__} can only be queried when they are recorded with record='columns'.")
+    return CallQuery(self, call_log, self._query_validators(args, kwargs))
+
+# %% ../../nbs/implementation/13_table_setups.ipynb 1
+import os
+from itertools import chain
+
+# %% ../../nbs/implementation/13_table_setups.ipynb 6
+class TableSetup(Setup):
+    "A setup for all rows of a table: calls whose arguments equal the values of a row return the value of its return column"
+    def __init__(self, key_names: tuple[str], rows: dict[Any, Any], argument_names: tuple[str]):
+        self._key_names = key_names # parameters with a column, in signature order
+        self._rows = rows # argument value(s) -> return value
+        self._argument_names = argument_names
+        self._key = itemgetter(*map(argument_names.index, key_names)) # selects the key from a canonical argument list
+        self._delay = 0
+        self._hits = 0
+        
+    def __getstate__(self) -> dict[str, Any]:
+        return dict(self.__dict__)
+    
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        
+    def __len__(self) -> int: return len(self._rows)
+        
+    def __repr__(self):
+        return f"TableSetup({', '.join(self._key_names)}: {len(self)} rows)"
+    
+    def _canonical_matcher(self, call: tuple[Any]) -> bool:
+        try:
+            return self._key(call) in self._rows
+        except TypeError: # unhashable argument
+            return False
+        
+    def _matcher(self, *args, **kwargs) -> bool:
+        "Checks a filled up argument list whose keyword arguments are in signature order"
+        return self._canonical_matcher(args + tuple(kwargs.values()))
+    
+    def _return_value_generator(self, *args, **kwargs) -> Any:
+        return self._rows[self._key(args + tuple(kwargs.values()))]
+    
+    def _matching_rows(self, call: ColumnarCall, rows: Any, argument_names: tuple[str]) -> Any:
+        matches = [self._canonical_matcher(call.call(row)) for row in rows.tolist()]
+        return rows[call.np.asarray(matches, dtype=bool)]
+
+# %% ../../nbs/implementation/13_table_setups.ipynb 8
+def _parse_bool(value: str) -> bool:
+    return value.strip().lower() in ('1', 'true', 'yes')
+
+_CSV_CONVERTERS = {int: int, float: float, bool: _parse_bool} # annotation -> conversion of the strings in CSV files
+
+def _read_csv(path: str|os.PathLike) -> Iterator[list[str]]:
+    import csv
+    with open(path, newline='') as file:
+        yield from csv.reader(file)
+
+def _table_rows(table: Any) -> tuple[tuple[str], Iterable[tuple[Any]], bool]:
+    "Returns the column names and an iterable of the rows of `table`, and whether its values are strings from a CSV file"
+    if isinstance(table, (str, os.PathLike)) or hasattr(table, 'read'):
+        import csv # only tables from CSV files pay for the import
+        rows = _read_csv(table) if isinstance(table, (str, os.PathLike)) else csv.reader(table)
+        return tuple(next(rows, ())), rows, True
+    
+    if hasattr(table, 'items'): # columns
+        names, columns = tuple(table), [to_list(column) for _, column in table.items()]
+        if len({len(column) for column in columns}) > 1:
+            raise ValueError("All columns of the table need to have the same length")
+        return names, zip(*columns), False
+    
+    records = iter(table)
+    first = next(records, {})
+    names = tuple(first)
+    return names, map(itemgetter(*names), chain([first], records)) if len(names) > 1 else (), False
+
+# %% ../../nbs/implementation/13_table_setups.ipynb 9
+@patch_to(FunctionMock)
+def setup_many(self, table: Any, returns: str, converters: dict[str, Callable[[Any], Any]]|None = None) -> TableSetup:
+    "Adds one setup for all rows of `table`: calls with the argument values of a row return the value of its column `returns`"
+    if self._spec.has_var_arguments:
+        raise ValueError(f"setup_many needs the parameter names of a function without *args or **kwargs")
+    names, rows, from_csv = _table_rows(table)
+    parameters = self._argument_names[1:] if self._is_class_method else self._argument_names
+    if returns not in names:
+        raise ValueError(f"The table has no return value column {returns!r}, its columns are {names}")
+    unknown = [name for name in names if name != returns and name not in parameters]
+    if unknown:
+        raise ValueError(f"The columns {unknown} are not parameters of {self._func.__qualname__}: {parameters}")
+    key_names = tuple(name for name in parameters if name in names)
+    if not key_names:
+        raise ValueError("The table needs at least one column of argument values")
+    
+    annotations = {name: self._signature.parameters[name].annotation for name in key_names}
+    annotations[returns] = self._signature.return_annotation
+    converters = {**({name: _CSV_CONVERTERS[annotation] for name, annotation in annotations.items() if annotation in _CSV_CONVERTERS} if from_csv else {}),
+                  **(converters or {})}
+    if converters:
+        functions = [converters.get(name) for name in names]
+        rows = (tuple(value if function is None else function(value) for function, value in zip(functions, row)) for row in rows)
+    
+    key, value = itemgetter(*map(names.index, key_names)), itemgetter(names.index(returns))
+    setup = TableSetup(key_names, {key(row): value(row) for row in rows}, self._argument_names)
+    self._add_setup(setup, None)
+    return setup
\ No newline at end of file
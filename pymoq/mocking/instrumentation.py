@@ -0,0 +1,127 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/implementation/08_instrumentation.ipynb.
+
+# %% auto 0
+__all__ = ['instrumentation_enabled', 'FunctionStats', 'stats', 'summary', 'print_summary']
+
+# %% ../../nbs/implementation/08_instrumentation.ipynb 2
+import atexit
+import os
+import queue
+import sys
+import threading
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, TextIO
+
+# %% ../../nbs/implementation/08_instrumentation.ipynb 7
+_ENABLED_BY_DEFAULT = os.environ.get('PYMOQ_INSTRUMENT', '') not in ('', '0')
+
+def instrumentation_enabled(instrument: bool|None) -> bool:
+    "Resolves the `instrument` argument of mocks, `None` uses the `PYMOQ_INSTRUMENT` environment variable"
+    return _ENABLED_BY_DEFAULT if instrument is None else instrument
+
+# %% ../../nbs/implementation/08_instrumentation.ipynb 10
+_all_stats = weakref.WeakSet() # statistics of the instrumented mocks that are alive
+_collected_stats = queue.SimpleQueue() # (function name, totals) of garbage collected mocks, `put` is safe in `__del__`
+_collected_totals = {} # function name -> totals of the garbage collected mocks
+_all_stats_lock = threading.Lock()
+_summary_registered = False
+
+def _add_totals(totals: dict[str, list], name: str, values: tuple) -> None:
+    total = totals.setdefault(name, [0, 0, 0, 0.0, 0.0, 0, 0])
+    for i, value in enumerate(values):
+        total[i] += value
+
+def _fold_collected_stats() -> None:
+    "Adds the statistics of garbage collected mocks to the totals, needs `_all_stats_lock`"
+    while not _collected_stats.empty():
+        _add_totals(_collected_totals, *_collected_stats.get())
+
+@dataclass(eq=False)
+class FunctionStats:
+    "Usage statistics of an instrumented function mock"
+    name: str
+    calls: int = 0
+    unmatched: int = 0
+    matching_seconds: float = 0.0
+    return_value_seconds: float = 0.0
+    setups: int = 0
+    setups_hit: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    
+    def __post_init__(self):
+        global _summary_registered
+        with _all_stats_lock:
+            if not _summary_registered:
+                atexit.register(print_summary)
+                _summary_registered = True
+            _fold_collected_stats()
+            _all_stats.add(self)
+    
+    def __del__(self):
+        if _collected_stats is not None: # None while the interpreter shuts down
+            _collected_stats.put((self.name, self.totals()))
+    
+    def totals(self) -> tuple:
+        "Returns the number of mocks (1), calls, unmatched calls, matching and return value seconds, setups and setups that were never hit"
+        return (1, self.calls, self.unmatched, self.matching_seconds, self.return_value_seconds, self.setups, self.setups - self.setups_hit)
+    
+    def __getstate__(self) -> dict[str, Any]:
+        return {name: value for name, value in self.__dict__.items() if name != '_lock'}
+    
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state, _lock=threading.Lock())
+        self.__post_init__() # copies in other processes are reported there
+    
+    def record(self, setup: Any, matching_seconds: float, return_value_seconds: float) -> None:
+        "Records a call that was matched by `setup` (or `None`)"
+        with self._lock:
+            self.calls += 1
+            self.matching_seconds += matching_seconds
+            self.return_value_seconds += return_value_seconds
+            if setup is None:
+                self.unmatched += 1
+            else:
+                if setup._hits == 0:
+                    self.setups_hit += 1
+                setup._hits += 1
+
+# %% ../../nbs/implementation/08_instrumentation.ipynb 19
+def _function_mock_stats(function_mock: Any) -> dict[str, Any]:
+    stats = function_mock._stats
+    if stats is None:
+        raise ValueError(f"{function_mock._func.__qualname__} is not instrumented, construct the mock with instrument=True")
+    return {'calls': stats.calls,
+            'unmatched': stats.unmatched,
+            'matching_seconds': stats.matching_seconds,
+            'return_value_seconds': stats.return_value_seconds,
+            'setups': [{'setup': setup, 'hits': setup.hits} for setup in function_mock._setups]}
+
+def stats(mock: Any) -> dict[str, Any]:
+    "Returns the usage statistics of an instrumented `Mock` (per method) or `FunctionMock`"
+    if hasattr(mock, '_function_mocks'):
+        return {name: _function_mock_stats(function_mock) for name, function_mock in mock._function_mocks.items()}
+    return _function_mock_stats(mock)
+
+# %% ../../nbs/implementation/08_instrumentation.ipynb 22
+def summary(limit: int=20) -> str:
+    "Summarizes the statistics of all instrumented mocks, aggregated per function"
+    with _all_stats_lock:
+        _fold_collected_stats()
+        totals = {name: list(total) for name, total in _collected_totals.items()}
+        all_stats = list(_all_stats)
+    for stats in all_stats:
+        _add_totals(totals, stats.name, stats.totals())
+    
+    lines = [f"{'function':<40} {'mocks':>6} {'calls':>9} {'unmatched':>9} {'match ms':>9} {'return ms':>9} {'setups':>6} {'never hit':>9}"]
+    by_time = sorted(totals.items(), key=lambda item: item[1][3] + item[1][4], reverse=True)
+    for name, (mocks, calls, unmatched, matching, returning, setups, never_hit) in by_time[:limit]:
+        lines.append(f"{name:<40} {mocks:>6} {calls:>9} {unmatched:>9} {matching*1e3:>9.1f} {returning*1e3:>9.1f} {setups:>6} {never_hit:>9}")
+    if len(by_time) > limit:
+        lines.append(f"... {len(by_time) - limit} more")
+    return '\n'.join(lines)
+
+def print_summary(file: TextIO|None = None) -> None:
+    "Prints the summary of all instrumented mocks (to stderr by default)"
+    if _all_stats or _collected_totals or not _collected_stats.empty():
+        print(f"pymoq instrumentation summary\n{summary()}", file=file or sys.stderr)
@@ -1,12 +1,15 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/implementation/05_mocking_objects.ipynb.
 
 # %% auto 0
-__all__ = ['get_public_names', 'get_public_attributes', 'Mock']
+__all__ = ['get_public_names', 'get_public_attributes', 'Mock', 'MockTemplate']
 
 # %% ../../nbs/implementation/05_mocking_objects.ipynb 2
 from .functions import FunctionMock
+import inspect
+from typing import Any
+from weakref import WeakKeyDictionary
 
-from fastcore.basics import patch_to
+from ..core import AnyCallable, patch_to
 
 # %% ../../nbs/implementation/05_mocking_objects.ipynb 9
 from typing import Protocol
@@ -27,28 +30,132 @@ def get_public_attributes(protocol: type(Protocol)) -> list[str]:
     attributes =  [name for name in protocol.__annotations__.keys() if _is_public_name(name)]
     return attributes
 
-# %% ../../nbs/implementation/05_mocking_objects.ipynb 34
+# %% ../../nbs/implementation/05_mocking_objects.ipynb 25
+_public_names_cache = WeakKeyDictionary()
+
+def _cached_public_names(protocol: type) -> frozenset[str]:
+    "Returns the (cached) set of public names of the given class"
+    if protocol not in _public_names_cache:
+        _public_names_cache[protocol] = frozenset(get_public_names(protocol))
+    return _public_names_cache[protocol]
+
+# %% ../../nbs/implementation/05_mocking_objects.ipynb 38
 class Mock:
-    def __init__(self, protocol: type(Protocol)):
+    _attributes: frozenset[str] = frozenset() # annotated attributes of the protocol, see `_mock_class`
+    _attribute_defaults: dict[str, Any] = {}
+    _configure_function_mock: AnyCallable[None]|None = None # called with the name and the function mock of a method when it is created, see `replay`
+    
+    def __init__(self, protocol: type(Protocol), record: str|int='full', concurrent: bool=False, instrument: bool|None=None, shared: bool=False):
         self._protocol = protocol
-        self._init_function_mocks(self._protocol)
-        
-    def _init_function_mocks(self, protocol: type(Protocol)):
-        public_names = get_public_names(protocol)
-        self._function_mocks = {
-            name: FunctionMock(getattr(protocol, name))
-            for name in public_names
-        }
+        self._public_names = _cached_public_names(protocol)
+        self._function_mocks = {}
+        self._record = record
+        self._concurrent = concurrent
+        self._instrument = instrument
+        self._shared = shared
     
     def __str__(self):
         return f'Mock[{self._protocol.__name__}]'
     
     def __repr__(self): return str(self)
 
-# %% ../../nbs/implementation/05_mocking_objects.ipynb 37
+# %% ../../nbs/implementation/05_mocking_objects.ipynb 41
 @patch_to(Mock)
-def __getattr__(self, name: str) -> FunctionMock:
+def __getattr__(self, name: str) -> FunctionMock|Any:
+    if name.startswith('_'):
+        # never a protocol method, also prevents recursion while `__init__` didn't run (e.g. when copying)
+        raise AttributeError(f"Name {name} not found in {type(self).__name__}")
+    
+    if name in self._attributes:
+        if name in self._attribute_defaults: return self._attribute_defaults[name]
+        raise AttributeError(f"Attribute {name} of {self} was not set")
+    
     if name not in self._function_mocks:
-        raise AttributeError(f"Name {name} not found in {self}")
+        if name not in self._public_names:
+            raise AttributeError(f"Name {name} not found in {self}")
+        function_mock = FunctionMock(getattr(self._protocol, name), record=self._record, concurrent=self._concurrent, instrument=self._instrument, shared=self._shared)
+        if self._configure_function_mock is not None: self._configure_function_mock(name, function_mock)
+        return self._function_mocks.setdefault(name, function_mock) # the first thread to create the mock wins
         
     return self._function_mocks[name]
+del __getattr__ # not the attribute lookup of this module
+
+# %% ../../nbs/implementation/05_mocking_objects.ipynb 50
+class _MethodMock:
+    "Non-data descriptor for a protocol method. Creates the function mock on first access and stores it in the instance."
+    def __init__(self, name: str):
+        self.name = name
+        
+    def __get__(self, mock: Mock|None, owner: type|None = None) -> Any:
+        if mock is None: return self
+        function_mock = mock.__dict__[self.name] = Mock.__getattr__(mock, self.name)
+        return function_mock
+
+def _protocol_attributes(protocol: type) -> dict[str, Any]:
+    "Returns the public attributes of `protocol` (annotated or non-callable class variables) and their defaults, `inspect.Parameter.empty` if there is none"
+    names = [name for base in reversed(protocol.__mro__) if '__annotations__' in vars(base) for name in get_public_attributes(base)]
+    names += [name for name in sorted(_cached_public_names(protocol)) if not callable(getattr(protocol, name))]
+    attributes = {}
+    for name in names:
+        default = inspect.getattr_static(protocol, name, inspect.Parameter.empty)
+        attributes[name] = inspect.Parameter.empty if hasattr(default, '__get__') else default # e.g. properties
+    return attributes
+
+_mock_classes = WeakKeyDictionary()
+
+def _mock_class(protocol: type) -> type:
+    "Returns the (cached) subclass of `Mock` for `protocol`"
+    if protocol not in _mock_classes:
+        attributes = _protocol_attributes(protocol)
+        namespace = {name: _MethodMock(name) for name in _cached_public_names(protocol) if name not in attributes}
+        namespace.update(__slots__=tuple(attributes), __module__=Mock.__module__, __qualname__=f'Mock[{protocol.__qualname__}]',
+                         __class__=property(lambda self: self._protocol),
+                         _attributes=frozenset(attributes),
+                         _attribute_defaults={name: default for name, default in attributes.items() if default is not inspect.Parameter.empty})
+        _mock_classes[protocol] = type(f'Mock[{protocol.__name__}]', (Mock,), namespace)
+    return _mock_classes[protocol]
+
+@patch_to(Mock)
+def __new__(cls, protocol: type(Protocol), *args, **kwargs) -> Mock:
+    return object.__new__(_mock_class(protocol) if cls is Mock else cls)
+
+# %% ../../nbs/implementation/05_mocking_objects.ipynb 58
+@patch_to(Mock)
+def __getstate__(self) -> dict:
+    if self._shared: # copies have to send back the calls of all methods
+        for name in self._public_names:
+            if callable(getattr(self._protocol, name, None)): getattr(self, name)
+    return self.__dict__
+
+def _new_mock(protocol: type) -> Mock:
+    "Creates an uninitialized mock of `protocol`, for unpickling"
+    return Mock.__new__(Mock, protocol)
+
+@patch_to(Mock)
+def __reduce__(self):
+    # the generated classes can't be pickled by name, the copy generates its own
+    attributes = {name: getattr(self, name) for name in self._attributes if hasattr(self, name)}
+    return _new_mock, (self._protocol,), (self.__getstate__(), attributes)
+
+# %% ../../nbs/implementation/11_templates.ipynb 22
+from .functions import FunctionMockTemplate
+
+class MockTemplate:
+    "Immutable snapshot of a configured `Mock`, see `freeze`"
+    def __init__(self, mock: Mock):
+        function_mocks = dict(mock._function_mocks)
+        self._protocol = mock._protocol
+        self._state = {name: value for name, value in vars(mock).items() if name != '_function_mocks' and name not in function_mocks}
+        self._attributes = {name: getattr(mock, name) for name in mock._attributes if hasattr(mock, name)}
+        self._function_mocks = {name: FunctionMockTemplate(function_mock) for name, function_mock in function_mocks.items()}
+        
+    def __repr__(self): return f'MockTemplate[{self._protocol.__name__}]'
+        
+    def spawn(self) -> Mock:
+        "Creates a mock with the setups and attributes of the template and empty call logs"
+        mock = _new_mock(self._protocol)
+        mock.__dict__.update(self._state)
+        mock._function_mocks = {name: template.spawn() for name, template in self._function_mocks.items()}
+        for name, value in self._attributes.items():
+            setattr(mock, name, value)
+        return mock
\ No newline at end of file
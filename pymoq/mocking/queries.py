@@ -0,0 +1,72 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/implementation/12_call_queries.ipynb.
+
+# %% auto 0
+__all__ = ['CallQuery']
+
+# %% ../../nbs/implementation/12_call_queries.ipynb 2
+from collections import Counter
+from typing import Any
+
+from ..argument_validators import ArgumentValidator
+from .bulk import numpy_or_none
+from .recording import ColumnarCallLog
+
+# %% ../../nbs/implementation/12_call_queries.ipynb 18
+def _concatenate(rows: Any, new: Any) -> Any:
+    "Appends the row indices `new` to `rows` (numpy arrays or lists)"
+    if not len(rows): return new
+    if isinstance(rows, list): return rows + new
+    return numpy_or_none().concatenate((rows, new))
+
+class CallQuery:
+    "The recorded calls of a function mock whose arguments are valid for a set of validators, see `FunctionMock.query`"
+    def __init__(self, function_mock: Any, call_log: ColumnarCallLog, validators: list[tuple[str, ArgumentValidator]]):
+        self._function_mock = function_mock
+        self._call_log = call_log
+        self._validators = validators # (parameter name, validator) pairs
+        self._validated = 0 # number of calls that were validated
+        self._rows = []
+        
+    def __repr__(self):
+        return f"CallQuery({self._function_mock._func.__qualname__}: {', '.join(f'{name}={validator}' for name, validator in self._validators)})"
+    
+    def rows(self) -> Any:
+        "Positions of the matching calls in the call history, validates the calls that were made since the last time"
+        total = self._call_log.total
+        if self._validated < total:
+            self._rows = _concatenate(self._rows, self._call_log.matching_rows(self._validators, self._validated, total))
+            self._validated = total
+        return self._rows
+    
+    def where(self, *args, **kwargs) -> "CallQuery":
+        "Selects the matching calls whose arguments also match the given values or validators"
+        return CallQuery(self._function_mock, self._call_log, self._validators + self._function_mock._query_validators(args, kwargs))
+    
+    def count(self) -> int:
+        return len(self.rows())
+    
+    def first(self) -> int|None:
+        rows = self.rows()
+        return int(rows[0]) if len(rows) else None
+    
+    def last(self) -> int|None:
+        rows = self.rows()
+        return int(rows[-1]) if len(rows) else None
+    
+    def group_by(self, name: str) -> dict[Any, int]:
+        "Number of matching calls per value of parameter `name`"
+        if name not in self._call_log.argument_names:
+            raise ValueError(f"{self._function_mock._func.__qualname__} has no parameter {name!r}")
+        rows, np = self.rows(), numpy_or_none()
+        array = None if np is None else self._call_log.array(name, np)
+        if array is None or array.dtype.kind not in 'biuf': # sorting strings is slower than counting them
+            column = self._call_log.column(name)
+            return dict(Counter(map(column.__getitem__, rows if isinstance(rows, list) else rows.tolist())))
+        
+        values, first, counts = np.unique(array[rows], return_index=True, return_counts=True)
+        order = np.argsort(first, kind='stable')
+        return dict(zip(values[order].tolist(), counts[order].tolist()))
+    
+    def distinct(self, name: str) -> list[Any]:
+        "The values of parameter `name` in the matching calls"
+        return list(self.group_by(name))
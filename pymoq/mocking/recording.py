@@ -0,0 +1,619 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/implementation/07_call_recording.ipynb.
+
+# %% auto 0
+__all__ = ['CallRecord', 'CallLog', 'RingCallLog', 'CountingCallLog', 'NoCallLog', 'CallHistoryError', 'ConcurrentCallLog', 'UnpicklableArgument', 'SpoolCallLog', 'flush_calls', 'sends_calls', 'SharedCallLog', 'call_log', 'ColumnarCallLog']
+
+# %% ../../nbs/implementation/07_call_recording.ipynb 2
+from collections import Counter, deque
+from functools import partial
+from itertools import groupby, islice, repeat
+import os
+import threading
+import time
+import weakref
+from typing import Any, Callable, Iterator
+
+# %% ../../nbs/implementation/07_call_recording.ipynb 8
+class CallRecord:
+    "A recorded call. The keyword argument names are shared between all records of the same call shape."
+    __slots__ = ('args', '_names', '_values')
+    
+    def __init__(self, args: tuple[Any], names: tuple[str], values: tuple[Any]):
+        self.args = args
+        self._names = names
+        self._values = values
+        
+    @property
+    def kwargs(self) -> dict[str, Any]:
+        return dict(zip(self._names, self._values))
+    
+    def __iter__(self) -> Iterator:
+        yield self.args
+        yield self.kwargs
+        
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (CallRecord, tuple)): return tuple(self) == tuple(other)
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __repr__(self): return repr(tuple(self))
+
+# %% ../../nbs/implementation/07_call_recording.ipynb 12
+class CallLog:
+    "Keeps every call as a compact `CallRecord`"
+    recorded = True
+    sequential = True
+    
+    def __init__(self):
+        self._records = []
+        self._shapes = {}
+        
+    def _names(self, kwargs: dict[str, Any]) -> tuple[str]:
+        "Returns the shared tuple of keyword argument names for `kwargs`"
+        names = tuple(kwargs)
+        return self._shapes.setdefault(names, names)
+        
+    def append(self, args: tuple[Any], kwargs: dict[str, Any]) -> None:
+        "Records a call with the given (filled up) argument list"
+        self.append_record(args, self._names(kwargs), tuple(kwargs.values()))
+        
+    def append_record(self, args: tuple[Any], names: tuple[str], values: tuple[Any]) -> None:
+        "Records a call given as positional arguments and keyword argument values. `names` has to be shared between calls of the same shape."
+        self._records.append(CallRecord(args, names, values))
+        
+    def extend(self, args: list[tuple[Any]], names: tuple[str], values: list[tuple[Any]]) -> None:
+        "Records many calls of the same shape at once: positional arguments and keyword argument values per call"
+        names = self._shapes.setdefault(names, names)
+        self._records.extend(map(CallRecord, args, repeat(names), values))
+        
+    @property
+    def total(self) -> int:
+        "Number of calls that were made"
+        return len(self._records)
+    
+    @property
+    def missing(self) -> int:
+        "Number of calls whose arguments were not kept"
+        return 0
+    
+    def counted(self) -> Iterator[tuple[CallRecord, int]]:
+        "Iterates over the kept calls together with the number of times each of them was made"
+        for record in self._records:
+            yield record, 1
+            
+    def since(self, position: int) -> tuple[int, int, Iterator[CallRecord]]:
+        "Returns the current position, the number of calls after `position` that are no longer kept and the kept calls after `position`"
+        total = len(self._records)
+        return total, 0, (self._records[i] for i in range(position, total))
+            
+    def __iter__(self) -> Iterator[CallRecord]:
+        return iter(self._records)
+
+# %% ../../nbs/implementation/07_call_recording.ipynb 17
+class RingCallLog(CallLog):
+    "Keeps only the last `maxlen` calls"
+    def __init__(self, maxlen: int):
+        super().__init__()
+        self._records = deque(maxlen=maxlen)
+        self._total = 0
+        
+    def append_record(self, args: tuple[Any], names: tuple[str], values: tuple[Any]) -> None:
+        self._total += 1
+        super().append_record(args, names, values)
+        
+    def extend(self, args: list[tuple[Any]], names: tuple[str], values: list[tuple[Any]]) -> None:
+        self._total += len(args)
+        super().extend(args, names, values)
+        
+    @property
+    def total(self) -> int: return self._total
+    
+    @property
+    def missing(self) -> int: return self._total - len(self._records)
+    
+    def since(self, position: int) -> tuple[int, int, Iterator[CallRecord]]:
+        first_kept = self._total - len(self._records)
+        start = max(position, first_kept)
+        newest = list(islice(reversed(self._records), self._total - start))
+        return self._total, start - position, reversed(newest)
+
+# %% ../../nbs/implementation/07_call_recording.ipynb 21
+class CountingCallLog(CallLog):
+    "Keeps the number of calls per distinct argument list"
+    sequential = False
+    
+    def __init__(self):
+        super().__init__()
+        self._counts = Counter()
+        self._records = {}
+        self._total = 0
+        self._missing = 0
+        
+    def append_record(self, args: tuple[Any], names: tuple[str], values: tuple[Any]) -> None:
+        self._count(args, names, values)
+        
+    def extend(self, args: list[tuple[Any]], names: tuple[str], values: list[tuple[Any]]) -> None:
+        names = self._shapes.setdefault(names, names)
+        for call_args, call_values in zip(args, values):
+            self._count(call_args, names, call_values)
+        
+    def _count(self, args: tuple[Any], names: tuple[str], values: tuple[Any]) -> None:
+        self._total += 1
+        key = (args, names, values, tuple(map(type, args)) + tuple(map(type, values)))
+        try:
+            self._counts[key] += 1
+        except TypeError: # unhashable arguments
+            self._missing += 1
+            return
+        
+        if key not in self._records:
+            self._records[key] = CallRecord(*key[:3])
+            
+    @property
+    def total(self) -> int: return self._total
+    
+    @property
+    def missing(self) -> int: return self._missing
+    
+    def counted(self) -> Iterator[tuple[CallRecord, int]]:
+        for key, count in list(self._counts.items()):
+            yield self._records[key], count
+            
+    def since(self, position: int) -> tuple[int, int, Iterator[CallRecord]]:
+        "The order of the calls isn't kept, so all calls after `position` count as not kept"
+        return self._total, self._total - position, iter(())
+            
+    def __iter__(self) -> Iterator[CallRecord]:
+        for record, count in self.counted():
+            for _ in range(count): yield record
+
+# %% ../../nbs/implementation/07_call_recording.ipynb 25
+class NoCallLog(CallLog):
+    "Doesn't keep any information about calls"
+    recorded = False
+    
+    def append(self, args: tuple[Any], kwargs: dict[str, Any]) -> None:
+        pass
+    
+    def append_record(self, args: tuple[Any], names: tuple[str], values: tuple[Any]) -> None:
+        pass
+    
+    def extend(self, args: list[tuple[Any]], names: tuple[str], values: list[tuple[Any]]) -> None:
+        pass
+
+# %% ../../nbs/implementation/07_call_recording.ipynb 26
+class CallHistoryError(Exception):
+    "Raised if a verification depends on calls that were not recorded"
+
+# %% ../../nbs/implementation/07_call_recording.ipynb 29
+class ConcurrentCallLog:
+    "Thread-safe call log: every thread records into its own buffer, buffers are merged when read"
+    def __init__(self, new_log: Callable[[], CallLog]):
+        self._new_log = new_log
+        self._local = threading.local()
+        self._buffers = [] # (lock, call log) per thread
+        self._buffers_lock = threading.Lock()
+        
+        template = new_log()
+        self.recorded = template.recorded
+        self.sequential = template.sequential
+        
+    def _buffer(self) -> tuple[threading.Lock, CallLog]:
+        "Returns the buffer of the current thread"
+        try:
+            return self._local.buffer
+        except AttributeError:
+            buffer = self._local.buffer = (threading.Lock(), self._new_log())
+            with self._buffers_lock:
+                self._buffers.append(buffer)
+            return buffer
+        
+    def append(self, args: tuple[Any], kwargs: dict[str, Any]) -> None:
+        lock, log = self._buffer()
+        with lock:
+            log.append(args, kwargs)
+            
+    def append_record(self, args: tuple[Any], names: tuple[str], values: tuple[Any]) -> None:
+        lock, log = self._buffer()
+        with lock:
+            log.append_record(args, names, values)
+            
+    def extend(self, args: list[tuple[Any]], names: tuple[str], values: list[tuple[Any]]) -> None:
+        lock, log = self._buffer()
+        with lock:
+            log.extend(args, names, values)
+            
+    def __getstate__(self) -> dict[str, Any]:
+        return {'new_log': self._new_log, 'logs': [log for _, log in self._all_buffers()]}
+    
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(state['new_log'])
+        self._buffers = [(threading.Lock(), log) for log in state['logs']] # new threads get new buffers
+            
+    def _all_buffers(self) -> list[tuple[threading.Lock, CallLog]]:
+        with self._buffers_lock:
+            return list(self._buffers)
+            
+    def _read(self, read: Callable[[CallLog], Any]) -> list[Any]:
+        "Applies `read` to the call log of every buffer while it is locked"
+        results = []
+        for lock, log in self._all_buffers():
+            with lock:
+                results.append(read(log))
+        return results
+    
+    @property
+    def total(self) -> int: return sum(self._read(lambda log: log.total))
+    
+    @property
+    def missing(self) -> int: return sum(self._read(lambda log: log.missing))
+    
+    def counted(self) -> Iterator[tuple[CallRecord, int]]:
+        for counted in self._read(lambda log: list(log.counted())):
+            yield from counted
+            
+    def since(self, position: tuple[int]|int) -> tuple[tuple[int], int, Iterator[CallRecord]]:
+        "Like `CallLog.since`, with one position per buffer. `0` is the start position of every call log."
+        buffers = self._all_buffers()
+        positions = list(position) if position else []
+        positions += [0] * (len(buffers) - len(positions))
+        
+        skipped, records = 0, []
+        for i, (lock, log) in enumerate(buffers):
+            with lock:
+                positions[i], buffer_skipped, buffer_records = log.since(positions[i])
+                records.extend(buffer_records)
+            skipped += buffer_skipped
+            
+        return tuple(positions), skipped, iter(records)
+    
+    def __iter__(self) -> Iterator[CallRecord]:
+        for records in self._read(list):
+            yield from records
+
+# %% ../../nbs/implementation/07_call_recording.ipynb 35
+class UnpicklableArgument:
+    "Stands in for an argument of a call in another process that couldn't be pickled"
+    def __init__(self, description: str):
+        self.description = description
+        
+    def __repr__(self): return f'UnpicklableArgument({self.description})'
+
+def _picklable(value: Any) -> Any:
+    import pickle
+    try:
+        pickle.dumps(value)
+    except Exception:
+        return UnpicklableArgument(repr(value))
+    return value
+
+def _write_spool(directory: str, pending: deque) -> None:
+    "Writes the pending `(args, names, values)` calls to a new file in the spool `directory`"
+    batch = []
+    while pending:
+        batch.append(pending.popleft())
+    if not batch: return
+    
+    import pickle, tempfile # only processes that share calls pay for the imports
+    try:
+        data = pickle.dumps(batch, pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        batch = [(tuple(map(_picklable, args)), names, tuple(map(_picklable, values))) for args, names, values in batch]
+        data = pickle.dumps(batch, pickle.HIGHEST_PROTOCOL)
+    
+    try:
+        handle, path = tempfile.mkstemp(prefix=f'{time.time_ns()}-', suffix='.tmp', dir=directory)
+    except FileNotFoundError: # the original call log is gone
+        return
+    with os.fdopen(handle, 'wb') as file:
+        file.write(data)
+    os.replace(path, path[:-len('.tmp')] + '.calls') # readers only see complete batches
+
+class _Spool:
+    "The calls of a `SpoolCallLog` that were not written yet. Until they are written, a marker file in the spool directory tells the original call log that calls are pending."
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.calls = deque() # (args, names, values)
+        self.marker = None # path of the marker file
+        
+    def mark(self) -> None:
+        marker = os.path.join(self.directory, f'{os.getpid()}-{id(self)}.pending')
+        try:
+            open(marker, 'w').close()
+        except FileNotFoundError: # the original call log is gone
+            return
+        self.marker = marker
+        
+    def write(self) -> None:
+        _write_spool(self.directory, self.calls)
+        if self.marker is not None:
+            try:
+                os.remove(self.marker)
+            except FileNotFoundError:
+                pass
+            self.marker = None
+
+# %% ../../nbs/implementation/07_call_recording.ipynb 36
+_spool_logs = weakref.WeakSet() # the spool call logs of this process, see `flush_calls`
+
+class SpoolCallLog:
+    "Records calls in `new_log()` and writes them to the spool `directory` of a `SharedCallLog` in batches"
+    def __init__(self, directory: str, new_log: Callable[[], CallLog], batch_size: int = 1000):
+        self._directory = directory
+        self._new_log = new_log
+        self._batch_size = batch_size
+        
+        self._log = new_log()
+        self.recorded = self._log.recorded
+        self.sequential = self._log.sequential
+        self._shapes = {}
+        self._spool = _Spool(directory)
+        from multiprocessing import util
+        util.Finalize(self, self._spool.write, exitpriority=10)
+        _spool_logs.add(self)
+        
+    def __reduce__(self):
+        return SpoolCallLog, (self._directory, self._new_log, self._batch_size)
+        
+    def append(self, args: tuple[Any], kwargs: dict[str, Any]) -> None:
+        names = tuple(kwargs)
+        self.append_record(args, self._shapes.setdefault(names, names), tuple(kwargs.values()))
+        
+    def append_record(self, args: tuple[Any], names: tuple[str], values: tuple[Any]) -> None:
+        self._log.append_record(args, names, values)
+        if self.recorded:
+            if self._spool.marker is None: self._spool.mark()
+            self._spool.calls.append((args, names, values))
+            if len(self._spool.calls) >= self._batch_size: self.flush()
+        
+    def extend(self, args: list[tuple[Any]], names: tuple[str], values: list[tuple[Any]]) -> None:
+        self._log.extend(args, names, values)
+        if self.recorded:
+            if self._spool.marker is None: self._spool.mark()
+            self._spool.calls.extend(zip(args, repeat(names), values))
+            if len(self._spool.calls) >= self._batch_size: self.flush()
+        
+    def flush(self) -> None:
+        "Writes the pending calls to the spool directory"
+        self._spool.write()
+        
+    @property
+    def total(self) -> int: return self._log.total
+    
+    @property
+    def missing(self) -> int: return self._log.missing
+    
+    def counted(self) -> Iterator[tuple[CallRecord, int]]: return self._log.counted()
+    
+    def since(self, position: Any) -> tuple[Any, int, Iterator[CallRecord]]: return self._log.since(position)
+    
+    def __iter__(self) -> Iterator[CallRecord]: return iter(self._log)
+    
+def flush_calls() -> None:
+    "Sends the calls that copies of shared mocks in this process recorded so far back to the original mocks"
+    for log in list(_spool_logs):
+        log.flush()
+        
+def _run_and_flush(task: Callable, *args, **kwargs) -> Any:
+    try:
+        return task(*args, **kwargs)
+    finally:
+        flush_calls()
+        
+def sends_calls(task: Callable) -> Callable:
+    "Wraps `task` so that every run sends its calls of shared mocks back right away (see `flush_calls`), e.g. for tasks of a `ProcessPoolExecutor`"
+    return partial(_run_and_flush, task)
+
+# %% ../../nbs/implementation/07_call_recording.ipynb 37
+def _process_exists(pid: int) -> bool:
+    if os.name == 'nt': return True # `os.kill` can't check for existence on windows
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+class SharedCallLog:
+    "Records calls in `new_log()` and collects the calls of its copies in other processes, see `SpoolCallLog`"
+    def __init__(self, new_log: Callable[[], CallLog], batch_size: int = 1000):
+        self._new_log = new_log
+        self._batch_size = batch_size
+        
+        self._log = new_log()
+        self.recorded = self._log.recorded
+        self.sequential = self._log.sequential
+        self._collect_lock = threading.Lock()
+        import shutil, tempfile
+        from multiprocessing import util
+        self._directory = tempfile.mkdtemp(prefix='pymoq-calls-')
+        self._cleanup = weakref.finalize(self, shutil.rmtree, self._directory, ignore_errors=True)
+        util.register_after_fork(self, SharedCallLog._after_fork)
+        
+    def __reduce__(self):
+        return SpoolCallLog, (self._directory, self._new_log, self._batch_size)
+    
+    def _after_fork(self) -> None:
+        "Forked processes send their calls back, just like pickled copies"
+        self._cleanup.detach()
+        self._log = SpoolCallLog(self._directory, self._new_log, self._batch_size)
+        
+    def collect(self) -> int:
+        "Adds the calls that were sent back by copies in other processes so far. Returns the number of added calls."
+        if isinstance(self._log, SpoolCallLog): return 0 # forked copy
+        
+        import pickle
+        added = 0
+        with self._collect_lock:
+            for path in sorted(entry.path for entry in os.scandir(self._directory) if entry.name.endswith('.calls')):
+                with open(path, 'rb') as file:
+                    batch = pickle.load(file)
+                os.remove(path)
+                
+                for names, calls in groupby(batch, key=lambda call: call[1]):
+                    args, _, values = zip(*calls)
+                    self._log.extend(list(args), names, list(values))
+                added += len(batch)
+        return added
+        
+    def append(self, args: tuple[Any], kwargs: dict[str, Any]) -> None:
+        self._log.append(args, kwargs)
+        
+    def append_record(self, args: tuple[Any], names: tuple[str], values: tuple[Any]) -> None:
+        self._log.append_record(args, names, values)
+        
+    def extend(self, args: list[tuple[Any]], names: tuple[str], values: list[tuple[Any]]) -> None:
+        self._log.extend(args, names, values)
+        
+    @property
+    def pending(self) -> int:
+        "Number of other processes with copies of this call log that recorded calls which were not sent back yet"
+        if isinstance(self._log, SpoolCallLog): return 0 # forked copy
+        processes = set()
+        for entry in os.scandir(self._directory):
+            if not entry.name.endswith('.pending'): continue
+            pid = int(entry.name.split('-')[0])
+            if _process_exists(pid):
+                processes.add(pid)
+            else: # crashed without sending its calls
+                os.remove(entry.path)
+        return len(processes)
+        
+    @property
+    def total(self) -> int:
+        self.collect()
+        return self._log.total
+    
+    @property
+    def missing(self) -> int:
+        self.collect()
+        return self._log.missing
+    
+    def counted(self) -> Iterator[tuple[CallRecord, int]]:
+        self.collect()
+        return self._log.counted()
+    
+    def since(self, position: Any) -> tuple[Any, int, Iterator[CallRecord]]:
+        self.collect()
+        return self._log.since(position)
+    
+    def __iter__(self) -> Iterator[CallRecord]:
+        self.collect()
+        return iter(self._log)
+
+# %% ../../nbs/implementation/07_call_recording.ipynb 46
+def call_log(record: str|int='full', concurrent: bool=False, shared: bool=False, argument_names: tuple[str]|None = None) -> CallLog|ConcurrentCallLog|SharedCallLog:
+    "Constructs the call log for the recording policy `record`: 'full', 'counts', 'columns', 'off' or the number of most recent calls to keep. 'columns' needs the `argument_names` of the mocked function."
+    if shared:
+        call_log(record, argument_names=argument_names) # fail early on invalid policies
+        return SharedCallLog(partial(call_log, record, concurrent, argument_names=argument_names))
+    if concurrent:
+        call_log(record, argument_names=argument_names) # fail early on invalid policies
+        return ConcurrentCallLog(partial(call_log, record, argument_names=argument_names))
+    
+    match record:
+        case bool(): pass
+        case 'full': return CallLog()
+        case 'counts': return CountingCallLog()
+        case 'columns' if argument_names is not None: return ColumnarCallLog(argument_names) # see [Call queries](12_call_queries.ipynb)
+        case 'columns': raise ValueError("The 'columns' recording policy needs the parameter names of a function without *args or **kwargs")
+        case 'off': return NoCallLog()
+        case int() if record > 0: return RingCallLog(record)
+        
+    raise ValueError(f"Unknown recording policy: {record!r}. Use 'full', 'counts', 'columns', 'off' or a positive int.")
+
+# %% ../../nbs/implementation/12_call_queries.ipynb 8
+from operator import add, itemgetter
+
+from ..argument_validators import ArgumentValidator
+from ..signature_validators import _validation_function
+from . import bulk
+
+class ColumnarCallLog:
+    "Keeps every call, as one column of argument values per parameter. New calls are buffered and moved into the columns when the log is read."
+    recorded = True
+    sequential = True
+    
+    def __init__(self, argument_names: tuple[str]):
+        self.argument_names = tuple(argument_names)
+        self._positions = {name: position for position, name in enumerate(self.argument_names)}
+        self._keyword_names = [self.argument_names[n:] for n in range(len(self.argument_names) + 1)]
+        self._columns = [[] for _ in self.argument_names]
+        self._positional = [] # number of positional arguments per call
+        self._pending = [] # canonical argument lists of the calls that are not in the columns yet
+        self._arrays = {} # name -> (number of converted calls, numpy array or `None`)
+        
+    def append(self, args: tuple[Any], kwargs: dict[str, Any]) -> None:
+        "Records a call with the given (filled up) argument list"
+        self.append_record(args, (), tuple(kwargs[name] for name in self.argument_names[len(args):]))
+        
+    def append_record(self, args: tuple[Any], names: tuple[str], values: tuple[Any]) -> None:
+        "Records a call given in canonical form: `args + values` holds the values of all parameters"
+        self._pending.append(args + values)
+        self._positional.append(len(args))
+        
+    def extend(self, args: list[tuple[Any]], names: tuple[str], values: list[tuple[Any]]) -> None:
+        if not args: return
+        self._pending.extend(map(add, args, values))
+        self._positional.extend(repeat(len(args[0]), len(args)))
+        
+    def _flush(self) -> None:
+        "Moves the buffered calls into the columns"
+        pending, self._pending = self._pending, []
+        for position, column in enumerate(self._columns):
+            column.extend(map(itemgetter(position), pending))
+    
+    @property
+    def total(self) -> int: return len(self._positional)
+    
+    @property
+    def missing(self) -> int: return 0
+        
+    def column(self, name: str) -> list:
+        "The values of parameter `name` of all calls"
+        if self._pending: self._flush()
+        return self._columns[self._positions[name]]
+    
+    def array(self, name: str, np: Any) -> Any:
+        "The values of parameter `name` of all calls as numpy array, `None` if they can't be vectorized"
+        column = self.column(name)
+        converted, array = self._arrays.get(name, (0, None))
+        if converted == len(column) or (converted and array is None): return array
+        
+        new = bulk.as_array(column[converted:], np)
+        if converted and new is not None:
+            new = np.concatenate((array, new)) if new.dtype.kind == array.dtype.kind else None
+        self._arrays[name] = (len(column), new)
+        return new
+    
+    def matching_rows(self, validators: list[tuple[str, ArgumentValidator]], start: int = 0, stop: int|None = None) -> Any:
+        "Returns the indices of the calls in `[start, stop)` whose arguments are valid for `validators`, given as `(parameter name, validator)` pairs. A numpy array if numpy is installed, a list otherwise."
+        stop = self.total if stop is None else stop
+        np = bulk.numpy_or_none()
+        if np is not None:
+            return bulk.matching_rows(validators, np.arange(start, stop), lambda name: self.array(name, np), self.column, np)
+        
+        rows = range(start, stop)
+        for name, validator in validators:
+            if bulk.is_any_value(validator): continue
+            is_valid, column = _validation_function(validator), self.column(name)
+            rows = [row for row in rows if is_valid(column[row])]
+        return list(rows)
+    
+    def _records(self, start: int, stop: int) -> Iterator[CallRecord]:
+        if self._pending: self._flush()
+        calls = zip(*(islice(column, start, stop) for column in self._columns)) if self._columns else repeat((), stop - start)
+        for call, n_positional in zip(calls, islice(self._positional, start, stop)):
+            yield CallRecord(call[:n_positional], self._keyword_names[n_positional], call[n_positional:])
+    
+    def counted(self) -> Iterator[tuple[CallRecord, int]]:
+        return zip(self._records(0, self.total), repeat(1))
+    
+    def since(self, position: int) -> tuple[int, int, Iterator[CallRecord]]:
+        total = self.total
+        return total, 0, self._records(position, total)
+    
+    def __iter__(self) -> Iterator[CallRecord]:
+        return self._records(0, self.total)
\ No newline at end of file
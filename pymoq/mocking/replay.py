@@ -0,0 +1,246 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/implementation/10_record_replay.ipynb.
+
+# %% auto 0
+__all__ = ['Recorder', 'ReplayError', 'Recording', 'replay']
+
+# %% ../../nbs/implementation/10_record_replay.ipynb 2
+import inspect
+import io
+import os
+import sys
+from functools import cache, partial
+from typing import Any, Protocol
+
+from ..argument_validators import AnyArg
+from ..core import AnyCallable
+from . import objects
+from .functions import function_spec
+
+# %% ../../nbs/implementation/10_record_replay.ipynb 7
+_MAGIC = b'PYMOQ-RECORDING-1\n'
+@cache
+def _header() -> Any:
+    "Header of a record: key length, payload length. Only processes that record or replay import `struct` and `pickle`."
+    import struct
+    return struct.Struct('<II')
+
+def _normalized_arguments(signature: inspect.Signature, args: tuple[Any], kwargs: dict[str, Any]) -> tuple[Any]:
+    "The values of all parameters (except `self`) in the order of the signature, with defaults applied"
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return tuple(value for name, value in bound.arguments.items() if name != 'self')
+
+def _dumps(value: Any) -> bytes:
+    "Pickles `value` without memoization, so that equal values result in equal bytes"
+    import pickle
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.fast = True
+    pickler.dump(value)
+    return buffer.getvalue()
+
+class _Set(tuple):
+    "The elements of a set in canonical order"
+
+def _canonical(value: Any) -> Any:
+    "Replaces `value` by an equal value that always pickles to the same bytes: integral floats become ints, the items of dicts and sets are sorted"
+    kind = type(value)
+    if kind is float:
+        return int(value) if value.is_integer() else value
+    if kind is tuple or kind is list:
+        return kind(map(_canonical, value))
+    if kind is dict:
+        return dict(sorted(((_canonical(key), _canonical(item)) for key, item in value.items()), key=lambda pair: _dumps(pair[0])))
+    if kind is set or kind is frozenset:
+        return _Set(sorted(map(_canonical, value), key=_dumps))
+    return value
+
+def _record_key(method: str, arguments: tuple[Any]) -> bytes:
+    return _dumps((method, _canonical(arguments)))
+
+# %% ../../nbs/implementation/10_record_replay.ipynb 11
+class Recorder:
+    "Passes calls through to `implementation` and appends them to the recording at `path`"
+    def __init__(self, protocol: type(Protocol), implementation: Any, path: str|os.PathLike):
+        self._protocol = protocol
+        self._implementation = implementation
+        self._methods = {}
+        self.unrecorded = 0 # calls whose arguments or result can't be pickled
+        
+        self._file = open(path, 'ab')
+        if self._file.tell() == 0:
+            self._file.write(_MAGIC)
+        
+    def _write(self, key: AnyCallable[bytes], raised: bool, value: Any) -> None:
+        "Appends a record of a call that returned or raised `value`. Skips calls whose key or result can't be pickled."
+        import pickle
+        try:
+            key = key()
+            payload = pickle.dumps((raised, value), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception: # e.g. locks, generators or arguments that don't bind
+            self.unrecorded += 1
+            return
+        self._file.write(_header().pack(len(key), len(payload)) + key + payload)
+        
+    def _recording_method(self, name: str) -> Any:
+        "Wraps the method `name` of the implementation"
+        method, signature = getattr(self._implementation, name), function_spec(getattr(self._protocol, name)).signature
+        has_self = 'self' in signature.parameters
+        
+        def record(*args, **kwargs):
+            key = lambda: _record_key(name, _normalized_arguments(signature, (None,) + args if has_self else args, kwargs))
+            try:
+                result = method(*args, **kwargs)
+            except Exception as exception:
+                self._write(key, True, exception)
+                raise
+            self._write(key, False, result)
+            return result
+        return record
+        
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_') or not callable(getattr(self._protocol, name, None)):
+            return getattr(self._implementation, name)
+        if name not in self._methods:
+            self._methods[name] = self._recording_method(name)
+        return self._methods[name]
+    
+    def flush(self) -> None: self._file.flush()
+    
+    def close(self) -> None: self._file.close()
+    
+    def __enter__(self) -> "Recorder": return self
+    
+    def __exit__(self, *exc_info) -> None: self.close()
+
+# %% ../../nbs/implementation/10_record_replay.ipynb 16
+class ReplayError(LookupError):
+    "Raised when replaying a call that isn't part of the recording"
+
+_INDEX_MAGIC = b'PYMOQ-INDEX-1-' + sys.byteorder[0].encode() + b'\n' # followed by 8 byte integers in native byte order
+
+@cache
+def _key_hash_function() -> Any:
+    "Hash of record keys that is the same in every process. Only processes that replay import `hashlib`."
+    from hashlib import blake2b
+    return lambda key: int.from_bytes(blake2b(key, digest_size=8).digest(), 'little')
+
+class Recording:
+    "Memory-mapped recording file with an index file, both opened on first use"
+    def __init__(self, path: str|os.PathLike):
+        self._path = path
+        self._mmap = None
+        self._index = None # key hash and offset of all records, sorted by key hash
+        self._hashes = None # every other element of `_index`
+        self._replayed = {} # key -> number of replayed records with that key
+        
+    def _open(self) -> None:
+        import mmap
+        with open(self._path, 'rb') as file:
+            if file.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"{self._path} is not a pymoq recording")
+            size = os.fstat(file.fileno()).st_size
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size > len(_MAGIC) else b''
+        self._index = self._load_index()
+        self._hashes = self._index[::2]
+        
+    def _index_path(self) -> str: return os.fspath(self._path) + '.index'
+        
+    def _load_index(self) -> memoryview:
+        "Maps the index file if it covers the whole recording. Otherwise indexes the records that were appended since and writes the index file."
+        import mmap
+        from array import array
+        entries, indexed, size = array('Q'), len(_MAGIC), max(len(self._mmap), len(_MAGIC))
+        try:
+            with open(self._index_path(), 'rb') as file:
+                if file.read(len(_INDEX_MAGIC)) == _INDEX_MAGIC:
+                    view = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))[len(_INDEX_MAGIC):].cast('Q')
+                    if view[0] == size: return view[1:]
+                    if view[0] < size: entries, indexed = array('Q', view[1:]), view[0]
+        except (OSError, ValueError): # no (valid) index file
+            pass
+        
+        header, key_hash, appended = _header(), _key_hash_function(), []
+        offset = indexed
+        while offset + header.size <= size:
+            key_length, payload_length = header.unpack_from(self._mmap, offset)
+            if offset + header.size + key_length + payload_length > size: break # the record is still being written
+            appended.append((key_hash(self._mmap[offset + header.size:offset + header.size + key_length]), offset))
+            offset += header.size + key_length + payload_length
+        
+        if appended:
+            pairs = sorted([*zip(entries[::2], entries[1::2]), *appended])
+            entries = array('Q', [value for pair in pairs for value in pair])
+        try:
+            with open(self._index_path() + '.tmp', 'wb') as file:
+                file.write(_INDEX_MAGIC + array('Q', [offset]).tobytes() + entries.tobytes())
+            os.replace(self._index_path() + '.tmp', self._index_path())
+        except OSError: # e.g. a read-only directory, the index is only kept in memory
+            pass
+        return memoryview(entries)
+            
+    def __len__(self) -> int:
+        "Number of distinct keys (up to hash collisions)"
+        if self._index is None: self._open()
+        hashes = self._hashes
+        return sum(1 for i in range(len(hashes)) if i == 0 or hashes[i] != hashes[i - 1])
+            
+    def _records(self, key: bytes) -> list[int]:
+        "Offsets of all records with `key`, in recorded order"
+        from bisect import bisect_left
+        if self._index is None: self._open()
+        key_hash, header, records = _key_hash_function()(key), _header(), []
+        i = bisect_left(self._hashes, key_hash)
+        while i < len(self._hashes) and self._hashes[i] == key_hash:
+            offset = self._index[2 * i + 1]
+            if header.unpack_from(self._mmap, offset)[0] == len(key) and self._mmap[offset + header.size:offset + header.size + len(key)] == key:
+                records.append(offset)
+            i += 1
+        return records
+    
+    def replay(self, method: str, arguments: tuple[Any]) -> Any:
+        "Returns (or raises) the next recorded result of calling `method` with `arguments`"
+        key = _record_key(method, arguments)
+        records = self._records(key)
+        if not records:
+            raise ReplayError(f"No recorded call of {method} with arguments {arguments}")
+        
+        replayed = self._replayed.get(key, 0)
+        self._replayed[key] = replayed + 1
+        offset = records[min(replayed, len(records) - 1)]
+        import pickle
+        header = _header()
+        key_length, payload_length = header.unpack_from(self._mmap, offset)
+        start = offset + header.size + key_length
+        raised, value = pickle.loads(self._mmap[start:start + payload_length])
+        if raised: raise value
+        return value
+
+# %% ../../nbs/implementation/10_record_replay.ipynb 19
+class _Replayed:
+    "`ReturnValueGenerator` that answers calls of `method` from a recording"
+    def __init__(self, recording: Recording, method: str, function_mock: Any):
+        self._recording = recording
+        self._method = method
+        self._signature = function_mock._signature
+        self._names = None if function_mock._spec.has_var_arguments else function_mock._argument_names
+        
+    def __call__(self, *args, **kwargs) -> Any:
+        if self._names is None:
+            arguments = _normalized_arguments(self._signature, args, kwargs)
+        else: # the function mock already filled up the arguments, so they only have to be put in order
+            values = dict(zip(self._names, args))
+            values.update(kwargs)
+            arguments = tuple(values[name] for name in self._names if name != 'self')
+        return self._recording.replay(self._method, arguments)
+
+def _add_replay_setup(recording: Recording, name: str, function_mock: Any) -> None:
+    "Adds the setup that answers all calls of the method `name` from `recording`"
+    n_arguments = len(function_mock._argument_names) - function_mock._is_class_method
+    function_mock.setup(*[AnyArg() for _ in range(n_arguments)]).returns(_Replayed(recording, name, function_mock))
+
+def replay(protocol: type(Protocol), path: str|os.PathLike, **mock_kwargs) -> objects.Mock:
+    "Constructs a `Mock` of `protocol` that answers calls from the recording at `path`"
+    mock = objects.Mock(protocol, **mock_kwargs)
+    mock._configure_function_mock = partial(_add_replay_setup, Recording(path))
+    return mock
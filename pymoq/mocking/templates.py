@@ -0,0 +1,22 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/implementation/11_templates.ipynb.
+
+# %% auto 0
+__all__ = ['freeze', 'reset']
+
+# %% ../../nbs/implementation/11_templates.ipynb 6
+from .functions import FunctionMock, FunctionMockTemplate
+from .objects import Mock, MockTemplate
+
+def freeze(mock: Mock|FunctionMock) -> MockTemplate|FunctionMockTemplate:
+    "Returns a template with a snapshot of the setups of a `Mock` (and its attributes) or `FunctionMock`, see `spawn`"
+    if hasattr(mock, '_function_mocks'):
+        return MockTemplate(mock)
+    return FunctionMockTemplate(mock)
+
+def reset(mock: Mock|FunctionMock) -> None:
+    "Forgets the recorded calls of a `Mock` (of all methods) or `FunctionMock`, the setups are kept"
+    if hasattr(mock, '_function_mocks'):
+        for function_mock in list(mock._function_mocks.values()):
+            reset(function_mock)
+    else:
+        mock._call_log = mock._new_call_log()
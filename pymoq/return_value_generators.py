@@ -1,14 +1,14 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/implementation/03_return_value_generators.ipynb.
 
 # %% auto 0
-__all__ = ['ReturnValueGenerator']
+__all__ = ['ReturnValueGenerator', 'CacheInfo', 'CachedReturnValues', 'CopiedReturnValues']
 
 # %% ../nbs/implementation/03_return_value_generators.ipynb 2
 from .argument_validators import ArgumentValidator, ArgumentFunctionValidator
-from typing import Any, Protocol, runtime_checkable
-
-# %% ../nbs/implementation/03_return_value_generators.ipynb 3
-from fastcore.test import test_fail
+import copy
+import threading
+from collections import OrderedDict
+from typing import Any, NamedTuple, Protocol, runtime_checkable
 
 # %% ../nbs/implementation/03_return_value_generators.ipynb 6
 @runtime_checkable
@@ -17,3 +17,78 @@ class ReturnValueGenerator(Protocol):
     
     def __call__(self, *args, **kwargs) -> Any:
         """Gets the exact values used in the original function call. Returns a value based on that"""
+
+# %% ../nbs/implementation/03_return_value_generators.ipynb 13
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    uncached: int # calls with unhashable arguments
+    maxsize: int|None
+    currsize: int
+
+class CachedReturnValues:
+    "Memoizes the results of a `ReturnValueGenerator` per argument list, evicting the least recently used results"
+    def __init__(self, generator: ReturnValueGenerator, maxsize: int|None = 128, copy: bool = False, argument_names: tuple[str]|None = None):
+        self._generator = generator
+        self._maxsize = maxsize
+        self._copy = copy
+        self._argument_names = argument_names
+        
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._uncached = 0
+        
+    def _key(self, args: tuple[Any], kwargs: dict[str, Any]) -> tuple:
+        if self._argument_names is None or len(args) > len(self._argument_names):
+            values = args + tuple(sorted(kwargs.items()))
+        else:
+            arguments = dict(zip(self._argument_names, args))
+            arguments.update(kwargs)
+            values = tuple(arguments.get(name) for name in self._argument_names)
+        return values + tuple(map(type, values))
+        
+    def __call__(self, *args, **kwargs) -> Any:
+        key = self._key(args, kwargs)
+        try:
+            with self._lock:
+                result = self._cache[key]
+                self._cache.move_to_end(key)
+                self._hits += 1
+        except KeyError:
+            result = self._generator(*args, **kwargs)
+            with self._lock:
+                self._misses += 1
+                self._cache[key] = result
+                if self._maxsize is not None and len(self._cache) > self._maxsize:
+                    self._cache.popitem(last=False)
+        except TypeError: # unhashable arguments
+            with self._lock:
+                self._uncached += 1
+            result = self._generator(*args, **kwargs)
+        
+        return copy.deepcopy(result) if self._copy else result
+    
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._uncached, self._maxsize, len(self._cache))
+    
+    def __getstate__(self) -> dict[str, Any]:
+        return {name: value for name, value in self.__dict__.items() if name != '_lock'}
+    
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+    
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._hits = self._misses = self._uncached = 0
+
+# %% ../nbs/implementation/03_return_value_generators.ipynb 22
+class CopiedReturnValues:
+    "Returns a deep copy of every result of a `ReturnValueGenerator`"
+    def __init__(self, generator: ReturnValueGenerator):
+        self._generator = generator
+        
+    def __call__(self, *args, **kwargs) -> Any:
+        return copy.deepcopy(self._generator(*args, **kwargs))
@@ -4,9 +4,9 @@
 __all__ = ['VERBOSE', 'SignatureValidator', 'signature_validator_from_arguments']
 
 # %% ../nbs/implementation/02_signature_validators.ipynb 2
-from .argument_validators import ArgumentValidator, ArgumentFunctionValidator, argument_validator_from_argument 
+from .argument_validators import ArgumentValidator, ArgumentFunctionValidator, argument_validator_from_argument, _any_value
 from typing import Any
-from fastcore.basics import patch_to
+from .core import AnyCallable, patch_to
 from itertools import chain
 
 # %% ../nbs/implementation/02_signature_validators.ipynb 6
@@ -53,7 +53,66 @@ class SignatureValidator:
     
     def __repr__(self): return str(self)
 
-# %% ../nbs/implementation/02_signature_validators.ipynb 20
+# %% ../nbs/implementation/02_signature_validators.ipynb 21
+def _validation_function(validator: ArgumentValidator) -> AnyCallable[bool]:
+    "Returns the function that does the actual validation of `validator`"
+    if isinstance(validator, ArgumentFunctionValidator) and type(validator).is_valid is ArgumentFunctionValidator.is_valid:
+        return validator._func
+    return validator.is_valid
+
+# %% ../nbs/implementation/02_signature_validators.ipynb 22
+@patch_to(SignatureValidator)
+def compile(self) -> AnyCallable[bool]:
+    "Returns a function that is equivalent to `is_valid`, but has all validator lookups resolved in advance"
+    positional = [None] * (max(self._positional_validators, default=-1) + 1)
+    for position, validator in self._positional_validators.items():
+        positional[position] = _validation_function(validator)
+    positional = tuple(positional)
+    max_positional = min(len(positional), len(self.argument_validators))
+    
+    named = {name: _validation_function(validator) for name, validator in self._named_validators.items()}
+    
+    def matcher(*args: list[Any], **kwargs: dict[str, Any]) -> bool:
+        if len(args) > max_positional: return False
+        
+        for validate, value in zip(positional, args):
+            if validate is None or not validate(value): return False
+            
+        for name, value in kwargs.items():
+            validate = named.get(name)
+            if validate is None or not validate(value): return False
+            
+        return True
+    
+    return matcher
+
+# %% ../nbs/implementation/02_signature_validators.ipynb 27
+@patch_to(SignatureValidator)
+def by_parameter(self, argument_names: tuple[str]) -> tuple[ArgumentValidator]|None:
+    "Returns the validators in the order of `argument_names`, or `None` if the validators don't cover exactly these parameters"
+    if len(self._named_validators) != len(argument_names): return None
+    try:
+        return tuple(self._named_validators[name] for name in argument_names)
+    except KeyError:
+        return None
+
+@patch_to(SignatureValidator)
+def compile_canonical(self, argument_names: tuple[str]) -> AnyCallable[bool]:
+    "Returns a function that validates a canonical argument list: a tuple with the values of all parameters in the order of `argument_names`"
+    validators = self.by_parameter(argument_names)
+    if validators is None: # some parameter is not validated, so no call can match
+        return lambda call: False
+    checks = tuple((position, validate) for position, validate in enumerate(map(_validation_function, validators))
+                   if validate is not _any_value) # e.g. `self` of methods
+    
+    def matcher(call: tuple[Any]) -> bool:
+        for position, validate in checks:
+            if not validate(call[position]): return False
+        return True
+    
+    return matcher
+
+# %% ../nbs/implementation/02_signature_validators.ipynb 30
 VERBOSE = False
 
 def signature_validator_from_arguments(argument_names: list[str], *args, **kwargs) -> SignatureValidator: